@@ -1,7 +1,91 @@
 """BidSmart Multi-Agent Bid Writing System."""
 
-from .outline_pipeline import run_outline_pipeline
-from .content_pipeline import run_content_pipeline
-from .review_pipeline import run_review_pipeline
+import asyncio
+import os
+import sys
+from typing import Any, Coroutine, TypeVar
 
-__all__ = ["run_outline_pipeline", "run_content_pipeline", "run_review_pipeline"]
+_T = TypeVar("_T")
+
+_UVLOOP_INSTALLED = False
+
+
+def _uvloop_module():
+    """Return the uvloop module if it should be used, else ``None``.
+
+    Enabled whenever uvloop is installed (e.g. via the ``fast`` extra);
+    ``BID_AGENT_UVLOOP=0`` turns it off.  Never used on Windows.
+    """
+    if sys.platform == "win32" or os.getenv("BID_AGENT_UVLOOP", "1") == "0":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop
+
+
+def use_uvloop() -> bool:
+    """Install uvloop as the asyncio event loop policy when available.
+
+    The policy only affects loops created afterwards, so call this before
+    ``asyncio.run`` / ``uvicorn.run``.  Safe to call repeatedly.
+
+    Returns:
+        True if uvloop is installed as the event loop policy.
+    """
+    global _UVLOOP_INSTALLED
+    if _UVLOOP_INSTALLED:
+        return True
+    uvloop = _uvloop_module()
+    if uvloop is None:
+        return False
+    uvloop.install()
+    _UVLOOP_INSTALLED = True
+    return True
+
+
+def run(main: Coroutine[Any, Any, _T]) -> _T:
+    """Run ``main`` to completion on uvloop when available.
+
+    On Python 3.11+ the loop is created through ``asyncio.Runner``'s
+    ``loop_factory``, leaving the global event loop policy untouched;
+    older interpreters fall back to :func:`use_uvloop` + ``asyncio.run``.
+    """
+    uvloop = _uvloop_module()
+    if uvloop is not None and sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(main)
+    use_uvloop()
+    return asyncio.run(main)
+
+
+# Pipelines pull in agno and all tool adapters; import them on first access
+# (PEP 562) so callers that need only one pipeline don't pay for the rest.
+_LAZY_EXPORTS = {
+    "run_outline_pipeline": ".outline_pipeline",
+    "run_outline_pipeline_batch": ".outline_pipeline",
+    "run_content_pipeline": ".content_pipeline",
+    "run_review_pipeline": ".review_pipeline",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = [
+    "run_outline_pipeline",
+    "run_outline_pipeline_batch",
+    "run_content_pipeline",
+    "run_review_pipeline",
+    "run",
+    "use_uvloop",
+]
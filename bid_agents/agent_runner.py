@@ -6,13 +6,85 @@ OpenAI-compatible function calling API.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import logging
 import os
-from typing import List, Optional, Union
+import threading
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, List, Optional, Union
 
-from agno.agent import Agent
-from agno.models.deepseek import DeepSeek
-from agno.tools.function import Function
-from agno.tools.toolkit import Toolkit
+# agno has a large import graph; load it on first use rather than at import
+if TYPE_CHECKING:
+    from agno.agent import Agent
+    from agno.run.agent import RunOutput
+    from agno.tools.function import Function
+    from agno.models.deepseek import DeepSeek
+    from agno.tools.toolkit import Toolkit
+
+logger = logging.getLogger(__name__)
+
+@functools.cache
+def _model_class() -> type[DeepSeek]:
+    """Return a ``DeepSeek`` subclass that keeps one async client per event loop.
+
+    agno caches the model's ``AsyncOpenAI`` client on the instance and only
+    rebuilds it once closed, but its connection pool is bound to the loop
+    that opened it.  The shared models below are used from several loops
+    (successive ``asyncio.run`` calls, worker threads), so each running
+    loop gets its own client.
+    """
+    import httpx
+    from agno.models.deepseek import DeepSeek
+    from openai import AsyncOpenAI
+
+    # Guards each model's per-loop client table across worker threads
+    lock = threading.Lock()
+
+    class _LoopScopedDeepSeek(DeepSeek):
+        def get_async_client(self):
+            loop = asyncio.get_running_loop()
+            with lock:
+                clients = self.__dict__.setdefault("_loop_clients", {})
+                entry = clients.get(id(loop))
+                if entry is not None and entry[0] is loop and not entry[1].is_closed():
+                    return entry[1]
+                for key in [k for k, (l, _) in clients.items() if l.is_closed()]:
+                    del clients[key]
+                # Built here rather than through the base method, which reads
+                # and writes the ``async_client`` attribute every loop shares
+                params = self._get_client_params()
+                if isinstance(self.http_client, httpx.AsyncClient):
+                    params["http_client"] = self.http_client
+                client = AsyncOpenAI(**params)
+                clients[id(loop)] = (loop, client)
+                return client
+
+        def __deepcopy__(self, memo):
+            # agno's __deepcopy__ skips only its own client attributes; a
+            # copy starts without clients, like the base class.  The lock
+            # keeps the instance dict still while the base class walks it.
+            with lock:
+                clients = self.__dict__.get("_loop_clients")
+                if clients is not None:
+                    memo[id(clients)] = {}
+                return super().__deepcopy__(memo)
+
+    return _LoopScopedDeepSeek
+
+
+@functools.lru_cache(maxsize=8)
+def _get_model(model_id: str, temperature: float) -> DeepSeek:
+    """Return the process-wide ``DeepSeek`` model for these settings.
+
+    Agents on the same event loop share the model's ``AsyncOpenAI`` client
+    (and connection pool); see ``_model_class``.  agno does not mutate the
+    model during a run.
+    """
+    return _model_class()(id=model_id, temperature=temperature)
+
+
+# Called with the tool name whenever an agent starts a tool call
+ToolCallCallback = Optional[Callable[[str], Awaitable[None]]]
 
 
 def create_deepseek_agent(
@@ -37,15 +109,93 @@ def create_deepseek_agent(
     Returns:
         A ready-to-use ``Agent`` instance.  Call ``await agent.arun(msg)``
         to execute the agent loop.
+
+    Note:
+        DeepSeek caches repeated prompt prefixes automatically.  The system
+        prompt is sent verbatim as the first message (no timestamps or other
+        per-run context), so every run of the same agent type reuses the
+        cached prefix.  Keep per-section details in the user message.
     """
+    from agno.agent import Agent
+
     resolved_model = model_id or os.getenv("LLM_MODEL", "deepseek-chat")
 
     return Agent(
         name=name,
-        model=DeepSeek(id=resolved_model, temperature=temperature),
+        model=_get_model(resolved_model, temperature),
         system_message=system_prompt,
         tools=tools,
         tool_call_limit=tool_call_limit,
         markdown=False,
         num_history_runs=0,
+        # Keep the system message byte-stable so DeepSeek's prefix cache hits
+        add_datetime_to_context=False,
+    )
+
+
+def log_prompt_cache_usage(agent: Agent, run_output: Any) -> None:
+    """Log DeepSeek prompt-cache hit/miss tokens for a finished agent run.
+
+    Args:
+        agent: The agent that produced ``run_output``.
+        run_output: Return value of ``agent.arun``.
+    """
+    metrics = getattr(run_output, "metrics", None)
+    if metrics is None:
+        return
+    input_tokens = getattr(metrics, "input_tokens", 0) or 0
+    hit_tokens = getattr(metrics, "cache_read_tokens", 0) or 0
+    logger.info(
+        "Agent %s prompt cache: %d hit / %d miss tokens",
+        agent.name,
+        hit_tokens,
+        max(input_tokens - hit_tokens, 0),
     )
+
+
+async def run_agent_streaming(
+    agent: Agent,
+    message: str,
+    on_tool_call: ToolCallCallback = None,
+) -> Optional[RunOutput]:
+    """Run ``agent`` on ``message`` in streaming mode.
+
+    Events are consumed as they arrive so ``on_tool_call`` fires when each
+    tool call starts instead of after the whole run.  Content chunks are
+    discarded; the final ``RunOutput`` is returned.
+
+    Args:
+        agent: The agent to run.
+        message: User message for this run.
+        on_tool_call: ``async (tool_name) -> None`` invoked per tool call.
+
+    Returns:
+        The final ``RunOutput`` (also logged via ``log_prompt_cache_usage``).
+    """
+    from agno.run.agent import RunOutput
+
+    run_output: Optional[RunOutput] = None
+    async for event in agent.arun(
+        message, stream=True, stream_events=True, yield_run_output=True
+    ):
+        if isinstance(event, RunOutput):
+            run_output = event
+        elif on_tool_call and getattr(event, "event", None) == "ToolCallStarted":
+            tool = getattr(event, "tool", None)
+            await on_tool_call(getattr(tool, "tool_name", None) or "")
+
+    log_prompt_cache_usage(agent, run_output)
+    return run_output
+
+
+def tool_call_progress(
+    progress_callback: Optional[Callable[[str, str], Awaitable[None]]],
+) -> ToolCallCallback:
+    """Adapt an ``async (phase, message)`` progress callback to tool calls."""
+    if progress_callback is None:
+        return None
+
+    async def _on_tool_call(tool_name: str) -> None:
+        await progress_callback("tool_call", f"调用工具: {tool_name}")
+
+    return _on_tool_call
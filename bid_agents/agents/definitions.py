@@ -6,6 +6,8 @@ This module defines all agents using agno-compatible configuration.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
 from typing import Literal
 
 from ..config import (
@@ -17,19 +19,7 @@ from ..config import (
     REVIEWER_MODEL,
     WRITER_MODEL,
 )
-from .prompts import (
-    commercial_writer,
-    compliance_checker,
-    document_finder,
-    format_extractor,
-    formatting_agent,
-    mermaid_generator,
-    outline_planner,
-    pricing_calculator,
-    review_agent,
-    technical_writer,
-    tender_analyzer,
-)
+from .prompts import prompt_path
 
 
 @dataclass
@@ -38,24 +28,31 @@ class AgentDefinition:
     
     Attributes:
         description: Human-readable description of what the agent does.
-        prompt: The system prompt that controls agent behavior.
+        prompt_path: Markdown file holding the system prompt; read on first
+            access to ``prompt``.
         tools: List of tool function names available to the agent.
         model: The model to use for this agent.
     """
     description: str
-    prompt: str
+    prompt_path: Path
     tools: list[str]
     model: Literal["opus", "sonnet", "haiku"] | str
 
+    @cached_property
+    def prompt(self) -> str:
+        """The system prompt that controls agent behavior."""
+        return self.prompt_path.read_text(encoding="utf-8")
+
 
 ALL_AGENTS: dict[str, AgentDefinition] = {
     # ── Phase -1: Tender Document Analysis ───────────────────────────
     "tender-analyzer": AgentDefinition(
         description="深度分析招标文件，提取评分标准、资格要求、技术需求等关键信息，生成结构化分析报告",
-        prompt=tender_analyzer.SYSTEM_PROMPT,
+        prompt_path=prompt_path("tender_analyzer"),
         tools=[
             "get_tender_tree",
             "query_tender_requirements",
+            "batch_query_tender_requirements",
             "save_analysis_report",
             "validate_scoring_criteria",
             "extract_key_data",
@@ -65,7 +62,7 @@ ALL_AGENTS: dict[str, AgentDefinition] = {
     # ── Phase 0: Format Extraction ──────────────────────────────────
     "format-extractor": AgentDefinition(
         description="识别招标文件中的投标格式要求，提取投标文件编排规范",
-        prompt=format_extractor.SYSTEM_PROMPT,
+        prompt_path=prompt_path("format_extractor"),
         tools=[
             "query_tender_requirements",
             "get_tender_tree",
@@ -76,7 +73,7 @@ ALL_AGENTS: dict[str, AgentDefinition] = {
     # ── Phase 1: Outline Planning ───────────────────────────────────
     "outline-planner": AgentDefinition(
         description="分析招标文档结构，生成投标文件大纲",
-        prompt=outline_planner.SYSTEM_PROMPT,
+        prompt_path=prompt_path("outline_planner"),
         tools=[
             "query_tender_requirements",
             "get_tender_tree",
@@ -87,7 +84,7 @@ ALL_AGENTS: dict[str, AgentDefinition] = {
     # ── Phase 2: Document Gathering ─────────────────────────────────
     "document-finder": AgentDefinition(
         description="查找公司资质文件、执照、合同、业绩扫描件",
-        prompt=document_finder.SYSTEM_PROMPT,
+        prompt_path=prompt_path("document_finder"),
         tools=[
             "search_documents",
             "get_document_metadata",
@@ -99,7 +96,7 @@ ALL_AGENTS: dict[str, AgentDefinition] = {
     # ── Phase 3: Content Writing ────────────────────────────────────
     "commercial-bid-writer": AgentDefinition(
         description="编写商务标书：投标函、商务条款、偏离表、服务承诺",
-        prompt=commercial_writer.SYSTEM_PROMPT,
+        prompt_path=prompt_path("commercial_writer"),
         tools=[
             "query_tender_requirements",
             "save_section_content",
@@ -112,7 +109,7 @@ ALL_AGENTS: dict[str, AgentDefinition] = {
     ),
     "technical-bid-writer": AgentDefinition(
         description="编写技术标书：技术方案、实施计划、团队配置、风险管理",
-        prompt=technical_writer.SYSTEM_PROMPT,
+        prompt_path=prompt_path("technical_writer"),
         tools=[
             "query_tender_requirements",
             "save_section_content",
@@ -125,7 +122,7 @@ ALL_AGENTS: dict[str, AgentDefinition] = {
     ),
     "pricing-calculator": AgentDefinition(
         description="计算和生成报价表、分项报价、税费",
-        prompt=pricing_calculator.SYSTEM_PROMPT,
+        prompt_path=prompt_path("pricing_calculator"),
         tools=[
             "query_tender_requirements",
             "get_pricing_templates",
@@ -139,7 +136,7 @@ ALL_AGENTS: dict[str, AgentDefinition] = {
     # ── Phase 4: Review ─────────────────────────────────────────────
     "review-agent": AgentDefinition(
         description="审核投标文件质量、一致性和完整性",
-        prompt=review_agent.SYSTEM_PROMPT,
+        prompt_path=prompt_path("review_agent"),
         tools=[
             "query_tender_requirements",
             "get_section_content",
@@ -150,18 +147,19 @@ ALL_AGENTS: dict[str, AgentDefinition] = {
     ),
     "compliance-checker": AgentDefinition(
         description="检查投标文件对招标要求的合规性，生成合规矩阵",
-        prompt=compliance_checker.SYSTEM_PROMPT,
+        prompt_path=prompt_path("compliance_checker"),
         tools=[
             "query_tender_requirements",
             "get_all_sections",
             "get_compliance_checklist",
+            "get_review_context",
         ],
         model=COMPLIANCE_MODEL,
     ),
     # ── Utility: Diagram Generation ─────────────────────────────────
     "mermaid-generator": AgentDefinition(
         description="将投标文件中的文字描述转换为Mermaid流程图、架构图等",
-        prompt=mermaid_generator.SYSTEM_PROMPT,
+        prompt_path=prompt_path("mermaid_generator"),
         tools=[
             "get_section_content",
             "save_section_content",
@@ -171,7 +169,7 @@ ALL_AGENTS: dict[str, AgentDefinition] = {
     # ── Phase 6: Formatting & Export ────────────────────────────────
     "formatting-agent": AgentDefinition(
         description="格式化投标文件，规范编号、目录和排版",
-        prompt=formatting_agent.SYSTEM_PROMPT,
+        prompt_path=prompt_path("formatting_agent"),
         tools=[
             "get_all_sections",
             "save_section_content",
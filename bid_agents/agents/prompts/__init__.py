@@ -1,3 +1,24 @@
-"""Agent system prompts for the BidSmart multi-agent system."""
+"""Agent system prompts for the BidSmart multi-agent system.
 
-from . import tender_analyzer
+Each prompt lives in a sibling ``<agent>.md`` file and is read from disk the
+first time it is requested, so only the agents a process actually runs keep
+their prompt in memory.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+
+PROMPTS_DIR = Path(__file__).parent
+
+
+def prompt_path(name: str) -> Path:
+    """Return the path of the prompt file for ``name`` (e.g. ``"review_agent"``)."""
+    return PROMPTS_DIR / f"{name}.md"
+
+
+@lru_cache(maxsize=None)
+def load_prompt(name: str) -> str:
+    """Read and cache the system prompt for ``name``."""
+    return prompt_path(name).read_text(encoding="utf-8")
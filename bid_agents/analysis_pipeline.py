@@ -15,25 +15,33 @@ Usage (from FastAPI backend)::
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Awaitable, Callable, Optional
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
 
-from .agent_runner import create_deepseek_agent
-from .agents.prompts import tender_analyzer
+from .agent_runner import create_deepseek_agent, run_agent_streaming, tool_call_progress
+from .agents.prompts import load_prompt
 from .api.client import BidSmartAPIClient
+from .config import ANALYZER_TOOL_LIMIT
+from .progress import with_queued_progress
 from .state.project_state import BidProjectState
 from .tool_adapters import build_tender_analyzer_tools
 
+if TYPE_CHECKING:
+    from agno.agent import Agent
+
 logger = logging.getLogger(__name__)
 
 # Type alias for the progress callback
 ProgressCallback = Optional[Callable[[str, str], Awaitable[None]]]
 
 
+@with_queued_progress
 async def run_analysis_pipeline(
     project_id: str,
     api_url: str,
     progress_callback: ProgressCallback = None,
+    state: BidProjectState | None = None,
 ) -> dict:
     """Run tender-analyzer pipeline, return analysis report.
 
@@ -43,6 +51,9 @@ async def run_analysis_pipeline(
         api_url: Base URL of the BidSmart backend (e.g. ``http://localhost:8003``).
         progress_callback: ``async (phase, message) -> None`` called when the
             pipeline transitions between phases.
+        state: Already loaded project state to work on (e.g. shared
+            between phases of a larger workflow).  Loaded from the backend
+            when omitted.
 
     Returns:
         Analysis report dict containing structured information about the
@@ -53,31 +64,31 @@ async def run_analysis_pipeline(
         Exception: On unrecoverable errors (API unreachable, LLM failures, etc.).
     """
     # 1. Initialize shared state + API client
-    api_client = BidSmartAPIClient(api_url)
-    state = BidProjectState()
+    api_client = BidSmartAPIClient.shared(api_url)
+    needs_load = state is None
+    if needs_load:
+        state = BidProjectState()
 
     try:
-        await state.load_from_backend(api_client, project_id)
-
-        # 2. Build tools (closures over shared state)
-        analysis_tools = build_tender_analyzer_tools(state, api_client)
+        # 2. Build tools + agent (closures over shared state) while the
+        #    project loads; neither needs project data up front.
+        build_agent = asyncio.to_thread(_build_analyzer_agent, state, api_client)
+        if needs_load:
+            _, analyzer_agent = await asyncio.gather(
+                state.load_from_backend(api_client, project_id), build_agent
+            )
+        else:
+            analyzer_agent = await build_agent
 
         # 3. Run tender analysis
         if progress_callback:
             await progress_callback("analysis", "正在深度分析招标文件...")
 
-        analyzer_agent = create_deepseek_agent(
-            name="tender-analyzer",
-            system_prompt=tender_analyzer.SYSTEM_PROMPT,
-            tools=analysis_tools,
-            tool_call_limit=20,  # Analysis requires more tool calls
-        )
-
         analysis_instruction = (
             f"请深度分析项目 {project_id} 的招标文档。\n\n"
             f"工作流程：\n"
             f"1. 首先调用 get_tender_tree 获取完整目录结构\n"
-            f"2. 基于TOC定位并分析以下关键章节（优先级顺序）：\n"
+            f"2. 基于TOC定位并分析以下关键章节（优先级顺序，可用 batch_query_tender_requirements 一次并发查询）：\n"
             f"   - 评分标准和评审细则\n"
             f"   - 供应商须知附表（份数、密封、付款、交付期）\n"
             f"   - 资格要求（一般+特定+负面清单）\n"
@@ -93,7 +104,9 @@ async def run_analysis_pipeline(
         )
 
         logger.info("Starting tender-analyzer for project %s", project_id)
-        await analyzer_agent.arun(analysis_instruction)
+        await run_agent_streaming(
+            analyzer_agent, analysis_instruction, tool_call_progress(progress_callback)
+        )
         
         if state.analysis_report:
             logger.info(
@@ -111,3 +124,13 @@ async def run_analysis_pipeline(
     except Exception:
         logger.exception("Analysis pipeline failed for project %s", project_id)
         raise
+
+
+def _build_analyzer_agent(state: BidProjectState, api_client: BidSmartAPIClient) -> Agent:
+    """Build the tender-analyzer agent with tools bound to ``state``."""
+    return create_deepseek_agent(
+        name="tender-analyzer",
+        system_prompt=load_prompt("tender_analyzer"),
+        tools=[build_tender_analyzer_tools(state, api_client)],
+        tool_call_limit=ANALYZER_TOOL_LIMIT,  # Analysis requires more tool calls
+    )
@@ -1,3 +1,3 @@
-from .client import BidSmartAPIClient
+from .client import BidSmartAPIClient, close_shared_clients
 
-__all__ = ["BidSmartAPIClient"]
+__all__ = ["BidSmartAPIClient", "close_shared_clients"]
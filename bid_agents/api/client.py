@@ -5,8 +5,46 @@ Wraps the same endpoints used by the frontend (projectService.ts + apiService.ts
 
 from __future__ import annotations
 
+import asyncio
+import json
+
 import httpx
 
+from ..config import HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Connection pool shared by every request a client makes.  Agent loops fire
+# many small tool calls against the same backend, so keep connections alive.
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+    max_connections=HTTP_MAX_CONNECTIONS,
+    keepalive_expiry=60.0,
+)
+
+
+def _dump_json(data: object) -> bytes:
+    """Encode a request body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _load_json(r: httpx.Response) -> object:
+    """Decode a response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(r.content)
+    return r.json()
+
+
+# (id(event loop), base_url, token) -> client returned by
+# BidSmartAPIClient.shared().  httpx pools are bound to the loop that opened
+# their connections, so each running loop gets its own client.
+_SHARED_CLIENTS: dict[tuple[int, str, str | None], BidSmartAPIClient] = {}
+
 
 class BidSmartAPIClient:
     """Async HTTP client for all BidSmart backend interactions."""
@@ -15,46 +53,79 @@ class BidSmartAPIClient:
         headers: dict[str, str] = {"Content-Type": "application/json"}
         if token:
             headers["Authorization"] = f"Bearer {token}"
+        self._shared = False
+        # Event loop a shared client belongs to (see shared())
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._client = httpx.AsyncClient(
             base_url=base_url,
             headers=headers,
             timeout=timeout,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=_POOL_LIMITS,
+                retries=2,
+            ),
         )
 
+    @classmethod
+    def shared(cls, base_url: str, token: str | None = None) -> BidSmartAPIClient:
+        """Return the client for ``(base_url, token)`` on the running event loop.
+
+        The shared client keeps its connection pool between pipeline runs on
+        the same loop; ``close()`` is a no-op on it.  A new loop (another
+        ``asyncio.run``, a worker thread) gets its own client, and clients
+        of loops that have closed are dropped.  Use ``close_shared_clients()``
+        on application shutdown.  Must be called from a coroutine.
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), base_url, token)
+        client = _SHARED_CLIENTS.get(key)
+        # The loop check guards against id() reuse by a later loop
+        if client is None or client._loop is not loop or client._client.is_closed:
+            for stale_key in [k for k, c in _SHARED_CLIENTS.items() if c._loop.is_closed()]:
+                del _SHARED_CLIENTS[stale_key]
+            client = cls(base_url, token)
+            client._shared = True
+            client._loop = loop
+            _SHARED_CLIENTS[key] = client
+        return client
+
     async def close(self) -> None:
+        if self._shared:
+            return
         await self._client.aclose()
 
     # ── Project CRUD (projectService.ts) ────────────────────────────
 
     async def create_project(self, data: dict) -> dict:
         """POST /api/bid/projects"""
-        r = await self._client.post("/api/bid/projects", json=data)
+        r = await self._client.post("/api/bid/projects", content=_dump_json(data))
         r.raise_for_status()
-        return r.json()
+        return _load_json(r)
 
     async def get_project(self, project_id: str) -> dict:
         """GET /api/bid/projects/{id}"""
         r = await self._client.get(f"/api/bid/projects/{project_id}")
         r.raise_for_status()
-        return r.json()
+        return _load_json(r)
 
     async def list_projects(self) -> dict:
         """GET /api/bid/projects"""
         r = await self._client.get("/api/bid/projects")
         r.raise_for_status()
-        return r.json()
+        return _load_json(r)
 
     async def update_project(self, project_id: str, data: dict) -> dict:
         """PUT /api/bid/projects/{id}"""
-        r = await self._client.put(f"/api/bid/projects/{project_id}", json=data)
+        r = await self._client.put(f"/api/bid/projects/{project_id}", content=_dump_json(data))
         r.raise_for_status()
-        return r.json()
+        return _load_json(r)
 
     async def delete_project(self, project_id: str) -> dict:
         """DELETE /api/bid/projects/{id}"""
         r = await self._client.delete(f"/api/bid/projects/{project_id}")
         r.raise_for_status()
-        return r.json()
+        return _load_json(r)
 
     # ── Section Auto-save ───────────────────────────────────────────
 
@@ -64,24 +135,44 @@ class BidSmartAPIClient:
         """POST /api/bid/projects/{id}/sections/{sectionId}/auto-save"""
         r = await self._client.post(
             f"/api/bid/projects/{project_id}/sections/{section_id}/auto-save",
-            json={"content": content},
+            content=_dump_json({"content": content}),
+        )
+        r.raise_for_status()
+        return _load_json(r)
+
+    async def auto_save_sections_bulk(self, project_id: str, sections: list[dict]) -> dict:
+        """POST /api/bid/projects/{id}/sections/bulk-auto-save
+
+        ``sections`` items are ``{"section_id": ..., "content": ...}``.  If the
+        backend has no bulk endpoint (404), falls back to concurrent
+        per-section auto-saves.
+        """
+        r = await self._client.post(
+            f"/api/bid/projects/{project_id}/sections/bulk-auto-save",
+            content=_dump_json({"sections": sections}),
         )
+        if r.status_code == 404:
+            results = await asyncio.gather(*(
+                self.auto_save_section(project_id, s["section_id"], s["content"])
+                for s in sections
+            ))
+            return {"sections": list(results)}
         r.raise_for_status()
-        return r.json()
+        return _load_json(r)
 
     # ── Content Generation ──────────────────────────────────────────
 
     async def generate_bid_content(self, params: dict) -> dict:
         """POST /api/bid/content/generate"""
-        r = await self._client.post("/api/bid/content/generate", json=params)
+        r = await self._client.post("/api/bid/content/generate", content=_dump_json(params))
         r.raise_for_status()
-        return r.json()
+        return _load_json(r)
 
     async def rewrite_bid_text(self, params: dict) -> dict:
         """POST /api/bid/content/rewrite"""
-        r = await self._client.post("/api/bid/content/rewrite", json=params)
+        r = await self._client.post("/api/bid/content/rewrite", content=_dump_json(params))
         r.raise_for_status()
-        return r.json()
+        return _load_json(r)
 
     # ── Export ──────────────────────────────────────────────────────
 
@@ -89,7 +180,7 @@ class BidSmartAPIClient:
         """POST /api/bid/projects/{id}/export — returns binary blob."""
         r = await self._client.post(
             f"/api/bid/projects/{project_id}/export",
-            json=config,
+            content=_dump_json(config),
         )
         r.raise_for_status()
         return r.content
@@ -103,19 +194,19 @@ class BidSmartAPIClient:
             params["parse_status"] = status
         r = await self._client.get("/api/documents/", params=params)
         r.raise_for_status()
-        return r.json()
+        return _load_json(r)
 
     async def get_document(self, doc_id: str) -> dict:
         """GET /api/documents/{id}"""
         r = await self._client.get(f"/api/documents/{doc_id}")
         r.raise_for_status()
-        return r.json()
+        return _load_json(r)
 
     async def get_document_tree(self, doc_id: str) -> dict:
         """GET /api/documents/{id}/tree"""
         r = await self._client.get(f"/api/documents/{doc_id}/tree")
         r.raise_for_status()
-        return r.json()
+        return _load_json(r)
 
     # ── Chat / AI (apiService.ts) ───────────────────────────────────
 
@@ -134,9 +225,9 @@ class BidSmartAPIClient:
         }
         if document_id:
             payload["document_id"] = document_id
-        r = await self._client.post("/api/chat", json=payload, timeout=120.0)
+        r = await self._client.post("/api/chat", content=_dump_json(payload), timeout=120.0)
         r.raise_for_status()
-        return r.json()
+        return _load_json(r)
 
     # ── Health ──────────────────────────────────────────────────────
 
@@ -147,4 +238,19 @@ class BidSmartAPIClient:
             params["provider"] = ",".join(providers)
         r = await self._client.get("/api/provider-health", params=params)
         r.raise_for_status()
-        return r.json()
+        return _load_json(r)
+
+
+async def close_shared_clients() -> None:
+    """Close the shared clients of the running event loop.
+
+    Clients of loops that have already closed are dropped too; those of
+    other live loops (worker threads) are left to their own loop.
+    """
+    loop = asyncio.get_running_loop()
+    for key, client in list(_SHARED_CLIENTS.items()):
+        if client._loop is loop:
+            del _SHARED_CLIENTS[key]
+            await client._client.aclose()
+        elif client._loop.is_closed():
+            del _SHARED_CLIENTS[key]
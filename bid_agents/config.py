@@ -27,6 +27,29 @@ COMPANY_DATA_DIR = BASE_DIR / "company_data"
 MAX_BUDGET_USD = float(os.getenv("BID_AGENT_MAX_BUDGET", "5.0"))
 MAX_TURNS = int(os.getenv("BID_AGENT_MAX_TURNS", "100"))
 
+# Concurrency
+MAX_WRITER_CONCURRENCY = int(os.getenv("BID_AGENT_MAX_WRITER_CONCURRENCY", "4"))
+MAX_PROJECT_CONCURRENCY = int(os.getenv("BID_AGENT_MAX_PROJECT_CONCURRENCY", "8"))
+
+# Agent tool-call budgets (per run)
+FORMAT_EXTRACTOR_TOOL_LIMIT = int(os.getenv("BID_AGENT_FORMAT_TOOL_LIMIT", "8"))
+OUTLINE_PLANNER_TOOL_LIMIT = int(os.getenv("BID_AGENT_OUTLINE_TOOL_LIMIT", "10"))
+ANALYZER_TOOL_LIMIT = int(os.getenv("BID_AGENT_ANALYZER_TOOL_LIMIT", "20"))
+DOCUMENT_SET_ANALYZER_TOOL_LIMIT = int(os.getenv("BID_AGENT_DOCSET_ANALYZER_TOOL_LIMIT", "25"))
+WRITER_TOOL_LIMIT = int(os.getenv("BID_AGENT_WRITER_TOOL_LIMIT", "20"))
+REVIEW_TOOL_LIMIT = int(os.getenv("BID_AGENT_REVIEW_TOOL_LIMIT", "25"))
+COMPLIANCE_TOOL_LIMIT = int(os.getenv("BID_AGENT_COMPLIANCE_TOOL_LIMIT", "20"))
+
+# Backend HTTP connection pool (per BidSmartAPIClient)
+HTTP_MAX_CONNECTIONS = int(os.getenv("BID_AGENT_HTTP_MAX_CONNECTIONS", "128"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("BID_AGENT_HTTP_MAX_KEEPALIVE", "64"))
+
+# Tender query cache (seconds a semantic-search answer is reused)
+TENDER_QUERY_CACHE_TTL = float(os.getenv("BID_AGENT_TENDER_QUERY_TTL", "30"))
+
+# Read-only document tool cache (seconds a result is reused within a run)
+ACTION_CACHE_TTL = float(os.getenv("BID_AGENT_ACTION_CACHE_TTL", "600"))
+
 # Content Validation
 MIN_SECTION_CONTENT_LENGTH = 50
 MAX_REVISION_ROUNDS = 2
@@ -1,8 +1,10 @@
 """Content writing pipeline: classify sections → dispatch to writers.
 
 Runs the appropriate writer agent (commercial / technical / pricing) for
-each section based on its title and description.  Sections are written
-sequentially so that later sections can reference earlier content.
+each section based on its title and description.  Independent sections are
+written concurrently (bounded by ``max_concurrency``); sections that
+reference or summarise other sections are written afterwards, one at a
+time, so they can see the completed content.
 
 Usage (from FastAPI backend)::
 
@@ -16,14 +18,23 @@ Usage (from FastAPI backend)::
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
-from typing import Awaitable, Callable, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
 
-from .agent_runner import create_deepseek_agent
-from .agents.prompts import commercial_writer, technical_writer, pricing_calculator
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+from .agent_runner import create_deepseek_agent, run_agent_streaming
+from .agents.prompts import load_prompt
 from .api.client import BidSmartAPIClient
+from .config import MAX_WRITER_CONCURRENCY, WRITER_TOOL_LIMIT
 from .outline_pipeline import _load_env
+from .progress import with_queued_progress
 from .state.project_state import BidProjectState
 from .tool_adapters import (
     build_commercial_writer_tools,
@@ -31,42 +42,95 @@ from .tool_adapters import (
     build_pricing_calculator_tools,
 )
 
+if TYPE_CHECKING:
+    from agno.agent import Agent
+
 logger = logging.getLogger(__name__)
 
 ProgressCallback = Optional[Callable[[str, str, int, int], Awaitable[None]]]
 
 # ── Section classification ───────────────────────────────────────────────────
 
-# Keywords that indicate each section type
-_COMMERCIAL_KEYWORDS = [
+# Keywords that indicate each section type (immutable; scanned on every section)
+_COMMERCIAL_KEYWORDS = (
     "投标函", "授权委托", "法人", "商务", "偏离表", "承诺", "保证金",
     "付款", "服务承诺", "售后", "质保", "响应", "资质", "业绩", "证明",
     "企业", "执照", "证书",
-]
+)
 
-_PRICING_KEYWORDS = [
+_PRICING_KEYWORDS = (
     "报价", "价格", "费用", "预算", "成本", "定价", "金额",
     "分项报价", "总价", "单价",
-]
+)
 
-_TECHNICAL_KEYWORDS = [
+_TECHNICAL_KEYWORDS = (
     "技术", "方案", "架构", "设计", "实施", "部署", "集成",
     "团队", "人员", "培训", "测试", "质量", "风险", "进度", "计划",
     "功能", "系统", "平台", "网络", "安全", "运维", "开发",
-]
+)
+
+
+# Keywords that indicate a section depends on the content of other sections
+_SEQUENTIAL_KEYWORDS = (
+    "引用", "汇总", "偏离表", "总结", "综述", "索引",
+)
+
 
+def _build_keyword_automaton():
+    """Compile all classification keywords into one Aho-Corasick automaton.
 
+    Each keyword maps to ``(index, category)`` so a single scan can count
+    distinct keyword hits per category.  Returns ``None`` when
+    ``pyahocorasick`` is not installed.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    index = 0
+    for category, keywords in (
+        ("pricing", _PRICING_KEYWORDS),
+        ("commercial", _COMMERCIAL_KEYWORDS),
+        ("technical", _TECHNICAL_KEYWORDS),
+    ):
+        for kw in keywords:
+            automaton.add_word(kw, (index, category))
+            index += 1
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _score_keywords(text: str) -> tuple[int, int, int]:
+    """Count distinct (pricing, commercial, technical) keywords in ``text``."""
+    if _KEYWORD_AUTOMATON is None:
+        return (
+            sum(1 for kw in _PRICING_KEYWORDS if kw in text),
+            sum(1 for kw in _COMMERCIAL_KEYWORDS if kw in text),
+            sum(1 for kw in _TECHNICAL_KEYWORDS if kw in text),
+        )
+
+    scores = {"pricing": 0, "commercial": 0, "technical": 0}
+    for _, category in {value for _, value in _KEYWORD_AUTOMATON.iter(text)}:
+        scores[category] += 1
+    return scores["pricing"], scores["commercial"], scores["technical"]
+
+
+@lru_cache(maxsize=4096)
 def classify_section(title: str, description: str = "") -> str:
     """Classify a section as 'commercial', 'technical', or 'pricing'.
 
+    Results are memoized: outlines reuse the same standard section titles
+    across projects and pipeline runs.
+
     Returns:
         One of: "commercial", "technical", "pricing"
     """
-    text = (title + " " + description).lower()
+    # Keywords are all CJK, so no case folding is needed.
+    text = title + " " + description
 
-    pricing_score = sum(1 for kw in _PRICING_KEYWORDS if kw in text)
-    commercial_score = sum(1 for kw in _COMMERCIAL_KEYWORDS if kw in text)
-    technical_score = sum(1 for kw in _TECHNICAL_KEYWORDS if kw in text)
+    pricing_score, commercial_score, technical_score = _score_keywords(text)
 
     if pricing_score > 0 and pricing_score >= commercial_score and pricing_score >= technical_score:
         return "pricing"
@@ -75,13 +139,23 @@ def classify_section(title: str, description: str = "") -> str:
     return "technical"
 
 
+def is_parallel_safe(title: str, description: str = "") -> bool:
+    """Return True if a section can be written without seeing other sections."""
+    text = title + " " + description
+    return not any(kw in text for kw in _SEQUENTIAL_KEYWORDS)
+
+
 # ── Pipeline ─────────────────────────────────────────────────────────────────
 
+@with_queued_progress
 async def run_content_pipeline(
     project_id: str,
     api_url: str,
     section_ids: list[str] | None = None,
     progress_callback: ProgressCallback = None,
+    max_concurrency: int = MAX_WRITER_CONCURRENCY,
+    bulk_save: bool = True,
+    state: BidProjectState | None = None,
 ) -> dict:
     """Run content writing agents for specified (or all pending) sections.
 
@@ -91,39 +165,62 @@ async def run_content_pipeline(
         section_ids: Specific section IDs to write.  If ``None``, writes
             all sections with status ``pending``.
         progress_callback: ``async (phase, message, current, total) -> None``
+        max_concurrency: Maximum number of independent sections written at
+            the same time.
+        bulk_save: Collect section saves and send them in one bulk request
+            at the end instead of one auto-save request per section.
+        state: Already loaded project state to write into (loaded from the
+            backend when omitted).  Its ``defer_auto_save`` follows
+            ``bulk_save`` during the run and is restored afterwards.
 
     Returns:
         Dict with ``written`` (count), ``failed`` (list), and ``sections`` (all).
     """
     _load_env()
 
-    api_client = BidSmartAPIClient(api_url)
-    state = BidProjectState()
+    api_client = BidSmartAPIClient.shared(api_url)
+    needs_load = state is None
+    if needs_load:
+        state = BidProjectState()
+    previous_defer = state.defer_auto_save
+    state.defer_auto_save = bulk_save
     written = 0
     failed: list[dict] = []
 
     try:
-        await state.load_from_backend(api_client, project_id)
+        # Agent construction does not need project data (tool closures read
+        # state lazily), so build the agents and read the company data the
+        # writers use while the project is loading.
+        build_agents = asyncio.to_thread(_build_writer_agents, state, api_client)
+        if needs_load:
+            _, agents, _ = await asyncio.gather(
+                state.load_from_backend(api_client, project_id),
+                build_agents,
+                state.preload_company_data(),
+            )
+        else:
+            agents, _ = await asyncio.gather(build_agents, state.preload_company_data())
 
         # Determine which sections to write
+        sections_sorted = state.get_all_sections_sorted()
         if section_ids:
-            targets = [s for s in state.get_all_sections_sorted() if s["id"] in section_ids]
+            wanted = set(section_ids)
+            targets = [s for s in sections_sorted if s["id"] in wanted]
         else:
-            targets = [s for s in state.get_all_sections_sorted() if s.get("status") == "pending"]
+            targets = [s for s in sections_sorted if s.get("status") == "pending"]
 
         if not targets:
             logger.info("No sections to write for project %s", project_id)
-            return {"written": 0, "failed": [], "sections": state.get_all_sections_sorted()}
+            return {"written": 0, "failed": [], "sections": sections_sorted}
 
         total = len(targets)
         logger.info("Writing %d sections for project %s", total, project_id)
 
-        # Build all tool sets (closures share state)
-        commercial_tools = build_commercial_writer_tools(state, api_client)
-        technical_tools = build_technical_writer_tools(state, api_client)
-        pricing_tools = build_pricing_calculator_tools(state, api_client)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        lock = asyncio.Lock()
 
-        for idx, section in enumerate(targets):
+        async def _run_one(idx: int, section: dict) -> None:
+            nonlocal written
             section_id = section["id"]
             section_title = section.get("title", section_id)
             section_desc = section.get("summary", "")
@@ -131,46 +228,65 @@ async def run_content_pipeline(
             # Classify section
             writer_type = classify_section(section_title, section_desc)
 
-            if progress_callback:
-                await progress_callback(
-                    f"writing_{writer_type}",
-                    f"正在编写: {section_title}",
-                    idx + 1,
-                    total,
+            async with semaphore:
+                if progress_callback:
+                    await progress_callback(
+                        f"writing_{writer_type}",
+                        f"正在编写: {section_title}",
+                        idx + 1,
+                        total,
+                    )
+
+                logger.info(
+                    "[%d/%d] Writing section '%s' (type=%s, id=%s)",
+                    idx + 1, total, section_title, writer_type, section_id,
                 )
 
-            logger.info(
-                "[%d/%d] Writing section '%s' (type=%s, id=%s)",
-                idx + 1, total, section_title, writer_type, section_id,
-            )
-
-            # Select agent config
-            if writer_type == "pricing":
-                prompt = pricing_calculator.SYSTEM_PROMPT
-                tools = pricing_tools
-            elif writer_type == "commercial":
-                prompt = commercial_writer.SYSTEM_PROMPT
-                tools = commercial_tools
+                agent = agents[writer_type]
+                agent_id = f"{agent.name}:{section_id}"
+                state.agent_status[agent_id] = "running"
+
+                # Build instruction for this specific section
+                instruction = _build_writing_instruction(section, state)
+
+                on_tool_call = None
+                if progress_callback:
+                    async def on_tool_call(tool_name: str) -> None:
+                        await progress_callback(
+                            "tool_call",
+                            f"{section_title}: 调用工具 {tool_name}",
+                            idx + 1,
+                            total,
+                        )
+
+                try:
+                    await run_agent_streaming(agent, instruction, on_tool_call)
+                    async with lock:
+                        written += 1
+                    state.agent_status[agent_id] = "completed"
+                    logger.info("Section '%s' written successfully", section_title)
+                except Exception as e:
+                    logger.exception("Failed to write section '%s'", section_title)
+                    state.agent_status[agent_id] = "failed"
+                    async with lock:
+                        failed.append({"section_id": section_id, "title": section_title, "error": str(e)})
+
+        # Independent sections run concurrently; sections that reference
+        # other content run afterwards in order.
+        parallel: list[tuple[int, dict]] = []
+        sequential: list[tuple[int, dict]] = []
+        for idx, section in enumerate(targets):
+            if is_parallel_safe(section.get("title", ""), section.get("summary", "")):
+                parallel.append((idx, section))
             else:
-                prompt = technical_writer.SYSTEM_PROMPT
-                tools = technical_tools
-
-            # Build instruction for this specific section
-            instruction = _build_writing_instruction(section, state)
-
-            try:
-                agent = create_deepseek_agent(
-                    name=f"{writer_type}-writer",
-                    system_prompt=prompt,
-                    tools=tools,
-                    tool_call_limit=20,
-                )
-                await agent.arun(instruction)
-                written += 1
-                logger.info("Section '%s' written successfully", section_title)
-            except Exception as e:
-                logger.exception("Failed to write section '%s'", section_title)
-                failed.append({"section_id": section_id, "title": section_title, "error": str(e)})
+                sequential.append((idx, section))
+
+        await asyncio.gather(
+            *(_run_one(idx, section) for idx, section in parallel),
+            return_exceptions=True,
+        )
+        for idx, section in sequential:
+            await _run_one(idx, section)
 
         # Final sync
         await state.sync_to_backend(api_client)
@@ -182,36 +298,68 @@ async def run_content_pipeline(
         }
 
     finally:
+        state.defer_auto_save = previous_defer
         await api_client.close()
 
 
+def _build_writer_agents(
+    state: BidProjectState, api_client: BidSmartAPIClient
+) -> dict[str, Agent]:
+    """Build one agent per writer type (tool closures share state).
+
+    Agents keep no history (``num_history_runs=0``), so one instance can
+    serve every section of its type, including concurrent runs.
+    """
+    return {
+        "commercial": create_deepseek_agent(
+            name="commercial-writer",
+            system_prompt=load_prompt("commercial_writer"),
+            tools=[build_commercial_writer_tools(state, api_client)],
+            tool_call_limit=WRITER_TOOL_LIMIT,
+        ),
+        "technical": create_deepseek_agent(
+            name="technical-writer",
+            system_prompt=load_prompt("technical_writer"),
+            tools=[build_technical_writer_tools(state, api_client)],
+            tool_call_limit=WRITER_TOOL_LIMIT,
+        ),
+        "pricing": create_deepseek_agent(
+            name="pricing-writer",
+            system_prompt=load_prompt("pricing_calculator"),
+            tools=[build_pricing_calculator_tools(state, api_client)],
+            tool_call_limit=WRITER_TOOL_LIMIT,
+        ),
+    }
+
+
+_WRITING_STEPS = (
+    "请按以下步骤操作:\n"
+    "1. 调用 query_tender_requirements 了解本章节对应的招标要求\n"
+    "2. 根据需要调用其他工具获取公司信息\n"
+    "3. 编写章节内容\n"
+    "4. 调用 save_section_content 保存，status 设为 completed\n"
+)
+
+
 def _build_writing_instruction(section: dict, state: BidProjectState) -> str:
     """Build the user instruction for writing a specific section."""
     section_id = section["id"]
     title = section.get("title", "")
     description = section.get("summary", "")
 
-    instruction = f"请编写投标章节: {title} (章节ID: {section_id})\n\n"
+    parts = [f"请编写投标章节: {title} (章节ID: {section_id})\n\n"]
 
     if description:
-        instruction += f"章节描述: {description}\n\n"
-
-    # Include progress context
-    progress = state.get_progress_summary()
-    if progress["completed"] > 0:
-        completed_titles = [
-            s.get("title", "") for s in state.get_all_sections_sorted()
-            if s.get("status") == "completed"
-        ]
-        instruction += f"已完成章节: {', '.join(completed_titles)}\n"
-        instruction += "如需引用已完成章节的内容，请使用 get_section_content 工具查看。\n\n"
-
-    instruction += (
-        "请按以下步骤操作:\n"
-        "1. 调用 query_tender_requirements 了解本章节对应的招标要求\n"
-        "2. 根据需要调用其他工具获取公司信息\n"
-        "3. 编写章节内容\n"
-        "4. 调用 save_section_content 保存，status 设为 completed\n"
-    )
-
-    return instruction
+        parts.append(f"章节描述: {description}\n\n")
+
+    # Include progress context (one pass over the memoized sorted list)
+    completed_titles = [
+        s.get("title", "") for s in state.get_all_sections_sorted()
+        if s.get("status") == "completed"
+    ]
+    if completed_titles:
+        parts.append(f"已完成章节: {', '.join(completed_titles)}\n")
+        parts.append("如需引用已完成章节的内容，请使用 get_section_content 工具查看。\n\n")
+
+    parts.append(_WRITING_STEPS)
+    return "".join(parts)
@@ -12,30 +12,40 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_TOO_SHORT_REASON = "章节内容过短（{length} 字符，最少 {minimum} 字符）。请生成更充实的内容后再保存。"
 
-def on_agent_start(state: BidProjectState):
-    """Return a hook callback that tracks when a subagent starts."""
 
-    async def _hook(input_data: dict, tool_use_id: str | None, context: dict) -> dict:
+class _AgentStartHook:
+    """Hook callback that tracks when a subagent starts."""
+
+    __slots__ = ("state",)
+
+    def __init__(self, state: BidProjectState):
+        self.state = state
+
+    async def __call__(self, input_data: dict, tool_use_id: str | None, context: dict) -> dict:
         agent_id = input_data.get("agent_id", "unknown")
         agent_type = input_data.get("agent_type", "unknown")
-        state.current_agent = agent_id
-        state.agent_status[agent_id] = "running"
+        self.state.current_agent = agent_id
+        self.state.agent_status[agent_id] = "running"
         logger.info("Agent started: %s (type: %s)", agent_id, agent_type)
         return {}
 
-    return _hook
 
+class _AgentStopHook:
+    """Hook callback that tracks when a subagent stops."""
 
-def on_agent_stop(state: BidProjectState):
-    """Return a hook callback that tracks when a subagent stops."""
+    __slots__ = ("state",)
+
+    def __init__(self, state: BidProjectState):
+        self.state = state
 
-    async def _hook(input_data: dict, tool_use_id: str | None, context: dict) -> dict:
+    async def __call__(self, input_data: dict, tool_use_id: str | None, context: dict) -> dict:
         agent_id = input_data.get("agent_id", "unknown")
-        state.agent_status[agent_id] = "completed"
+        self.state.agent_status[agent_id] = "completed"
 
         # Log progress summary
-        progress = state.get_progress_summary()
+        progress = self.state.get_progress_summary()
         logger.info(
             "Agent completed: %s | Progress: %d/%d sections (%s%%)",
             agent_id,
@@ -45,7 +55,15 @@ def on_agent_stop(state: BidProjectState):
         )
         return {}
 
-    return _hook
+
+def on_agent_start(state: BidProjectState) -> _AgentStartHook:
+    """Return a hook callback that tracks when a subagent starts."""
+    return _AgentStartHook(state)
+
+
+def on_agent_stop(state: BidProjectState) -> _AgentStopHook:
+    """Return a hook callback that tracks when a subagent stops."""
+    return _AgentStopHook(state)
 
 
 async def validate_content_length(
@@ -53,23 +71,23 @@ async def validate_content_length(
 ) -> dict:
     """PreToolUse hook that rejects saving empty or too-short section content."""
     tool_input = input_data.get("tool_input", {})
-    content = tool_input.get("content", "")
+    length = len(tool_input.get("content", ""))
 
-    if len(content) < MIN_SECTION_CONTENT_LENGTH:
-        logger.warning(
-            "Rejected save_section_content: content too short (%d chars, min %d)",
-            len(content),
-            MIN_SECTION_CONTENT_LENGTH,
-        )
-        return {
-            "hookSpecificOutput": {
-                "hookEventName": "PreToolUse",
-                "permissionDecision": "deny",
-                "permissionDecisionReason": (
-                    f"章节内容过短（{len(content)} 字符，最少 {MIN_SECTION_CONTENT_LENGTH} 字符）。"
-                    f"请生成更充实的内容后再保存。"
-                ),
-            }
-        }
+    # Accept path first: most saves are long enough
+    if length >= MIN_SECTION_CONTENT_LENGTH:
+        return {}
 
-    return {}
+    logger.warning(
+        "Rejected save_section_content: content too short (%d chars, min %d)",
+        length,
+        MIN_SECTION_CONTENT_LENGTH,
+    )
+    return {
+        "hookSpecificOutput": {
+            "hookEventName": "PreToolUse",
+            "permissionDecision": "deny",
+            "permissionDecisionReason": _TOO_SHORT_REASON.format(
+                length=length, minimum=MIN_SECTION_CONTENT_LENGTH
+            ),
+        }
+    }
@@ -10,41 +10,50 @@ import asyncio
 import logging
 import sys
 
+from . import run
 from .config import BIDSMART_API_URL, MAX_BUDGET_USD
-from .orchestrator.orchestrator import create_bid_session, run_outline_generation, run_analysis
 
 logger = logging.getLogger(__name__)
 
 
 async def run_generate(args: argparse.Namespace) -> None:
     """Run the full bid generation workflow."""
+    from .orchestrator.orchestrator import run_analysis, run_outline_generation
+
     print(f"[BidSmart] 启动标书生成会话")
     print(f"  项目ID: {args.project_id}")
     print(f"  API: {args.api_url}")
     print("-" * 60)
 
-    # Step 1: Analysis
-    print("\n[1/4] 分析招标文件...")
+    # Steps 1 & 2: analysis and outline generation are independent (the
+    # outline planner reads the tender tree, not the analysis report), so
+    # run both LLM pipelines concurrently.
+    print("\n[1-2/4] 分析招标文件并生成投标文件大纲...")
     async def on_analysis_progress(phase: str, msg: str):
-        print(f"  [{phase}] {msg}")
-    
-    analysis_report = await run_analysis(
-        project_id=args.project_id,
-        api_url=args.api_url,
-        progress_callback=on_analysis_progress,
-    )
-    print(f"  ✓ 分析完成: {len(analysis_report) - 1} 个章节")
+        print(f"  [分析:{phase}] {msg}")
 
-    # Step 2: Outline Generation
-    print("\n[2/4] 生成投标文件大纲...")
     async def on_outline_progress(phase: str, msg: str):
-        print(f"  [{phase}] {msg}")
-    
-    sections = await run_outline_generation(
-        project_id=args.project_id,
-        api_url=args.api_url,
-        progress_callback=on_outline_progress,
+        print(f"  [大纲:{phase}] {msg}")
+
+    analysis_result, outline_result = await asyncio.gather(
+        run_analysis(
+            project_id=args.project_id,
+            api_url=args.api_url,
+            progress_callback=on_analysis_progress,
+        ),
+        run_outline_generation(
+            project_id=args.project_id,
+            api_url=args.api_url,
+            progress_callback=on_outline_progress,
+        ),
+        return_exceptions=True,
     )
+    for result in (analysis_result, outline_result):
+        if isinstance(result, BaseException):
+            raise result
+    analysis_report, sections = analysis_result, outline_result
+
+    print(f"  ✓ 分析完成: {len(analysis_report) - 1} 个章节")
     print(f"  ✓ 大纲生成完成: {len(sections)} 个章节")
     for sec in sections:
         print(f"    - {sec.get('title', 'Untitled')}")
@@ -62,6 +71,8 @@ async def run_generate(args: argparse.Namespace) -> None:
 
 async def run_analyze(args: argparse.Namespace) -> None:
     """Run only the analysis phase."""
+    from .orchestrator.orchestrator import run_analysis
+
     print(f"[BidSmart] 分析招标文件")
     print(f"  项目ID: {args.project_id}")
     print("-" * 60)
@@ -94,6 +105,8 @@ async def run_analyze(args: argparse.Namespace) -> None:
 
 async def run_outline(args: argparse.Namespace) -> None:
     """Run only the outline generation phase."""
+    from .orchestrator.orchestrator import run_outline_generation
+
     print(f"[BidSmart] 生成投标文件大纲")
     print(f"  项目ID: {args.project_id}")
     print("-" * 60)
@@ -158,14 +171,17 @@ def cli_main() -> None:
         datefmt="%H:%M:%S",
     )
 
-    # Run the appropriate command
-    command_map = {
-        "generate": run_generate,
-        "analyze": run_analyze,
-        "outline": run_outline,
-    }
-
-    asyncio.run(command_map[args.command](args))
+    # Run the appropriate command (each handler imports its pipelines lazily,
+    # so --help and argument errors never load agno or the API client)
+    match args.command:
+        case "generate":
+            handler = run_generate
+        case "analyze":
+            handler = run_analyze
+        case "outline":
+            handler = run_outline
+
+    run(handler(args))
 
 
 if __name__ == "__main__":
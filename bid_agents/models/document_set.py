@@ -6,15 +6,19 @@ templates, historical bids) that are used together for bid writing.
 
 from __future__ import annotations
 
+from bisect import insort
 from dataclasses import dataclass, field
-from typing import Literal
+from operator import attrgetter
+from typing import Iterable, Literal
 
 
 DocumentType = Literal["tender", "reference", "template", "historical", "company"]
 DocumentRole = Literal["primary", "auxiliary", "reference"]
 
+_item_order = attrgetter("order")
 
-@dataclass
+
+@dataclass(slots=True)
 class DocumentSetItem:
     """A single document within a DocumentSet.
     
@@ -71,7 +75,7 @@ class DocumentSetItem:
         return f"doc_{self.document_id}"
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentSet:
     """A collection of documents for bid writing.
     
@@ -91,6 +95,35 @@ class DocumentSet:
     created_at: int = 0
     updated_at: int = 0
     project_id: str | None = None
+    # document_id -> item; kept in sync by add_item/remove_item
+    _by_id: dict[str, DocumentSetItem] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # (item count, primary item) memo for get_primary_item()
+    _primary: tuple[int, DocumentSetItem | None] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (key, text) of the rendered agent prompt context; cleared when items
+    # are added or removed
+    prompt_context_cache: tuple[tuple, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Bumped by mark_changed(); derived views (e.g. merged trees) key on it
+    version: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._reindex()
+
+    def _reindex(self) -> None:
+        # Reverse fill: the first item wins when document IDs repeat
+        self._by_id = {item.document_id: item for item in reversed(self.items)}
+
+    def _index(self) -> dict[str, DocumentSetItem]:
+        """Return the document_id index, rebuilding it if ``items`` was
+        appended to or removed from directly."""
+        if len(self._by_id) != len(self.items):
+            self._reindex()
+        return self._by_id
     
     @classmethod
     def from_dict(cls, data: dict) -> DocumentSet:
@@ -118,19 +151,24 @@ class DocumentSet:
         }
     
     def get_primary_item(self) -> DocumentSetItem | None:
-        """Get the primary document item."""
-        for item in self.items:
-            if item.is_primary():
-                return item
-        # If no primary marked, return first item
-        return self.items[0] if self.items else None
+        """Get the primary document item.
+
+        Memoized until items are added or removed (direct appends to
+        ``items`` are caught by the item count).
+        """
+        cached = self._primary
+        if cached is not None and cached[0] == len(self.items):
+            return cached[1]
+        primary = next((item for item in self.items if item.is_primary()), None)
+        if primary is None and self.items:
+            # If no primary marked, use the first item
+            primary = self.items[0]
+        self._primary = (len(self.items), primary)
+        return primary
     
     def get_item_by_doc_id(self, document_id: str) -> DocumentSetItem | None:
         """Get item by document ID."""
-        for item in self.items:
-            if item.document_id == document_id:
-                return item
-        return None
+        return self._index().get(document_id)
     
     def get_items_by_type(self, doc_type: DocumentType) -> list[DocumentSetItem]:
         """Get all items of a specific type."""
@@ -142,30 +180,61 @@ class DocumentSet:
     
     def get_sorted_items(self) -> list[DocumentSetItem]:
         """Get items sorted by order."""
-        return sorted(self.items, key=lambda x: x.order)
+        return sorted(self.items, key=_item_order)
     
     def add_item(self, item: DocumentSetItem) -> None:
         """Add a new item to the set."""
-        # Ensure unique order
-        existing_orders = {i.order for i in self.items}
-        while item.order in existing_orders:
-            item.order += 1
-        self.items.append(item)
-        self.items.sort(key=lambda x: x.order)
+        self.add_items([item])
+    
+    def add_items(self, items: Iterable[DocumentSetItem]) -> None:
+        """Add several items, collecting the existing orders only once."""
+        orders = [i.order for i in self.items]
+        existing_orders = set(orders)
+        if any(a > b for a, b in zip(orders, orders[1:])):
+            # Backend order or primary-first reordering (set_primary);
+            # sort once, as appending and re-sorting would
+            self.items.sort(key=_item_order)
+        index = self._index()
+        for item in items:
+            # Ensure unique order
+            while item.order in existing_orders:
+                item.order += 1
+            existing_orders.add(item.order)
+            # Items are kept ordered by ``order``; insert in place instead
+            # of appending and re-sorting the whole list.
+            insort(self.items, item, key=_item_order)
+            index.setdefault(item.document_id, item)
+        self.mark_changed()
     
     def remove_item(self, document_id: str) -> bool:
         """Remove an item by document ID."""
-        for i, item in enumerate(self.items):
-            if item.document_id == document_id:
+        item = self._index().pop(document_id, None)
+        if item is None:
+            return False
+        for i, existing in enumerate(self.items):
+            if existing is item:
                 self.items.pop(i)
-                return True
-        return False
+                break
+        self._reindex()  # a later duplicate ID may now be reachable
+        self.mark_changed()
+        return True
+    
+    def mark_changed(self) -> None:
+        """Invalidate memos after items, roles or trees change.
+
+        add_item/remove_item/update_item_tree call this; code that edits
+        item roles, trees or the ``items`` order in place must call it too.
+        """
+        self._primary = None
+        self.prompt_context_cache = None
+        self.version += 1
     
     def update_item_tree(self, document_id: str, tree: dict) -> bool:
         """Update the tree for a specific item."""
         item = self.get_item_by_doc_id(document_id)
         if item:
             item.tree = tree
+            self.mark_changed()
             return True
         return False
     
@@ -179,4 +248,4 @@ class DocumentSet:
     
     def __contains__(self, document_id: str) -> bool:
         """Check if document ID is in the set."""
-        return any(item.document_id == document_id for item in self.items)
+        return document_id in self._index()
@@ -6,9 +6,27 @@ Backend uses snake_case; these types match the backend format directly.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Iterator
 
+# Indentation per tree depth for Node.flatten (deeper levels are built on demand)
+_INDENTS = tuple("  " * depth for depth in range(64))
 
-@dataclass
+_MISSING = object()
+
+
+def _first(data: dict, key: str, alt_key: str, default):
+    """Return ``data[key]``, else ``data[alt_key]``, else ``default``.
+
+    Used for fields the frontend sends in camelCase; the fallback key is
+    only probed when the snake_case key is absent.
+    """
+    value = data.get(key, _MISSING)
+    if value is _MISSING:
+        return data.get(alt_key, default)
+    return value
+
+
+@dataclass(slots=True)
 class Node:
     """Tender document tree node."""
 
@@ -20,24 +38,38 @@ class Node:
     pe: int | None = None  # PDF page end (1-based)
     line_start: int | None = None  # Markdown line start
 
+    # Tender trees can be deep; all traversals below use an explicit stack
+    # instead of recursion (no per-level frames, no recursion limit).
+
     @classmethod
-    def from_dict(cls, data: dict) -> Node:
-        children = [cls.from_dict(c) for c in data.get("children", [])]
+    def _from_dict_shallow(cls, data: dict) -> Node:
         return cls(
             id=data["id"],
             title=data["title"],
-            children=children,
             summary=data.get("summary"),
             ps=data.get("ps"),
             pe=data.get("pe"),
             line_start=data.get("line_start"),
         )
 
-    def to_dict(self) -> dict:
+    @classmethod
+    def from_dict(cls, data: dict) -> Node:
+        root = cls._from_dict_shallow(data)
+        stack = [(root, data.get("children") or [])]
+        while stack:
+            parent, children = stack.pop()
+            for child_data in children:
+                child = cls._from_dict_shallow(child_data)
+                parent.children.append(child)
+                if child_data.get("children"):
+                    stack.append((child, child_data["children"]))
+        return root
+
+    def _to_dict_shallow(self) -> dict:
         result: dict = {
             "id": self.id,
             "title": self.title,
-            "children": [c.to_dict() for c in self.children],
+            "children": [],
         }
         if self.summary is not None:
             result["summary"] = self.summary
@@ -49,28 +81,68 @@ class Node:
             result["line_start"] = self.line_start
         return result
 
+    def to_dict(self) -> dict:
+        root = self._to_dict_shallow()
+        stack = [(self, root)]
+        while stack:
+            node, node_dict = stack.pop()
+            for child in node.children:
+                child_dict = child._to_dict_shallow()
+                node_dict["children"].append(child_dict)
+                if child.children:
+                    stack.append((child, child_dict))
+        return root
+
     def flatten(self, depth: int = 0) -> str:
         """Flatten tree to indented text for prompt inclusion."""
-        indent = "  " * depth
-        lines = [f"{indent}{self.title}"]
-        if self.summary:
-            lines.append(f"{indent}  摘要: {self.summary}")
-        for child in self.children:
-            lines.append(child.flatten(depth + 1))
+        lines: list[str] = []
+        stack = [(self, depth)]
+        while stack:
+            node, level = stack.pop()
+            indent = _INDENTS[level] if level < len(_INDENTS) else "  " * level
+            lines.append(f"{indent}{node.title}")
+            if node.summary:
+                lines.append(f"{indent}  摘要: {node.summary}")
+            stack.extend((child, level + 1) for child in reversed(node.children))
         return "\n".join(lines)
 
+    def iter_nodes(self) -> Iterator[Node]:
+        """Yield this node and all descendants (depth-first, pre-order)."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
     def find_node(self, node_id: str) -> Node | None:
-        """Recursively find a node by ID."""
-        if self.id == node_id:
-            return self
-        for child in self.children:
-            found = child.find_node(node_id)
-            if found:
-                return found
-        return None
+        """Find a node by ID (depth-first, pre-order).
 
+        For repeated lookups on the same tree use ``build_index`` instead.
+        """
+        for node in self.iter_nodes():
+            if node.id == node_id:
+                return node
+        return None
 
-@dataclass
+    def build_index(self) -> dict[str, Node]:
+        """Map node ID -> node for O(1) lookups.
+
+        Matches ``find_node``: with duplicate IDs the first node in
+        pre-order wins.  The index is a snapshot; rebuild it after
+        changing the tree.
+        """
+        # Collect pre-order, then fill the dict in reverse so earlier nodes
+        # overwrite later duplicates (one dict store per node, no lookups).
+        ordered: list[Node] = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            ordered.append(node)
+            stack.extend(reversed(node.children))
+        return {node.id: node for node in reversed(ordered)}
+
+
+@dataclass(slots=True)
 class OutlineSection:
     """AI-generated outline section."""
 
@@ -90,7 +162,7 @@ class OutlineSection:
             id=data.get("id", ""),
             title=data.get("title", ""),
             description=data.get("description", ""),
-            requirement_summary=data.get("requirement_summary", data.get("requirementSummary", "")),
+            requirement_summary=_first(data, "requirement_summary", "requirementSummary", ""),
             order=data.get("order", 0),
             children=children,
         )
@@ -108,7 +180,7 @@ class OutlineSection:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class TenderOutline:
     """Complete bid outline."""
 
@@ -120,14 +192,21 @@ class TenderOutline:
     @classmethod
     def from_dict(cls, data: dict) -> TenderOutline:
         return cls(
-            project_id=data.get("project_id", data.get("projectId", "")),
+            project_id=_first(data, "project_id", "projectId", ""),
             sections=[OutlineSection.from_dict(s) for s in data.get("sections", [])],
-            generated_at=data.get("generated_at", data.get("generatedAt", 0)),
+            generated_at=_first(data, "generated_at", "generatedAt", 0),
             attachments=data.get("attachments"),
         )
 
 
-@dataclass
+# Keys of TenderSection.to_dict()
+_SECTION_KEYS = frozenset((
+    "id", "title", "content", "summary", "requirement_references",
+    "status", "order", "word_count",
+))
+
+
+@dataclass(slots=True)
 class TenderSection:
     """A section in the bid document being written."""
 
@@ -153,6 +232,27 @@ class TenderSection:
             word_count=data.get("word_count", 0),
         )
 
+    @staticmethod
+    def normalize_dict(data: dict) -> dict:
+        """Return ``from_dict(data).to_dict()`` without building the object.
+
+        A dict already in that shape (exactly the ``to_dict`` keys, with a
+        matching ``word_count``) is returned as is instead of copied.
+        """
+        if data.keys() == _SECTION_KEYS and data["word_count"] == len(data["content"]):
+            return data
+        content = data.get("content", "")
+        return {
+            "id": data["id"],
+            "title": data["title"],
+            "content": content,
+            "summary": data.get("summary"),
+            "requirement_references": data.get("requirement_references", []),
+            "status": data.get("status", "pending"),
+            "order": data.get("order", 0),
+            "word_count": len(content),
+        }
+
     def to_dict(self) -> dict:
         return {
             "id": self.id,
@@ -179,7 +279,7 @@ class TenderSection:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TenderProject:
     """Complete bid project."""
 
@@ -193,13 +293,22 @@ class TenderProject:
     status: str = "draft"  # "draft" | "review" | "completed"
 
     @classmethod
-    def from_dict(cls, data: dict) -> TenderProject:
+    def from_dict(cls, data: dict, with_sections: bool = True) -> TenderProject:
+        """Build a project from backend data.
+
+        Pass ``with_sections=False`` to skip materializing ``sections`` when
+        the caller works with the raw section dicts instead.
+        """
         return cls(
             id=data["id"],
             title=data["title"],
             tender_document_id=data.get("tender_document_id", ""),
             tender_document_tree=data.get("tender_document_tree", {}),
-            sections=[TenderSection.from_dict(s) for s in data.get("sections", [])],
+            sections=(
+                [TenderSection.from_dict(s) for s in data.get("sections", [])]
+                if with_sections
+                else []
+            ),
             created_at=data.get("created_at", 0),
             updated_at=data.get("updated_at", 0),
             status=data.get("status", "draft"),
@@ -218,7 +327,7 @@ class TenderProject:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReviewFinding:
     """A single review finding from the review agent."""
 
@@ -240,7 +349,7 @@ class ReviewFinding:
         return result
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComplianceItem:
     """A single compliance check item."""
 
@@ -260,7 +369,7 @@ class ComplianceItem:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExportConfig:
     """Export configuration."""
 
@@ -9,7 +9,8 @@ import logging
 from typing import Callable, Awaitable, Optional
 
 from ..api.client import BidSmartAPIClient
-from ..config import BIDSMART_API_URL
+from ..config import BIDSMART_API_URL, MAX_WRITER_CONCURRENCY
+from ..progress import queued_progress
 from ..state.project_state import BidProjectState
 from ..services.document_set_compat import auto_migrate_if_needed
 
@@ -17,7 +18,6 @@ logger = logging.getLogger(__name__)
 
 ProgressCallback = Optional[Callable[[str, str], Awaitable[None]]]
 
-
 async def create_bid_session(
     project_id: str,
     api_url: str | None = None,
@@ -31,13 +31,15 @@ async def create_bid_session(
         auto_migrate: Whether to auto-migrate to document set
         
     Returns:
-        Tuple of (api_client, state)
+        Tuple of (api_client, state).  The client is the shared client
+        for ``api_url`` on the running event loop (see
+        ``BidSmartAPIClient.shared``); ``close()`` on it is a no-op.
     """
     effective_url = api_url or BIDSMART_API_URL
 
     # Initialize
     state = BidProjectState()
-    api_client = BidSmartAPIClient(effective_url)
+    api_client = BidSmartAPIClient.shared(effective_url)
 
     # Load from backend
     await state.load_from_backend(api_client, project_id)
@@ -54,11 +56,126 @@ async def create_bid_session(
     return api_client, state
 
 
+# ── Workflow handlers ────────────────────────────────────────────────────────
+# Each handler returns the entries it adds to the workflow results.  Pipelines
+# are imported inside the handlers so unused ones are never loaded.
+
+WorkflowHandler = Callable[
+    [str, str, BidProjectState, ProgressCallback, int], Awaitable[dict]
+]
+
+
+async def _workflow_analysis(
+    project_id: str,
+    api_url: str,
+    state: BidProjectState,
+    progress_callback: ProgressCallback,
+    max_parallel: int,
+) -> dict:
+    from ..pipelines.document_set_pipeline import run_document_set_analysis_pipeline
+
+    if progress_callback:
+        await progress_callback("start", "开始文档集分析")
+
+    analysis = await run_document_set_analysis_pipeline(
+        project_id, api_url, progress_callback, state=state
+    )
+    return {"analysis": analysis}
+
+
+async def _workflow_outline(
+    project_id: str,
+    api_url: str,
+    state: BidProjectState,
+    progress_callback: ProgressCallback,
+    max_parallel: int,
+) -> dict:
+    from ..pipelines.document_set_pipeline import run_document_set_outline_pipeline
+
+    if progress_callback:
+        await progress_callback("start", "生成大纲")
+
+    sections = await run_document_set_outline_pipeline(
+        project_id, api_url, progress_callback, state=state
+    )
+    return {"sections": sections}
+
+
+async def _workflow_write(
+    project_id: str,
+    api_url: str,
+    state: BidProjectState,
+    progress_callback: ProgressCallback,
+    max_parallel: int,
+) -> dict:
+    from ..content_pipeline import run_content_pipeline
+
+    # Write all pending sections; the content pipeline picks a writer per
+    # section and runs independent ones concurrently (up to max_parallel).
+    # One pipeline run keeps a single state (the session's, so the project
+    # is not loaded again), so concurrent writers do not overwrite each
+    # other's sections on sync.  Per-section writer status is recorded in
+    # state.agent_status.
+    pending = state.get_sections_by_status("pending")
+    if not pending:
+        return {"message": "没有待编写的章节"}
+
+    if progress_callback:
+        await progress_callback("start", f"编写 {len(pending)} 个章节")
+
+    async def on_write_progress(phase: str, msg: str, current: int, total: int):
+        if progress_callback:
+            await progress_callback(phase, f"[{current}/{total}] {msg}")
+
+    # Forwarding into an already-queued callback (or nowhere) needs no
+    # second queue
+    on_write_progress.queued = progress_callback is None or getattr(
+        progress_callback, "queued", False
+    )
+
+    content = await run_content_pipeline(
+        project_id=project_id,
+        api_url=api_url,
+        section_ids=[s["id"] for s in pending],
+        progress_callback=on_write_progress,
+        max_concurrency=max_parallel,
+        state=state,
+    )
+    return {"content": content}
+
+
+async def _workflow_full(
+    project_id: str,
+    api_url: str,
+    state: BidProjectState,
+    progress_callback: ProgressCallback,
+    max_parallel: int,
+) -> dict:
+    from ..pipelines.document_set_pipeline import run_document_set_full_pipeline
+
+    if progress_callback:
+        await progress_callback("start", "执行完整流程")
+
+    return await run_document_set_full_pipeline(
+        project_id, api_url, progress_callback, max_concurrency=max_parallel
+    )
+
+
+# workflow_type -> handler; unknown types run the full workflow
+_WORKFLOW_DISPATCH: dict[str, WorkflowHandler] = {
+    "analysis": _workflow_analysis,
+    "outline": _workflow_outline,
+    "write": _workflow_write,
+    "full": _workflow_full,
+}
+
+
 async def run_document_set_workflow(
     project_id: str,
     api_url: str | None = None,
     workflow_type: str = "full",  # full|analysis|outline|write
     progress_callback: ProgressCallback = None,
+    max_parallel: int = MAX_WRITER_CONCURRENCY,
 ) -> dict:
     """Run document set aware workflow.
     
@@ -67,72 +184,31 @@ async def run_document_set_workflow(
         api_url: API URL
         workflow_type: Type of workflow to run
         progress_callback: Progress callback
+        max_parallel: Maximum sections written concurrently (``write`` only)
         
     Returns:
         Workflow results
     """
-    api_client, state = await create_bid_session(project_id, api_url)
-    
-    results = {
-        "project_id": project_id,
-        "using_document_set": state.is_using_document_set(),
-        "document_count": len(state.document_set) if state.document_set else 1,
-    }
-    
-    if workflow_type == "analysis":
-        from ..pipelines.document_set_pipeline import run_document_set_analysis_pipeline
-        
-        if progress_callback:
-            await progress_callback("start", "开始文档集分析")
-        
-        analysis = await run_document_set_analysis_pipeline(
-            project_id, api_url or BIDSMART_API_URL, progress_callback
-        )
-        results["analysis"] = analysis
-        
-    elif workflow_type == "outline":
-        from ..pipelines.document_set_pipeline import run_document_set_outline_pipeline
-        
-        if progress_callback:
-            await progress_callback("start", "生成大纲")
-        
-        sections = await run_document_set_outline_pipeline(
-            project_id, api_url or BIDSMART_API_URL, progress_callback
-        )
-        results["sections"] = sections
-        
-    elif workflow_type == "write":
-        from ..pipelines.document_set_pipeline import run_document_set_writing_pipeline
-        
-        # Write first pending section
-        pending = state.get_sections_by_status("pending")
-        if pending:
-            section = pending[0]
-            if progress_callback:
-                await progress_callback("start", f"编写章节: {section['title']}")
-            
-            content = await run_document_set_writing_pipeline(
-                project_id, section["id"], api_url or BIDSMART_API_URL, progress_callback
+    async with queued_progress(progress_callback) as progress_callback:
+        api_client, state = await create_bid_session(project_id, api_url)
+
+        results = {
+            "project_id": project_id,
+            "using_document_set": state.is_using_document_set(),
+            "document_count": len(state.document_set) if state.document_set else 1,
+        }
+
+        handler = _WORKFLOW_DISPATCH.get(workflow_type, _workflow_full)
+        results.update(
+            await handler(
+                project_id, api_url or BIDSMART_API_URL, state, progress_callback, max_parallel
             )
-            results["content"] = content
-        else:
-            results["message"] = "没有待编写的章节"
-            
-    else:  # full
-        from ..pipelines.document_set_pipeline import run_document_set_full_pipeline
-        
-        if progress_callback:
-            await progress_callback("start", "执行完整流程")
-        
-        full_results = await run_document_set_full_pipeline(
-            project_id, api_url or BIDSMART_API_URL, progress_callback
         )
-        results.update(full_results)
-    
-    if progress_callback:
-        await progress_callback("complete", "工作流完成")
-    
-    return results
+
+        if progress_callback:
+            await progress_callback("complete", "工作流完成")
+
+        return results
 
 
 async def run_outline_generation(
@@ -145,12 +221,13 @@ async def run_outline_generation(
     Document set aware - will use document set if available.
     """
     from ..outline_pipeline import run_outline_pipeline
-    
-    return await run_outline_pipeline(
-        project_id=project_id,
-        api_url=api_url or BIDSMART_API_URL,
-        progress_callback=progress_callback,
-    )
+
+    async with queued_progress(progress_callback) as progress_callback:
+        return await run_outline_pipeline(
+            project_id=project_id,
+            api_url=api_url or BIDSMART_API_URL,
+            progress_callback=progress_callback,
+        )
 
 
 async def run_analysis(
@@ -163,14 +240,11 @@ async def run_analysis(
     Document set aware - will use document set if available.
     """
     api_client, state = await create_bid_session(project_id, api_url)
-    
+
     if state.is_using_document_set():
-        from ..pipelines.document_set_pipeline import run_document_set_analysis_pipeline
-        return await run_document_set_analysis_pipeline(
-            project_id, api_url or BIDSMART_API_URL, progress_callback
-        )
+        from ..pipelines.document_set_pipeline import run_document_set_analysis_pipeline as pipeline
     else:
-        from ..analysis_pipeline import run_analysis_pipeline
-        return await run_analysis_pipeline(
-            project_id, api_url or BIDSMART_API_URL, progress_callback
-        )
+        from ..analysis_pipeline import run_analysis_pipeline as pipeline
+
+    async with queued_progress(progress_callback) as progress_callback:
+        return await pipeline(project_id, api_url or BIDSMART_API_URL, progress_callback)
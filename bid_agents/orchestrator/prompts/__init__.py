@@ -0,0 +1,26 @@
+"""System prompt for the orchestrator (top-level ClaudeSDKClient).
+
+The prompt lives in ``orchestrator.md`` next to this module and is read from
+disk on first use, so importing the orchestrator package does not keep it in
+memory.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+
+PROMPT_FILE = Path(__file__).parent / "orchestrator.md"
+
+
+@lru_cache(maxsize=None)
+def get_orchestrator_prompt() -> str:
+    """Read and cache the orchestrator system prompt."""
+    return PROMPT_FILE.read_text(encoding="utf-8")
+
+
+def __getattr__(name: str):
+    # Backwards compatibility: ``ORCHESTRATOR_PROMPT`` used to be a constant.
+    if name == "ORCHESTRATOR_PROMPT":
+        return get_orchestrator_prompt()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -15,30 +15,56 @@ Usage (from FastAPI backend)::
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 import os
-from typing import Awaitable, Callable, Optional
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
 
 from dotenv import load_dotenv
 
-from .agent_runner import create_deepseek_agent
-from .agents.prompts import format_extractor, outline_planner
+from .agent_runner import create_deepseek_agent, run_agent_streaming, tool_call_progress
+from .agents.prompts import load_prompt
 from .api.client import BidSmartAPIClient
+from .config import (
+    FORMAT_EXTRACTOR_TOOL_LIMIT,
+    MAX_PROJECT_CONCURRENCY,
+    OUTLINE_PLANNER_TOOL_LIMIT,
+)
+from .progress import with_queued_progress
 from .state.project_state import BidProjectState
 from .tool_adapters import build_format_extractor_tools, build_outline_planner_tools
 
+if TYPE_CHECKING:
+    from agno.agent import Agent
+
 logger = logging.getLogger(__name__)
 
+# Existing .env files read by _load_env(), in priority order:
+# lib/docmind-ai/.env (primary backend config), then the project root .env
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_ENV_FILES = tuple(
+    path
+    for path in (
+        os.path.join(_PROJECT_ROOT, "lib", "docmind-ai", ".env"),
+        os.path.join(_PROJECT_ROOT, ".env"),
+    )
+    if os.path.exists(path)
+)
+_ENV_LOADED = False
+
 # Type alias for the progress callback
 ProgressCallback = Optional[Callable[[str, str], Awaitable[None]]]
 
 
+@with_queued_progress
 async def run_outline_pipeline(
     project_id: str,
     api_url: str,
     user_requirements: str | None = None,
     attachment_names: list[str] | None = None,
     progress_callback: ProgressCallback = None,
+    state: BidProjectState | None = None,
 ) -> list[dict]:
     """Run format-extractor → outline-planner pipeline, return sections list.
 
@@ -52,6 +78,9 @@ async def run_outline_pipeline(
             reference in the outline.
         progress_callback: ``async (phase, message) -> None`` called when the
             pipeline transitions between phases.
+        state: Already loaded project state to work on (e.g. shared
+            between phases of a larger workflow).  Loaded from the backend
+            when omitted.
 
     Returns:
         List of tender section dicts (sorted by order) written to the project.
@@ -63,34 +92,51 @@ async def run_outline_pipeline(
     _load_env()
 
     # 1. Initialize shared state + API client
-    api_client = BidSmartAPIClient(api_url)
-    state = BidProjectState()
+    api_client = BidSmartAPIClient.shared(api_url)
 
     try:
-        await state.load_from_backend(api_client, project_id)
+        if state is None:
+            state = BidProjectState()
+            await state.load_from_backend(api_client, project_id)
 
         # 2. Build tools (closures over shared state)
         format_tools = build_format_extractor_tools(state, api_client)
-        outline_tools = build_outline_planner_tools(state, api_client)
 
-        # 3. Phase 1: Format extraction
-        if progress_callback:
-            await progress_callback("format_extraction", "正在分析招标文件格式要求...")
-
-        format_agent = create_deepseek_agent(
-            name="format-extractor",
-            system_prompt=format_extractor.SYSTEM_PROMPT,
-            tools=format_tools,
-            tool_call_limit=8,
+        # Prepare the outline planner (agent + parsed tender tree) in a
+        # worker thread while the format extractor runs; only its
+        # instruction depends on the format result.
+        prepare_outline = asyncio.create_task(
+            asyncio.to_thread(_prepare_outline_agent, state, api_client)
         )
 
-        format_instruction = (
-            f"请分析项目 {project_id} 的招标文档格式要求。"
-            f"请先用 get_tender_tree 获取文档结构，然后针对性地查询格式相关章节（最多查询3次），"
-            f"最后调用 save_format_spec 保存结果。"
-        )
-        logger.info("Starting format-extractor for project %s", project_id)
-        await format_agent.arun(format_instruction)
+        try:
+            # 3. Phase 1: Format extraction
+            if progress_callback:
+                await progress_callback("format_extraction", "正在分析招标文件格式要求...")
+
+            format_agent = create_deepseek_agent(
+                name="format-extractor",
+                system_prompt=load_prompt("format_extractor"),
+                tools=[format_tools],
+                tool_call_limit=FORMAT_EXTRACTOR_TOOL_LIMIT,
+            )
+
+            format_instruction = (
+                f"请分析项目 {project_id} 的招标文档格式要求。"
+                f"请先用 get_tender_tree 获取文档结构，然后针对性地查询格式相关章节（最多查询3次），"
+                f"最后调用 save_format_spec 保存结果。"
+            )
+            logger.info("Starting format-extractor for project %s", project_id)
+            await run_agent_streaming(
+                format_agent, format_instruction, tool_call_progress(progress_callback)
+            )
+        except BaseException:
+            prepare_outline.cancel()
+            # cancel() is a no-op once the thread has finished; retrieve its
+            # result or error so asyncio does not report it as never retrieved
+            with contextlib.suppress(Exception, asyncio.CancelledError):
+                await prepare_outline
+            raise
         logger.info(
             "Format extraction complete. has_format_requirement=%s",
             state.format_spec.get("has_format_requirement") if state.format_spec else "N/A",
@@ -100,23 +146,21 @@ async def run_outline_pipeline(
         if progress_callback:
             await progress_callback("outline_planning", "正在生成投标大纲...")
 
-        outline_agent = create_deepseek_agent(
-            name="outline-planner",
-            system_prompt=outline_planner.SYSTEM_PROMPT,
-            tools=outline_tools,
-            tool_call_limit=10,
-        )
+        outline_agent = await prepare_outline
 
-        outline_instruction = f"请为项目 {project_id} 生成投标文件大纲。"
+        parts = [f"请为项目 {project_id} 生成投标文件大纲。"]
         if state.format_spec:
-            outline_instruction += "\n\nformat-extractor 已完成格式分析，请先查询格式规范。"
+            parts.append("format-extractor 已完成格式分析，请先查询格式规范。")
         if user_requirements:
-            outline_instruction += f"\n\n用户补充要求:\n{user_requirements}"
+            parts.append(f"用户补充要求:\n{user_requirements}")
         if attachment_names:
-            outline_instruction += f"\n\n参考附件: {', '.join(attachment_names)}"
+            parts.append(f"参考附件: {', '.join(attachment_names)}")
+        outline_instruction = "\n\n".join(parts)
 
         logger.info("Starting outline-planner for project %s", project_id)
-        await outline_agent.arun(outline_instruction)
+        await run_agent_streaming(
+            outline_agent, outline_instruction, tool_call_progress(progress_callback)
+        )
         logger.info(
             "Outline planning complete. %d sections generated.",
             len(state.sections),
@@ -129,18 +173,73 @@ async def run_outline_pipeline(
         await api_client.close()
 
 
+async def run_outline_pipeline_batch(
+    projects: list[dict],
+    api_url: str,
+    max_concurrency: int = MAX_PROJECT_CONCURRENCY,
+    progress_callback: ProgressCallback = None,
+) -> list[list[dict] | BaseException]:
+    """Run the outline pipeline for several projects concurrently.
+
+    Args:
+        projects: One dict per project with ``project_id`` and optionally
+            ``user_requirements`` / ``attachment_names`` (the keyword
+            arguments of :func:`run_outline_pipeline`).
+        api_url: Base URL of the BidSmart backend.
+        max_concurrency: Maximum number of projects processed at once.
+        progress_callback: ``async (phase, message) -> None``; messages are
+            prefixed with the project ID.
+
+    Returns:
+        One entry per project, in input order: the sections list, or the
+        exception that project's pipeline raised.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _run_one(project: dict) -> list[dict]:
+        project_id = project["project_id"]
+        on_progress = None
+        if progress_callback:
+            async def on_progress(phase: str, msg: str) -> None:
+                await progress_callback(phase, f"[{project_id}] {msg}")
+
+        async with semaphore:
+            return await run_outline_pipeline(
+                project_id=project_id,
+                api_url=api_url,
+                user_requirements=project.get("user_requirements"),
+                attachment_names=project.get("attachment_names"),
+                progress_callback=on_progress,
+            )
+
+    # The runs share this loop's pooled BidSmartAPIClient.shared(api_url) client.
+    return await asyncio.gather(
+        *(_run_one(project) for project in projects), return_exceptions=True
+    )
+
+
+def _prepare_outline_agent(state: BidProjectState, api_client: BidSmartAPIClient) -> Agent:
+    """Build the outline-planner agent and parse the tender tree it queries."""
+    state.get_tender_node()
+    return create_deepseek_agent(
+        name="outline-planner",
+        system_prompt=load_prompt("outline_planner"),
+        tools=[build_outline_planner_tools(state, api_client)],
+        tool_call_limit=OUTLINE_PLANNER_TOOL_LIMIT,
+    )
+
+
 def _load_env() -> None:
-    """Load environment variables from .env files.
+    """Load environment variables from .env files (once per process).
 
     Searches in the following order:
     1. ``lib/docmind-ai/.env`` (primary backend config)
     2. ``.env`` (project root)
     """
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    backend_env = os.path.join(project_root, "lib", "docmind-ai", ".env")
-    root_env = os.path.join(project_root, ".env")
-
-    if os.path.exists(backend_env):
-        load_dotenv(backend_env, override=False)
-    if os.path.exists(root_env):
-        load_dotenv(root_env, override=False)
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+
+    for path in _ENV_FILES:
+        load_dotenv(path, override=False)
+    _ENV_LOADED = True
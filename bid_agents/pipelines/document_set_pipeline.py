@@ -5,12 +5,15 @@ Extends the base analysis pipeline to work with multi-document document sets.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
-from ..agent_runner import create_deepseek_agent
-from ..agents.prompts import tender_analyzer
+from ..agent_runner import create_deepseek_agent, run_agent_streaming, tool_call_progress
+from ..agents.prompts import load_prompt
 from ..api.client import BidSmartAPIClient
+from ..config import DOCUMENT_SET_ANALYZER_TOOL_LIMIT, MAX_WRITER_CONCURRENCY
+from ..progress import with_queued_progress
 from ..state.project_state import BidProjectState
 from ..tool_adapters import build_tender_analyzer_tools
 
@@ -21,10 +24,30 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+async def _session_state(
+    api_client: BidSmartAPIClient,
+    project_id: str,
+    state: BidProjectState | None,
+    state_snapshot: dict | None,
+) -> BidProjectState:
+    """Return ``state``, else one restored from ``state_snapshot``, else a
+    freshly loaded one."""
+    if state is not None:
+        return state
+    if state_snapshot is not None:
+        return BidProjectState.from_snapshot(state_snapshot)
+    state = BidProjectState()
+    await state.load_from_backend(api_client, project_id)
+    return state
+
+
+@with_queued_progress
 async def run_document_set_analysis_pipeline(
     project_id: str,
     api_url: str,
     progress_callback: ProgressCallback = None,
+    state: BidProjectState | None = None,
+    state_snapshot: dict | None = None,
 ) -> dict:
     """Run tender document analysis on a document set.
     
@@ -38,23 +61,28 @@ async def run_document_set_analysis_pipeline(
         project_id: The bid project ID
         api_url: Base URL of the BidSmart backend
         progress_callback: Async callback for progress updates
+        state: Already loaded project state; loaded from the backend
+            when omitted
+        state_snapshot: ``BidProjectState.to_snapshot()`` output to
+            restore the state from instead of loading it
         
     Returns:
         Analysis report dictionary
     """
     # Initialize
-    api_client = BidSmartAPIClient(api_url)
-    state = BidProjectState()
+    api_client = BidSmartAPIClient.shared(api_url)
     
     try:
-        await state.load_from_backend(api_client, project_id)
+        state = await _session_state(api_client, project_id, state, state_snapshot)
         
         # Check if using document set
         if not state.is_using_document_set():
             logger.warning("No document set found, falling back to single document analysis")
             # Fall back to standard analysis
             from ..analysis_pipeline import run_analysis_pipeline
-            return await run_analysis_pipeline(project_id, api_url, progress_callback)
+            return await run_analysis_pipeline(
+                project_id, api_url, progress_callback, state=state
+            )
         
         if progress_callback:
             await progress_callback("init", f"开始分析文档集: {state.document_set.name}")
@@ -65,9 +93,9 @@ async def run_document_set_analysis_pipeline(
         # Create agent
         analyzer = create_deepseek_agent(
             name="document-set-analyzer",
-            system_prompt=tender_analyzer.SYSTEM_PROMPT + _get_document_set_context(state),
-            tools=analysis_tools,
-            tool_call_limit=25,
+            system_prompt=load_prompt("tender_analyzer") + _get_document_set_context(state),
+            tools=[analysis_tools],
+            tool_call_limit=DOCUMENT_SET_ANALYZER_TOOL_LIMIT,
         )
         
         # Build analysis instruction
@@ -97,7 +125,9 @@ async def run_document_set_analysis_pipeline(
         )
         
         logger.info("Starting document set analysis for project %s", project_id)
-        await analyzer.arun(instruction)
+        await run_agent_streaming(
+            analyzer, instruction, tool_call_progress(progress_callback)
+        )
         
         if state.analysis_report:
             logger.info("Document set analysis complete: %d sections", 
@@ -107,8 +137,13 @@ async def run_document_set_analysis_pipeline(
         
         return state.analysis_report or {}
         
-    except Exception:
-        logger.exception("Document set analysis pipeline failed for project %s", project_id)
+    except Exception as e:
+        # Re-raised, so the caller reports the traceback; only repeat it
+        # here when debugging.
+        logger.error(
+            "Document set analysis pipeline failed for project %s: %s",
+            project_id, e, exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
         raise
 
 
@@ -125,20 +160,27 @@ def _get_document_set_context(state: BidProjectState) -> str:
         return ""
     
     doc_set = state.document_set
-    primary = doc_set.get_primary_item()
-    
-    context = "\n\n## 文档集上下文\n\n"
-    context += f"当前工作于文档集: {doc_set.name}\n"
-    context += f"包含 {len(doc_set)} 个文档:\n"
+    # Rendered once per document set; direct edits to ``items`` that bypass
+    # add_item/remove_item are caught by the length in the key.
+    key = (doc_set.id, doc_set.name, doc_set.updated_at, len(doc_set))
+    cached = doc_set.prompt_context_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
     
+    parts = [
+        "\n\n## 文档集上下文\n\n",
+        f"当前工作于文档集: {doc_set.name}\n",
+        f"包含 {len(doc_set)} 个文档:\n",
+    ]
     for item in doc_set.get_sorted_items():
         icon = "⭐" if item.role == "primary" else "📄"
-        context += f"{icon} [{item.doc_type}] {item.name}\n"
-    
-    context += "\n"
-    context += "主文档是招标要求的主要来源，辅助文档提供参考资料。\n"
-    context += "分析时以主文档为主，必要时查阅辅助文档。\n"
+        parts.append(f"{icon} [{item.doc_type}] {item.name}\n")
+    parts.append("\n")
+    parts.append("主文档是招标要求的主要来源，辅助文档提供参考资料。\n")
+    parts.append("分析时以主文档为主，必要时查阅辅助文档。\n")
     
+    context = "".join(parts)
+    doc_set.prompt_context_cache = (key, context)
     return context
 
 
@@ -146,6 +188,8 @@ async def run_document_set_outline_pipeline(
     project_id: str,
     api_url: str,
     progress_callback: ProgressCallback = None,
+    state: BidProjectState | None = None,
+    state_snapshot: dict | None = None,
 ) -> list[dict]:
     """Generate outline considering document set structure.
     
@@ -153,26 +197,51 @@ async def run_document_set_outline_pipeline(
         project_id: Project ID
         api_url: API URL
         progress_callback: Progress callback
+        state: Already loaded project state; loaded from the backend
+            when omitted
+        state_snapshot: ``BidProjectState.to_snapshot()`` output to
+            restore the state from instead of loading it
         
     Returns:
         List of section dictionaries
     """
     from ..outline_pipeline import run_outline_pipeline
     
+    if state is None and state_snapshot is not None:
+        state = BidProjectState.from_snapshot(state_snapshot)
+
     # For now, use standard outline pipeline
     # The document set context is already in state
     return await run_outline_pipeline(
         project_id=project_id,
         api_url=api_url,
         progress_callback=progress_callback,
+        state=state,
     )
 
 
+def _section_progress(progress_callback: ProgressCallback):
+    """Adapt a ``(phase, message)`` callback to the content pipeline's
+    ``(phase, message, current, total)`` signature."""
+    if progress_callback is None:
+        return None
+
+    async def on_progress(phase: str, msg: str, current: int, total: int) -> None:
+        await progress_callback(phase, f"[{current}/{total}] {msg}")
+
+    # Forwarding into an already-queued callback needs no second queue
+    on_progress.queued = getattr(progress_callback, "queued", False)
+    return on_progress
+
+
+@with_queued_progress
 async def run_document_set_writing_pipeline(
     project_id: str,
     section_id: str,
     api_url: str,
     progress_callback: ProgressCallback = None,
+    state: BidProjectState | None = None,
+    state_snapshot: dict | None = None,
 ) -> str:
     """Write a section using document set resources.
     
@@ -187,6 +256,10 @@ async def run_document_set_writing_pipeline(
         section_id: Section ID to write
         api_url: API URL
         progress_callback: Progress callback
+        state: Already loaded project state; loaded from the backend
+            when omitted
+        state_snapshot: ``BidProjectState.to_snapshot()`` output to
+            restore the state from instead of loading it
         
     Returns:
         Generated content
@@ -194,9 +267,9 @@ async def run_document_set_writing_pipeline(
     from ..content_pipeline import run_content_pipeline
     
     # Initialize
-    api_client = BidSmartAPIClient(api_url)
-    state = BidProjectState()
-    await state.load_from_backend(api_client, project_id)
+    state = await _session_state(
+        BidSmartAPIClient.shared(api_url), project_id, state, state_snapshot
+    )
     
     if not state.is_using_document_set():
         # Standard writing
@@ -204,7 +277,8 @@ async def run_document_set_writing_pipeline(
             project_id=project_id,
             api_url=api_url,
             section_ids=[section_id],
-            progress_callback=progress_callback,
+            progress_callback=_section_progress(progress_callback),
+            state=state,
         )
     
     # Document set aware writing
@@ -229,14 +303,18 @@ async def run_document_set_writing_pipeline(
         project_id=project_id,
         api_url=api_url,
         section_ids=[section_id],
-        progress_callback=progress_callback,
+        progress_callback=_section_progress(progress_callback),
+        state=state,
     )
 
 
+@with_queued_progress
 async def run_document_set_full_pipeline(
     project_id: str,
     api_url: str,
     progress_callback: ProgressCallback = None,
+    max_concurrency: int = MAX_WRITER_CONCURRENCY,
+    state_snapshot: dict | None = None,
 ) -> dict:
     """Run complete bid generation pipeline with document set support.
     
@@ -244,6 +322,9 @@ async def run_document_set_full_pipeline(
         project_id: Project ID
         api_url: API URL
         progress_callback: Progress callback
+        max_concurrency: Maximum sections written at the same time
+        state_snapshot: ``BidProjectState.to_snapshot()`` output to
+            restore the state from instead of loading it
         
     Returns:
         Final project summary
@@ -257,46 +338,75 @@ async def run_document_set_full_pipeline(
     }
     
     try:
-        # Phase 1: Analysis
-        if progress_callback:
-            await progress_callback("phase", "Phase 1: 文档集分析")
-        
-        analysis = await run_document_set_analysis_pipeline(
-            project_id, api_url, progress_callback
+        # One state for every phase: the project is loaded once and the
+        # phases share its caches (tender tree, query results).
+        state = await _session_state(
+            BidSmartAPIClient.shared(api_url), project_id, None, state_snapshot
         )
-        results["analysis"] = analysis
-        
-        # Phase 2: Outline
+
+        # Phases 1 & 2: analysis and outline generation are independent
+        # (the outline planner reads the tender tree, not the analysis
+        # report), so run both pipelines concurrently.  A failure in one
+        # is recorded without cancelling the other.
         if progress_callback:
-            await progress_callback("phase", "Phase 2: 生成大纲")
-        
-        sections = await run_document_set_outline_pipeline(
-            project_id, api_url, progress_callback
+            await progress_callback("phase", "Phase 1-2: 文档集分析 / 生成大纲")
+
+        analysis, sections = await asyncio.gather(
+            run_document_set_analysis_pipeline(
+                project_id, api_url, progress_callback, state=state
+            ),
+            run_document_set_outline_pipeline(
+                project_id, api_url, progress_callback, state=state
+            ),
+            return_exceptions=True,
         )
-        results["outline"] = sections
+        for key, result in (("analysis", analysis), ("outline", sections)):
+            if isinstance(result, BaseException):
+                # Swallowed into the results; the phase pipelines leave
+                # the traceback to their caller
+                logger.error(
+                    "Document set %s phase failed: %s", key, result, exc_info=result
+                )
+                results["errors"].append(f"{key}: {result}")
+            else:
+                results[key] = result
+        if isinstance(sections, BaseException):
+            # Nothing to write without an outline
+            return results
         
-        # Phase 3: Writing (one section for demo)
+        # Phase 3: Writing all pending sections.  A single content
+        # pipeline run writes them concurrently (bounded by
+        # max_concurrency) against one state, so writers never overwrite
+        # each other's sections when syncing.
         if progress_callback:
             await progress_callback("phase", "Phase 3: 编写内容")
         
-        # Write first pending section
-        api_client = BidSmartAPIClient(api_url)
-        state = BidProjectState()
-        await state.load_from_backend(api_client, project_id)
-        
+        # The outline phase saved its sections into the shared state, so
+        # no reload is needed
         pending = state.get_sections_by_status("pending")
         if pending:
-            section = pending[0]
-            await run_document_set_writing_pipeline(
-                project_id, section["id"], api_url, progress_callback
+            from ..content_pipeline import run_content_pipeline
+
+            content = await run_content_pipeline(
+                project_id=project_id,
+                api_url=api_url,
+                section_ids=[s["id"] for s in pending],
+                progress_callback=_section_progress(progress_callback),
+                max_concurrency=max_concurrency,
+                state=state,
+            )
+            results["sections_written"] = content["written"]
+            results["errors"].extend(
+                f"{f['title']}: {f['error']}" for f in content["failed"]
             )
-            results["sections_written"] = 1
         
         if progress_callback:
             await progress_callback("complete", "文档集流程完成")
         
     except Exception as e:
-        logger.exception("Full pipeline failed")
-        results["errors"].append(str(e))
+        err_msg = str(e)
+        # The error is swallowed into the results, so keep the traceback.
+        logger.exception("Full pipeline failed for project %s: %s", project_id, err_msg)
+        results["errors"].append(err_msg)
     
     return results
@@ -0,0 +1,100 @@
+"""Non-blocking progress reporting for pipelines.
+
+Pipelines ``await progress_callback(...)`` at every phase change.  When the
+callback does I/O (websocket push, DB write) that await would sit on the
+pipeline's critical path; the helpers here put a bounded queue and a single
+delivery task between the two.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Any progress callback: (phase, message) or (phase, message, current, total)
+AnyProgressCallback = Optional[Callable[..., Awaitable[None]]]
+
+# Progress events buffered before emitters wait for the callback to catch up
+_PROGRESS_QUEUE_SIZE = 256
+
+# Seconds a failing block waits for already-queued events to be delivered
+_FLUSH_ON_ERROR_TIMEOUT = 5.0
+
+
+@asynccontextmanager
+async def queued_progress(
+    progress_callback: AnyProgressCallback,
+) -> AsyncIterator[AnyProgressCallback]:
+    """Decouple progress reporting from the pipeline that emits it.
+
+    Yields a callback with the same call signature that only enqueues the
+    event; a single background task delivers events to ``progress_callback``
+    in order.  Callback errors are logged instead of aborting the workflow.
+    Pending events are flushed when the block exits; if it raises, the
+    flush is bounded by ``_FLUSH_ON_ERROR_TIMEOUT`` before the error
+    propagates.  A callback that is already queued is yielded unchanged.
+    """
+    if progress_callback is None or getattr(progress_callback, "queued", False):
+        yield progress_callback
+        return
+
+    queue: asyncio.Queue[tuple] = asyncio.Queue(maxsize=_PROGRESS_QUEUE_SIZE)
+
+    async def _drain() -> None:
+        while True:
+            args = await queue.get()
+            try:
+                await progress_callback(*args)
+            except Exception:
+                logger.exception("Progress callback failed")
+            finally:
+                queue.task_done()
+
+    async def _enqueue(*args) -> None:
+        try:
+            queue.put_nowait(args)
+        except asyncio.QueueFull:
+            await queue.put(args)
+
+    _enqueue.queued = True
+
+    drainer = asyncio.create_task(_drain())
+    try:
+        yield _enqueue
+        await queue.join()
+    except (Exception, asyncio.CancelledError):
+        # Deliver what was reported before the failure, without letting a
+        # stuck callback hold up the error
+        try:
+            await asyncio.wait_for(queue.join(), _FLUSH_ON_ERROR_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("Dropped %d queued progress events", queue.qsize())
+        raise
+    finally:
+        drainer.cancel()
+
+
+def with_queued_progress(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Run a pipeline with its ``progress_callback`` argument queued.
+
+    See :func:`queued_progress`.  Nested pipelines reuse the outer queue.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        callback = bound.arguments.get("progress_callback")
+        if callback is None or getattr(callback, "queued", False):
+            return await func(*args, **kwargs)
+        async with queued_progress(callback) as queued:
+            bound.arguments["progress_callback"] = queued
+            return await func(*bound.args, **bound.kwargs)
+
+    return wrapper
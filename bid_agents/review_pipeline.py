@@ -1,7 +1,7 @@
-"""Review pipeline: review-agent → compliance-checker.
+"""Review pipeline: review-agent + compliance-checker.
 
-Runs two sequential agents that review the bid document for quality
-issues and compliance gaps.
+Runs two independent agents concurrently that review the bid document for
+quality issues and compliance gaps.
 
 Usage (from FastAPI backend)::
 
@@ -14,13 +14,17 @@ Usage (from FastAPI backend)::
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections import Counter
 from typing import Awaitable, Callable, Optional
 
-from .agent_runner import create_deepseek_agent
-from .agents.prompts import review_agent, compliance_checker
+from .agent_runner import create_deepseek_agent, run_agent_streaming, tool_call_progress
+from .agents.prompts import load_prompt
 from .api.client import BidSmartAPIClient
+from .config import COMPLIANCE_TOOL_LIMIT, REVIEW_TOOL_LIMIT
 from .outline_pipeline import _load_env
+from .progress import with_queued_progress
 from .state.project_state import BidProjectState
 from .tool_adapters import build_review_agent_tools, build_compliance_checker_tools
 
@@ -29,83 +33,99 @@ logger = logging.getLogger(__name__)
 ProgressCallback = Optional[Callable[[str, str], Awaitable[None]]]
 
 
+@with_queued_progress
 async def run_review_pipeline(
     project_id: str,
     api_url: str,
     progress_callback: ProgressCallback = None,
+    state: BidProjectState | None = None,
 ) -> dict:
-    """Run review-agent → compliance-checker pipeline.
+    """Run the review-agent and compliance-checker concurrently.
 
     Args:
         project_id: The bid project ID.
         api_url: BidSmart backend base URL.
         progress_callback: ``async (phase, message) -> None``
+        state: Already loaded project state to work on (e.g. shared
+            between phases of a larger workflow).  Loaded from the backend
+            when omitted.
 
     Returns:
         Dict with ``review_feedback`` and ``compliance_matrix``.
     """
     _load_env()
 
-    api_client = BidSmartAPIClient(api_url)
-    state = BidProjectState()
+    api_client = BidSmartAPIClient.shared(api_url)
 
     try:
-        await state.load_from_backend(api_client, project_id)
+        if state is None:
+            state = BidProjectState()
+            await state.load_from_backend(api_client, project_id)
 
         # Build tools
         review_tools = build_review_agent_tools(state, api_client)
         compliance_tools = build_compliance_checker_tools(state, api_client)
 
-        # Phase 1: Quality review
+        # Quality review and compliance check are independent: each agent
+        # reads the sections and writes its own slot of the state
+        # (review_feedback vs. compliance_matrix), so run them concurrently.
         if progress_callback:
             await progress_callback("quality_review", "正在审核投标文件质量...")
+            await progress_callback("compliance_check", "正在检查合规性...")
 
-        logger.info("Starting review-agent for project %s", project_id)
         review_ag = create_deepseek_agent(
             name="review-agent",
-            system_prompt=review_agent.SYSTEM_PROMPT,
-            tools=review_tools,
-            tool_call_limit=25,
+            system_prompt=load_prompt("review_agent"),
+            tools=[review_tools],
+            tool_call_limit=REVIEW_TOOL_LIMIT,
+        )
+        compliance_ag = create_deepseek_agent(
+            name="compliance-checker",
+            system_prompt=load_prompt("compliance_checker"),
+            tools=[compliance_tools],
+            tool_call_limit=COMPLIANCE_TOOL_LIMIT,
         )
-        await review_ag.arun(
-            f"请对项目 {project_id} 的投标文件进行全面质量审核。"
-            f"先调用 get_all_sections 获取所有章节，然后逐章审核。"
+
+        logger.info("Starting review-agent and compliance-checker for project %s", project_id)
+        results = await asyncio.gather(
+            run_agent_streaming(
+                review_ag,
+                (
+                    f"请对项目 {project_id} 的投标文件进行全面质量审核。"
+                    f"先调用 get_all_sections 获取所有章节，然后逐章审核。"
+                ),
+                tool_call_progress(progress_callback),
+            ),
+            run_agent_streaming(
+                compliance_ag,
+                (
+                    f"请对项目 {project_id} 的投标文件进行合规性检查。"
+                    f"核对所有招标要求是否已在投标文件中得到响应。"
+                ),
+                tool_call_progress(progress_callback),
+            ),
+            return_exceptions=True,
         )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
         logger.info(
             "Quality review complete. Feedback for %d sections.",
             len(state.review_feedback),
         )
-
-        # Phase 2: Compliance check
-        if progress_callback:
-            await progress_callback("compliance_check", "正在检查合规性...")
-
-        logger.info("Starting compliance-checker for project %s", project_id)
-        compliance_ag = create_deepseek_agent(
-            name="compliance-checker",
-            system_prompt=compliance_checker.SYSTEM_PROMPT,
-            tools=compliance_tools,
-            tool_call_limit=20,
-        )
-        await compliance_ag.arun(
-            f"请对项目 {project_id} 的投标文件进行合规性检查。"
-            f"核对所有招标要求是否已在投标文件中得到响应。"
-        )
         logger.info(
             "Compliance check complete. %d items in checklist.",
             len(state.compliance_matrix),
         )
 
-        # Aggregate feedback statistics
-        total_findings = sum(len(f) for f in state.review_feedback.values())
-        critical = sum(
-            1 for findings in state.review_feedback.values()
-            for f in findings if f.get("severity") == "critical"
-        )
-        major = sum(
-            1 for findings in state.review_feedback.values()
-            for f in findings if f.get("severity") == "major"
-        )
+        # Aggregate feedback statistics (one pass over all findings)
+        total_findings = 0
+        severities: Counter[str] = Counter()
+        for findings in state.review_feedback.values():
+            total_findings += len(findings)
+            severities.update(f.get("severity") for f in findings)
+        critical = severities["critical"]
+        major = severities["major"]
         minor_count = total_findings - critical - major
 
         compliant = sum(1 for c in state.compliance_matrix if c.get("is_compliant"))
@@ -6,11 +6,13 @@ to multi-document document set architecture.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..api.client import BidSmartAPIClient
+    from ..models.document_set import DocumentSetItem
     from ..state.project_state import BidProjectState
 
 logger = logging.getLogger(__name__)
@@ -50,14 +52,24 @@ async def migrate_single_to_document_set(
     set_id = f"ds_{uuid.uuid4().hex[:12]}"
     now = int(time.time() * 1000)
     
-    # Get document info
-    try:
-        tree_data = await api_client.get_document_tree(state.tender_document_id)
-        tree = tree_data.get("tree", tree_data)
-    except Exception as e:
-        logger.warning("Could not fetch tree for document %s: %s", 
-                      state.tender_document_id, e)
-        tree = state.tender_tree
+    # Get document info.  The tree loaded with the project is reused
+    # without a backend call; the page count is on the get_document_tree
+    # response, so it is known only when that response is cached.
+    tree = state.tender_tree
+    if tree:
+        cached = state.document_tree_cache.get(state.tender_document_id)
+        pages = cached.get("total_pages", 0) if cached else 0
+    else:
+        pages = 0
+        try:
+            tree_data = await state.get_document_tree_cached(
+                api_client, state.tender_document_id
+            )
+            tree = tree_data.get("tree", tree_data)
+            pages = tree_data.get("total_pages", 0)
+        except Exception as e:
+            logger.warning("Could not fetch tree for document %s: %s", 
+                          state.tender_document_id, e)
     
     # Create document set
     doc_set = DocumentSet(
@@ -77,7 +89,7 @@ async def migrate_single_to_document_set(
         doc_type="tender",
         role="primary",
         order=0,
-        metadata={"pages": tree_data.get("total_pages", 0) if 'tree_data' in dir() else 0},
+        metadata={"pages": pages},
         tree=tree,
     )
     doc_set.add_item(primary_item)
@@ -187,26 +199,15 @@ async def add_historical_bid_to_set(
     if historical_doc_id in state.document_set:
         return f"历史标书 {historical_doc_id} 已在文档集中"
     
-    from ..models.document_set import DocumentSetItem
-    
     # Fetch tree
     try:
-        tree_data = await api_client.get_document_tree(historical_doc_id)
-        tree = tree_data.get("tree", tree_data)
+        tree_data = await state.get_document_tree_cached(api_client, historical_doc_id)
     except Exception as e:
         return f"获取历史标书信息失败: {e}"
     
-    # Create item
-    item = DocumentSetItem(
-        document_id=historical_doc_id,
-        name=bid_name or f"历史标书_{historical_doc_id[:8]}",
-        doc_type="historical",
-        role="reference",
-        order=len(state.document_set.items),
-        metadata={"pages": tree_data.get("total_pages", 0)},
-        tree=tree,
+    item = _historical_item(
+        historical_doc_id, bid_name, len(state.document_set.items), tree_data
     )
-    
     state.document_set.add_item(item)
     
     return (
@@ -216,6 +217,75 @@ async def add_historical_bid_to_set(
     )
 
 
+async def add_historical_bids_to_set(
+    state: BidProjectState,
+    api_client: BidSmartAPIClient,
+    bids: list[tuple[str, str]],
+) -> list[str]:
+    """Add several historical bids to the document set at once.
+
+    Document trees are fetched concurrently and the items are inserted in
+    one batch.  Bids already in the set, or whose tree cannot be fetched,
+    are skipped.
+    
+    Args:
+        state: Project state
+        api_client: API client
+        bids: ``(historical_doc_id, bid_name)`` pairs; an empty name gets
+            the default
+        
+    Returns:
+        IDs of the documents that were added
+    """
+    if not state.document_set:
+        await auto_migrate_if_needed(state, api_client)
+    
+    if not state.document_set:
+        return []
+    
+    # Skip documents already in the set; a repeated ID is added once
+    pending: dict[str, str] = {}
+    for doc_id, name in bids:
+        if doc_id not in state.document_set:
+            pending.setdefault(doc_id, name)
+    new_bids = list(pending.items())
+    tree_results = await asyncio.gather(
+        *(state.get_document_tree_cached(api_client, doc_id) for doc_id, _ in new_bids),
+        return_exceptions=True,
+    )
+    
+    order = len(state.document_set.items)
+    items = []
+    for (doc_id, name), tree_data in zip(new_bids, tree_results):
+        if isinstance(tree_data, Exception):
+            logger.warning("Could not fetch tree for historical bid %s: %s", doc_id, tree_data)
+            continue
+        if isinstance(tree_data, BaseException):
+            # Cancellation and the like are not fetch failures
+            raise tree_data
+        items.append(_historical_item(doc_id, name, order + len(items), tree_data))
+    
+    state.document_set.add_items(items)
+    return [item.document_id for item in items]
+
+
+def _historical_item(
+    doc_id: str, bid_name: str, order: int, tree_data: dict
+) -> DocumentSetItem:
+    """Build the document set item for a historical bid."""
+    from ..models.document_set import DocumentSetItem
+    
+    return DocumentSetItem(
+        document_id=doc_id,
+        name=bid_name or f"历史标书_{doc_id[:8]}",
+        doc_type="historical",
+        role="reference",
+        order=order,
+        metadata={"pages": tree_data.get("total_pages", 0)},
+        tree=tree_data.get("tree", tree_data),
+    )
+
+
 class DocumentSetCompatibilityWrapper:
     """Wrapper to provide backward-compatible interface.
     
@@ -223,6 +293,8 @@ class DocumentSetCompatibilityWrapper:
     without modification.
     """
     
+    __slots__ = ("state",)
+    
     def __init__(self, state: BidProjectState):
         self.state = state
     
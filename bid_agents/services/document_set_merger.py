@@ -6,6 +6,7 @@ structure for navigation and querying across document sets.
 
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -18,6 +19,22 @@ class TreeMerger:
     def __init__(self, document_set: DocumentSet):
         self.document_set = document_set
         self._node_to_doc_map: dict[str, str] = {}  # node_id -> document_id
+        self._merged: dict | None = None
+        # (document set version, item count) the cached state was built for
+        self._built_for: tuple[int, int] | None = None
+    
+    def invalidate(self) -> None:
+        """Drop the cached merged tree and node mappings."""
+        self._merged = None
+        self._node_to_doc_map = {}
+        self._built_for = None
+    
+    def _check_fresh(self) -> None:
+        """Invalidate if the document set changed since the last build."""
+        key = (self.document_set.version, len(self.document_set.items))
+        if self._built_for != key:
+            self.invalidate()
+            self._built_for = key
     
     def merge(self) -> dict:
         """Merge all document trees into a unified structure.
@@ -27,105 +44,143 @@ class TreeMerger:
         2. Auxiliary documents become child nodes under a special branch
         3. Node IDs are prefixed with document identifier
         
+        The result is cached until the document set changes (see
+        ``DocumentSet.mark_changed``); treat it as read-only.
+        
         Returns:
             Unified tree structure
         """
+        self._check_fresh()
+        if self._merged is None:
+            self._merged = self._build_merged()
+        return self._merged
+    
+    def _build_merged(self) -> dict:
         primary = self.document_set.get_primary_item()
         if not primary or not primary.tree:
             # No primary, create flat structure
             return self._create_flat_structure()
         
-        # Start with primary tree
-        merged_root = self._process_tree_node(
-            primary.tree, 
-            primary.document_id,
-            is_primary=True
-        )
+        # Primary tree becomes the root
+        merged_root = self._walk_forest([(primary.tree, primary.document_id, True, "")])[0]
         
-        # Add auxiliary documents as children
+        # Add auxiliary documents as children, all walked in one pass
         auxiliaries = self.document_set.get_items_by_role("auxiliary")
         if auxiliaries:
-            aux_branch = {
-                "id": "auxiliary_docs",
-                "title": "辅助文档",
-                "summary": f"共{len(auxiliaries)}个辅助文档",
-                "children": [],
-            }
-            
-            for aux in auxiliaries:
-                if aux.tree:
-                    aux_node = self._process_tree_node(
-                        aux.tree,
-                        aux.document_id,
-                        is_primary=False
-                    )
-                    aux_node["title"] = f"[{aux.name}] {aux_node['title']}"
-                    aux_branch["children"].append(aux_node)
-            
-            if aux_branch["children"]:
-                merged_root["children"].append(aux_branch)
+            aux_children = self._walk_forest([
+                (aux.tree, aux.document_id, False, f"[{aux.name}] ")
+                for aux in auxiliaries
+                if aux.tree
+            ])
+            if aux_children:
+                merged_root["children"].append({
+                    "id": "auxiliary_docs",
+                    "title": "辅助文档",
+                    "summary": f"共{len(auxiliaries)}个辅助文档",
+                    "children": aux_children,
+                })
         
         return merged_root
     
-    def _process_tree_node(
-        self, 
-        node: dict, 
-        doc_id: str,
-        is_primary: bool = True
-    ) -> dict:
-        """Process a tree node, prefixing IDs and tracking mappings.
+    def _walk_forest(self, roots: list[tuple[dict, str, bool, str]]) -> list[dict]:
+        """Copy several trees, prefixing IDs and tracking mappings.
+        
+        All trees share one explicit stack (pre-order, so mappings are
+        recorded in document order) instead of recursion: no per-node call
+        frames and no recursion limit on deep trees.
         
         Args:
-            node: Original tree node
-            doc_id: Document ID for prefixing
-            is_primary: Whether this is from primary document
+            roots: ``(tree, doc_id, is_primary, title_prefix)`` per tree;
+                ``title_prefix`` is prepended to that tree's root title
             
         Returns:
-            Processed node with prefixed IDs
+            Processed root nodes, in ``roots`` order
         """
-        original_id = node.get("id", "")
-        
-        # Create prefixed ID
-        if is_primary:
-            # Primary document keeps original IDs for backward compatibility
-            new_id = original_id
-        else:
-            # Auxiliary documents get prefixed IDs
-            new_id = f"doc_{doc_id}_{original_id}"
-        
-        # Track mapping
-        if original_id:
-            self._node_to_doc_map[new_id] = doc_id
-        
-        # Process children
-        children = []
-        for child in node.get("children", []):
-            processed_child = self._process_tree_node(child, doc_id, is_primary)
-            children.append(processed_child)
+        node_to_doc = self._node_to_doc_map
+        processed: list[dict] = []
         
-        return {
-            "id": new_id,
-            "title": node.get("title", ""),
-            "summary": node.get("summary"),
-            "ps": node.get("ps"),
-            "pe": node.get("pe"),
-            "line_start": node.get("line_start"),
-            "children": children,
-        }
+        stack: list[tuple[dict, list[dict], str, str, str]] = []
+        for tree, doc_id, is_primary, title_prefix in reversed(roots):
+            # Primary document keeps original IDs for backward compatibility;
+            # auxiliary documents get prefixed IDs.  Prefixed IDs are
+            # interned so rebuilds share one string per ID.
+            prefix = "" if is_primary else sys.intern(f"doc_{doc_id}_")
+            stack.append((tree, processed, prefix, doc_id, title_prefix))
+        
+        while stack:
+            original, siblings, prefix, doc_id, title_prefix = stack.pop()
+            original_id = original.get("id", "")
+            new_id = sys.intern(prefix + original_id) if prefix else original_id
+            
+            # Track mapping
+            if original_id:
+                node_to_doc[new_id] = doc_id
+            
+            title = original.get("title", "")
+            if title_prefix:
+                title = f"{title_prefix}{title}"
+            
+            children: list[dict] = []
+            siblings.append({
+                "id": new_id,
+                "title": title,
+                "summary": original.get("summary"),
+                "ps": original.get("ps"),
+                "pe": original.get("pe"),
+                "line_start": original.get("line_start"),
+                "children": children,
+            })
+            # Reversed so children are popped (and appended) in order
+            stack.extend(
+                (child, children, prefix, doc_id, "")
+                for child in reversed(original.get("children", []))
+            )
+        
+        return processed
+    
+    def build_mapping(self) -> dict[str, str]:
+        """Fill the node -> document mapping without building the merged tree.
+        
+        Records exactly the mappings ``merge()`` would, walking the same
+        trees in the same order but allocating no node dicts.
+        
+        Returns:
+            Dictionary mapping node_id -> document_id
+        """
+        self._check_fresh()
+        primary = self.document_set.get_primary_item()
+        if not primary or not primary.tree:
+            for item in self.document_set.get_sorted_items():
+                if item.tree:
+                    self._map_tree(item.tree, item.document_id, is_primary=False)
+            return self._node_to_doc_map
+        
+        self._map_tree(primary.tree, primary.document_id, is_primary=True)
+        for aux in self.document_set.get_items_by_role("auxiliary"):
+            if aux.tree:
+                self._map_tree(aux.tree, aux.document_id, is_primary=False)
+        return self._node_to_doc_map
+    
+    def _map_tree(self, node: dict, doc_id: str, is_primary: bool) -> None:
+        """Record node -> document mappings for one tree (pre-order)."""
+        prefix = "" if is_primary else sys.intern(f"doc_{doc_id}_")
+        node_to_doc = self._node_to_doc_map
+        
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            original_id = current.get("id", "")
+            if original_id:
+                node_to_doc[sys.intern(prefix + original_id) if prefix else original_id] = doc_id
+            stack.extend(reversed(current.get("children", [])))
     
     def _create_flat_structure(self) -> dict:
         """Create a flat structure when no primary document exists."""
-        children = []
-        
-        for item in self.document_set.get_sorted_items():
-            if item.tree:
-                node = self._process_tree_node(
-                    item.tree,
-                    item.document_id,
-                    is_primary=False
-                )
-                node["title"] = f"[{item.name}] {node['title']}"
-                children.append(node)
+        children = self._walk_forest([
+            (item.tree, item.document_id, False, f"[{item.name}] ")
+            for item in self.document_set.get_sorted_items()
+            if item.tree
+        ])
         
         return {
             "id": "root",
@@ -147,11 +202,9 @@ class TreeMerger:
         if node_id in self._node_to_doc_map:
             return self._node_to_doc_map[node_id]
         
-        # Try to extract from prefixed ID
+        # Try to extract from prefixed ID ("doc_<doc_id>_<original_id>")
         if node_id.startswith("doc_"):
-            parts = node_id.split("_", 2)
-            if len(parts) >= 2:
-                return parts[1]
+            return node_id[4:].partition("_")[0]
         
         # Default to primary document
         primary = self.document_set.get_primary_item()
@@ -160,24 +213,76 @@ class TreeMerger:
     def flatten_to_text(self) -> str:
         """Get flattened text representation of merged tree.
         
+        Produces the same text as flattening ``merge()``'s result (and
+        records the same node mappings), but emits lines straight from the
+        source trees in one walk instead of building the merged tree first.
+        
         Returns:
             Multi-line string with indented structure
         """
-        merged = self.merge()
-        return self._flatten_node(merged, 0)
-    
-    def _flatten_node(self, node: dict, depth: int) -> str:
-        """Recursively flatten a node to text."""
-        indent = "  " * depth
-        lines = [f"{indent}{node.get('title', 'Untitled')}"]
+        self._check_fresh()
+        lines: list[str] = []
         
-        if node.get("summary"):
-            lines.append(f"{indent}  摘要: {node['summary']}")
+        primary = self.document_set.get_primary_item()
+        if not primary or not primary.tree:
+            items = [item for item in self.document_set.get_sorted_items() if item.tree]
+            lines.append(self.document_set.name)
+            lines.append(f"  摘要: 文档集包含{len(items)}个文档")
+            for item in items:
+                self._emit_tree_lines(
+                    item.tree, item.document_id, False, 1, lines, f"[{item.name}] "
+                )
+            return "\n".join(lines)
         
-        for child in node.get("children", []):
-            lines.append(self._flatten_node(child, depth + 1))
+        self._emit_tree_lines(primary.tree, primary.document_id, True, 0, lines)
+        
+        auxiliaries = self.document_set.get_items_by_role("auxiliary")
+        if any(aux.tree for aux in auxiliaries):
+            lines.append("  辅助文档")
+            lines.append(f"    摘要: 共{len(auxiliaries)}个辅助文档")
+            for aux in auxiliaries:
+                if aux.tree:
+                    self._emit_tree_lines(
+                        aux.tree, aux.document_id, False, 2, lines, f"[{aux.name}] "
+                    )
         
         return "\n".join(lines)
+    
+    def _emit_tree_lines(
+        self,
+        node: dict,
+        doc_id: str,
+        is_primary: bool,
+        depth: int,
+        lines: list[str],
+        title_prefix: str = "",
+    ) -> None:
+        """Append a source tree's indented lines, tracking node mappings.
+        
+        Mirrors ``_walk_forest`` followed by flattening; ``title_prefix``
+        is prepended to the root title only.
+        """
+        prefix = "" if is_primary else sys.intern(f"doc_{doc_id}_")
+        node_to_doc = self._node_to_doc_map
+        
+        stack: list[tuple[dict, int]] = [(node, depth)]
+        while stack:
+            current, level = stack.pop()
+            original_id = current.get("id", "")
+            if original_id:
+                node_to_doc[sys.intern(prefix + original_id) if prefix else original_id] = doc_id
+            
+            indent = "  " * level
+            lines.append(f"{indent}{title_prefix}{current.get('title', '')}")
+            title_prefix = ""
+            
+            summary = current.get("summary")
+            if summary:
+                lines.append(f"{indent}  摘要: {summary}")
+            
+            stack.extend(
+                (child, level + 1) for child in reversed(current.get("children", []))
+            )
 
 
 class NodeResolver:
@@ -188,21 +293,45 @@ class NodeResolver:
         self._build_index()
     
     def _build_index(self) -> None:
-        """Build index of all nodes across documents."""
-        self._node_index: dict[str, tuple[str, dict]] = {}  # node_id -> (doc_id, node)
+        """Build index of all nodes across documents.
+        
+        Node ID -> document ID and node ID -> node are kept in two parallel
+        dicts (no per-node tuples).  A later duplicate ID overwrites an
+        earlier one, in pre-order within each tree and in item order.
+        """
+        self._doc_of: dict[str, str] = {}  # node_id -> doc_id
+        self._node_of: dict[str, dict] = {}  # node_id -> node
+        self._title_lc: dict[str, str] = {}  # node_id -> lowercased title
         
         for item in self.document_set.items:
             if item.tree:
                 self._index_tree(item.tree, item.document_id)
+        
+        # Reverse index for get_document_nodes, built from the final
+        # mappings so overwritten duplicates are not listed
+        node_of = self._node_of
+        self._nodes_by_doc: dict[str, list[dict]] = {}
+        for node_id, doc_id in self._doc_of.items():
+            self._nodes_by_doc.setdefault(doc_id, []).append(node_of[node_id])
     
     def _index_tree(self, node: dict, doc_id: str) -> None:
-        """Recursively index a tree."""
-        node_id = node.get("id")
-        if node_id:
-            self._node_index[node_id] = (doc_id, node)
+        """Index a tree (iterative pre-order walk)."""
+        doc_of = self._doc_of
+        node_of = self._node_of
+        title_lc = self._title_lc
         
-        for child in node.get("children", []):
-            self._index_tree(child, doc_id)
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            node_id = current.get("id")
+            if node_id:
+                doc_of[node_id] = doc_id
+                node_of[node_id] = current
+                title_lc[node_id] = (current.get("title") or "").lower()
+            
+            children = current.get("children")
+            if children:
+                stack.extend(reversed(children))
     
     def resolve_node(self, node_id: str) -> tuple[str, dict] | None:
         """Resolve a node ID to its document and node data.
@@ -214,19 +343,16 @@ class NodeResolver:
             Tuple of (document_id, node_data) or None
         """
         # Try exact match
-        if node_id in self._node_index:
-            return self._node_index[node_id]
+        node = self._node_of.get(node_id)
+        if node is not None:
+            return (self._doc_of[node_id], node)
         
-        # Try extracting from prefixed ID
+        # Prefixed IDs ("doc_<doc_id>_<original_id>", as produced by
+        # TreeMerger) are not indexed; resolve them via the original ID
         if node_id.startswith("doc_"):
-            parts = node_id.split("_", 2)
-            if len(parts) >= 3:
-                doc_id = parts[1]
-                original_id = parts[2]
-                if original_id in self._node_index:
-                    found_doc_id, node = self._node_index[original_id]
-                    if found_doc_id == doc_id:
-                        return (doc_id, node)
+            doc_id, sep, original_id = node_id[4:].partition("_")
+            if sep and self._doc_of.get(original_id) == doc_id:
+                return (doc_id, self._node_of[original_id])
         
         return None
     
@@ -239,14 +365,16 @@ class NodeResolver:
         Returns:
             List of (document_id, node) tuples
         """
-        results = []
         title_lower = title.lower()
+        doc_of = self._doc_of
+        node_of = self._node_of
         
-        for node_id, (doc_id, node) in self._node_index.items():
-            if title_lower in node.get("title", "").lower():
-                results.append((doc_id, node))
-        
-        return results
+        # Titles are lowercased once at index time, not per query
+        return [
+            (doc_of[node_id], node_of[node_id])
+            for node_id, node_title in self._title_lc.items()
+            if title_lower in node_title
+        ]
     
     def get_document_nodes(self, doc_id: str) -> list[dict]:
         """Get all nodes for a specific document.
@@ -257,10 +385,7 @@ class NodeResolver:
         Returns:
             List of nodes
         """
-        return [
-            node for stored_doc_id, node in self._node_index.values()
-            if stored_doc_id == doc_id
-        ]
+        return list(self._nodes_by_doc.get(doc_id, ()))
 
 
 def create_merged_tree(document_set: DocumentSet) -> dict:
@@ -285,6 +410,4 @@ def get_node_document_mapping(document_set: DocumentSet) -> dict[str, str]:
     Returns:
         Dictionary mapping node_id -> document_id
     """
-    merger = TreeMerger(document_set)
-    merger.merge()  # Build mappings
-    return merger._node_to_doc_map
+    return TreeMerger(document_set).build_mapping()
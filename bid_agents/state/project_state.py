@@ -7,22 +7,45 @@ mechanism between agents.
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import json
 import logging
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ..config import COMPANY_DATA_DIR
-from ..models.types import TenderProject, TenderSection
+from ..models.types import Node, TenderProject, TenderSection
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 if TYPE_CHECKING:
     from ..api.client import BidSmartAPIClient
     from ..models.document_set import DocumentSet
+    from ..services.document_set_merger import TreeMerger
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _read_json_file(path: str) -> dict | list:
+    """Read and parse a company_data JSON file (orjson when installed).
+
+    Cached per path for the life of the process; results are shared, so
+    treat them as read-only.  Errors are not cached.  Call
+    ``_read_json_file.cache_clear()`` after editing files on disk.
+    """
+    filepath = Path(path)
+    if orjson is not None:
+        return orjson.loads(filepath.read_bytes())
+    return json.loads(filepath.read_text(encoding="utf-8"))
+
+
 @dataclass
 class BidProjectState:
     """Shared state singleton for a bid writing session."""
@@ -54,16 +77,93 @@ class BidProjectState:
     # ── Document references (from document-finder) ──────────────────
     document_references: dict[str, list[str]] = field(default_factory=dict)  # section_id -> doc_ids
 
-    # ── Company knowledge ───────────────────────────────────────────
-    company_profile: dict | None = None
-    team_profiles: list[dict] = field(default_factory=list)
-    past_projects: list[dict] = field(default_factory=list)
-    capabilities: dict | None = None
-
     # ── Agent tracking ──────────────────────────────────────────────
     current_agent: str | None = None
     agent_status: dict[str, str] = field(default_factory=dict)  # agent_id -> status
 
+    # ── Deferred auto-save (bulk mode) ──────────────────────────────
+    defer_auto_save: bool = False
+    pending_auto_saves: dict[str, str] = field(default_factory=dict)  # section_id -> content
+
+    # ── Tender query cache (shared across concurrent agents) ────────
+    # (document_id, query) -> (expires_at, in-flight or finished chat request)
+    tender_query_cache: dict[tuple[str, str], tuple[float, asyncio.Future]] = field(
+        default_factory=dict
+    )
+    # "<handler>:<args json>" -> (expires_at, result) for read-only document tools
+    action_cache: dict[str, tuple[float, str]] = field(default_factory=dict)
+    # document_id -> get_document_tree response (see get_document_tree_cached)
+    document_tree_cache: dict[str, dict] = field(default_factory=dict)
+
+    # ── Sorted-sections memo (see get_all_sections_sorted) ──────────
+    _sections_version: int = field(default=0, init=False, repr=False)
+    _sorted_cache: tuple[tuple, list[dict]] | None = field(default=None, init=False, repr=False)
+    # (key, section_id -> position, status -> {section_id: section}); same key
+    # as _sorted_cache, status changes go through set_section_status
+    _status_cache: tuple[tuple, dict[str, int], dict[str, dict[str, dict]]] | None = field(
+        default=None, init=False, repr=False
+    )
+
+    # ── Parsed tender tree memo (see get_tender_node) ───────────────
+    # (tender_tree dict it was parsed from, root node, id -> node index)
+    _tender_node_cache: tuple[dict, Node, dict[str, Node]] | None = field(
+        default=None, init=False, repr=False
+    )
+
+    # ── Document set tree merger (see get_tree_merger) ──────────────
+    _tree_merger: TreeMerger | None = field(default=None, init=False, repr=False)
+
+    # ── Company data search indexes (see get_capability_index) ──────
+    # (capabilities dict it was built from, [(lowercased key, key, value)])
+    _capability_index: tuple[dict, list[tuple[str, str, dict]]] | None = field(
+        default=None, init=False, repr=False
+    )
+    # (team_profiles list it was built from, [(lowercased role, member)])
+    _team_role_index: tuple[list, list[tuple[str, dict]]] | None = field(
+        default=None, init=False, repr=False
+    )
+    # (past_projects list it was built from, [(search text, contract value, project)])
+    _past_project_index: tuple[list, list[tuple[str, float, dict]]] | None = field(
+        default=None, init=False, repr=False
+    )
+
+    # Fields captured by to_snapshot(); caches, agent tracking and pending
+    # saves are per-session and start empty in a restored state.  Company
+    # knowledge is not captured: a restored state loads it lazily itself.
+    _SNAPSHOT_FIELDS = (
+        "project_id", "tender_document_id", "tender_tree", "project_title",
+        "outline", "sections", "format_spec", "analysis_report",
+        "document_set_id", "review_feedback", "compliance_matrix",
+        "document_references",
+    )
+
+    def to_snapshot(self) -> dict:
+        """Return a deep-copied, plain-data (picklable) copy of the loaded state.
+
+        A stage handed the snapshot can rebuild the state with
+        :meth:`from_snapshot` instead of calling :meth:`load_from_backend`.
+        """
+        snapshot = {name: getattr(self, name) for name in self._SNAPSHOT_FIELDS}
+        snapshot["document_set"] = (
+            self.document_set.to_dict() if self.document_set else None
+        )
+        return copy.deepcopy(snapshot)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict, **kwargs) -> BidProjectState:
+        """Rebuild a state from :meth:`to_snapshot` output.
+
+        ``kwargs`` set per-session options such as ``defer_auto_save``.
+        """
+        from ..models.document_set import DocumentSet
+
+        data = copy.deepcopy(snapshot)
+        doc_set = data.pop("document_set", None)
+        state = cls(**data, **kwargs)
+        if doc_set is not None:
+            state.document_set = DocumentSet.from_dict(doc_set)
+        return state
+
     async def load_from_backend(self, api_client: BidSmartAPIClient, project_id: str) -> None:
         """Load project state from backend and local company data."""
         self.project_id = project_id
@@ -71,11 +171,13 @@ class BidProjectState:
         # Load project from backend
         try:
             project_data = await api_client.get_project(project_id)
-            project = TenderProject.from_dict(project_data)
+            project = TenderProject.from_dict(project_data, with_sections=False)
             self.tender_document_id = project.tender_document_id
             self.tender_tree = project.tender_document_tree
             self.project_title = project.title
-            self.sections = {s.id: s.to_dict() for s in project.sections}
+            sections = map(TenderSection.normalize_dict, project_data.get("sections", []))
+            self.sections = {s["id"]: s for s in sections}
+            self.mark_sections_changed()
             logger.info("Loaded project %s with %d sections", project_id, len(self.sections))
         except Exception:
             logger.warning("Could not load project %s from backend, starting fresh", project_id)
@@ -83,30 +185,129 @@ class BidProjectState:
         # Load tender tree if we have a document ID but no tree yet
         if self.tender_document_id and not self.tender_tree:
             try:
-                tree_data = await api_client.get_document_tree(self.tender_document_id)
+                tree_data = await self.get_document_tree_cached(
+                    api_client, self.tender_document_id
+                )
                 self.tender_tree = tree_data.get("tree", tree_data)
                 logger.info("Loaded tender tree for document %s", self.tender_document_id)
             except Exception:
                 logger.warning("Could not load tender tree for %s", self.tender_document_id)
 
-        # Load company data from local JSON files
-        self._load_company_data()
+        # Company data is read from local JSON files on first access (see
+        # the company_* properties below)
+
+    async def get_document_tree_cached(
+        self, api_client: BidSmartAPIClient, document_id: str, refresh: bool = False
+    ) -> dict:
+        """Fetch a document tree once per session.
+
+        Returns the raw ``get_document_tree`` response; later calls for the
+        same document reuse it.  ``refresh=True`` re-fetches and replaces the
+        cached copy.  Failed fetches are not cached.
+        """
+        if not refresh:
+            cached = self.document_tree_cache.get(document_id)
+            if cached is not None:
+                return cached
+        tree_data = await api_client.get_document_tree(document_id)
+        self.document_tree_cache[document_id] = tree_data
+        return tree_data
+
+    # ── Company knowledge ───────────────────────────────────────────
+    # Each file is read on first access and kept for the session; assigning
+    # to the attribute replaces the loaded value.
+
+    @cached_property
+    def company_profile(self) -> dict | None:
+        return self._load_json("profile.json")
+
+    @cached_property
+    def team_profiles(self) -> list[dict]:
+        return self._load_json("team.json") or []
+
+    @cached_property
+    def past_projects(self) -> list[dict]:
+        return self._load_json("past_projects.json") or []
+
+    @cached_property
+    def capabilities(self) -> dict | None:
+        return self._load_json("capabilities.json")
 
-    def _load_company_data(self) -> None:
-        """Load company knowledge from local JSON files."""
-        self.company_profile = self._load_json("profile.json")
-        self.team_profiles = self._load_json("team.json") or []
-        self.past_projects = self._load_json("past_projects.json") or []
-        self.capabilities = self._load_json("capabilities.json")
+    async def preload_company_data(self) -> None:
+        """Load all company data files concurrently, off the event loop.
+
+        For callers that know their agents will use company data (the
+        writers); the files are then read in parallel with other startup
+        work instead of one by one on first tool call.
+        """
+        await asyncio.gather(*(
+            asyncio.to_thread(getattr, self, name)
+            for name in ("company_profile", "team_profiles", "past_projects", "capabilities")
+        ))
+
+    def get_capability_index(self) -> list[tuple[str, str, dict]]:
+        """Return ``(lowercased key, key, value)`` for each capability domain.
+
+        Built once per loaded ``capabilities`` dict so domain lookups do not
+        lowercase every key on each call; rebuilt when the attribute is
+        reassigned.
+        """
+        capabilities = self.capabilities
+        if not capabilities:
+            return []
+        cached = self._capability_index
+        if cached is None or cached[0] is not capabilities:
+            index = [(key.lower(), key, value) for key, value in capabilities.items()]
+            cached = self._capability_index = (capabilities, index)
+        return cached[1]
+
+    def get_team_role_index(self) -> list[tuple[str, dict]]:
+        """Return ``(lowercased role, member)`` per team member.
+
+        Cached like get_capability_index.
+        """
+        members = self.team_profiles
+        cached = self._team_role_index
+        if cached is None or cached[0] is not members:
+            index = [(m.get("role", "").lower(), m) for m in members]
+            cached = self._team_role_index = (members, index)
+        return cached[1]
+
+    def get_past_project_index(self) -> list[tuple[str, float, dict]]:
+        """Return ``(search text, contract value, project)`` per past project.
+
+        The search text is the lowercased name, description, domain and
+        technologies joined with NUL, so one substring test covers all four
+        fields without matching across them.  Cached like
+        get_capability_index.
+        """
+        projects = self.past_projects
+        cached = self._past_project_index
+        if cached is None or cached[0] is not projects:
+            index = [
+                (
+                    "\0".join((
+                        p.get("project_name", ""),
+                        p.get("description", ""),
+                        p.get("domain", ""),
+                        " ".join(p.get("technologies", [])),
+                    )).lower(),
+                    p.get("contract_value", 0),
+                    p,
+                )
+                for p in projects
+            ]
+            cached = self._past_project_index = (projects, index)
+        return cached[1]
 
     def _load_json(self, filename: str) -> dict | list | None:
-        """Load a single JSON file from company_data/."""
+        """Load a single JSON file from company_data/ (see _read_json_file)."""
         filepath = COMPANY_DATA_DIR / filename
         if not filepath.exists():
             logger.debug("Company data file not found: %s", filepath)
             return None
         try:
-            return json.loads(filepath.read_text(encoding="utf-8"))
+            return _read_json_file(str(filepath))
         except (json.JSONDecodeError, OSError) as e:
             logger.warning("Failed to load %s: %s", filepath, e)
             return None
@@ -115,15 +316,35 @@ class BidProjectState:
         """Load a pricing template by category (hardware/software/services)."""
         return self._load_json(f"templates/pricing_{category}.json")
 
+    async def flush_auto_saves(self, api_client: BidSmartAPIClient) -> None:
+        """Send all deferred section auto-saves in one bulk request."""
+        if not self.pending_auto_saves or not self.project_id:
+            return
+
+        sections = [
+            {"section_id": section_id, "content": content}
+            for section_id, content in self.pending_auto_saves.items()
+        ]
+        self.pending_auto_saves.clear()
+
+        try:
+            await api_client.auto_save_sections_bulk(self.project_id, sections)
+            logger.info("Bulk auto-saved %d sections for project %s", len(sections), self.project_id)
+        except Exception:
+            logger.exception("Failed to bulk auto-save sections for project %s", self.project_id)
+
     async def sync_to_backend(self, api_client: BidSmartAPIClient) -> None:
         """Sync current state back to backend."""
         if not self.project_id:
             logger.warning("No project_id set, cannot sync to backend")
             return
 
-        sections_list = [
-            TenderSection.from_dict(s) for s in self.sections.values()
-        ]
+        await self.flush_auto_saves(api_client)
+
+        # Section dicts are normalized when ingested (load_from_backend,
+        # save_outline) and kept in shape by save_section_content, so the
+        # memoized sorted list is sent as is
+        sections_list = self.get_all_sections_sorted()
 
         import time
         now_ms = int(time.time() * 1000)
@@ -133,7 +354,7 @@ class BidProjectState:
             "title": self.project_title,
             "tender_document_id": self.tender_document_id or "",
             "tender_document_tree": self.tender_tree or {},
-            "sections": [s.to_dict() for s in sorted(sections_list, key=lambda x: x.order)],
+            "sections": sections_list,
             "status": "draft",
             "created_at": now_ms,
             "updated_at": now_ms,
@@ -149,20 +370,96 @@ class BidProjectState:
         """Get a section by ID."""
         return self.sections.get(section_id)
 
+    def mark_sections_changed(self) -> None:
+        """Invalidate the sorted-sections memo after adding or reordering sections."""
+        self._sections_version += 1
+
     def get_all_sections_sorted(self) -> list[dict]:
-        """Get all sections sorted by order."""
-        return sorted(self.sections.values(), key=lambda s: s.get("order", 0))
+        """Get all sections sorted by order.
+
+        The sort is memoized until ``mark_sections_changed`` is called or the
+        ``sections`` dict is replaced or resized.  Content and status updates
+        need no invalidation: the list holds the live section dicts.
+        """
+        key = self._sections_key()
+        if self._sorted_cache is None or self._sorted_cache[0] != key:
+            ordered = sorted(self.sections.values(), key=lambda s: s.get("order", 0))
+            self._sorted_cache = (key, ordered)
+        return list(self._sorted_cache[1])
+
+    def _parsed_tender_tree(self) -> tuple[dict, Node, dict[str, Node]] | None:
+        if not self.tender_tree:
+            return None
+        cached = self._tender_node_cache
+        if cached is None or cached[0] is not self.tender_tree:
+            root = Node.from_dict(self.tender_tree)
+            cached = (self.tender_tree, root, root.build_index())
+            self._tender_node_cache = cached
+        return cached
+
+    def get_tender_node(self) -> Node | None:
+        """Get ``tender_tree`` parsed into ``Node`` objects.
+
+        Parsed once per tree and reused until ``tender_tree`` is replaced.
+        """
+        parsed = self._parsed_tender_tree()
+        return parsed[1] if parsed else None
+
+    def find_tender_node(self, node_id: str) -> Node | None:
+        """Look up a tender tree node by ID via the cached index."""
+        parsed = self._parsed_tender_tree()
+        return parsed[2].get(node_id) if parsed else None
+
+    def _sections_key(self) -> tuple:
+        return (self._sections_version, id(self.sections), len(self.sections))
+
+    def _status_buckets(self) -> dict[str, dict[str, dict]]:
+        """Return sections grouped by status, in ``sections`` order.
+
+        Rebuilt under the same conditions as the sorted-sections memo;
+        status changes made through ``set_section_status`` update it in place.
+        """
+        key = self._sections_key()
+        cached = self._status_cache
+        if cached is None or cached[0] != key:
+            positions: dict[str, int] = {}
+            buckets: dict[str, dict[str, dict]] = {}
+            for position, (section_id, section) in enumerate(self.sections.items()):
+                positions[section_id] = position
+                buckets.setdefault(section.get("status"), {})[section_id] = section
+            cached = self._status_cache = (key, positions, buckets)
+        return cached[2]
+
+    def set_section_status(self, section_id: str, status: str) -> None:
+        """Set a section's status, keeping the status index current."""
+        section = self.sections[section_id]
+        old_status = section.get("status")
+        section["status"] = status
+        cached = self._status_cache
+        if old_status == status or cached is None or cached[0] != self._sections_key():
+            return
+        _, positions, buckets = cached
+        old_bucket = buckets.get(old_status)
+        if old_bucket is not None:
+            old_bucket.pop(section_id, None)
+        bucket = buckets.setdefault(status, {})
+        in_order = not bucket or positions[next(reversed(bucket))] < positions[section_id]
+        bucket[section_id] = section
+        if not in_order:
+            # Keep the bucket in sections order
+            buckets[status] = dict(sorted(bucket.items(), key=lambda kv: positions[kv[0]]))
 
     def get_sections_by_status(self, status: str) -> list[dict]:
         """Get sections filtered by status."""
-        return [s for s in self.sections.values() if s.get("status") == status]
+        return list(self._status_buckets().get(status, {}).values())
 
     def get_progress_summary(self) -> dict:
         """Get a summary of writing progress."""
         total = len(self.sections)
-        completed = len(self.get_sections_by_status("completed"))
-        in_progress = len(self.get_sections_by_status("in_progress"))
-        pending = len(self.get_sections_by_status("pending"))
+        buckets = self._status_buckets()
+        completed = len(buckets.get("completed", ()))
+        in_progress = len(buckets.get("in_progress", ()))
+        pending = len(buckets.get("pending", ()))
         return {
             "total": total,
             "completed": completed,
@@ -203,6 +500,21 @@ class BidProjectState:
             "auxiliary_count": len(self.document_set.get_items_by_role("auxiliary")),
         }
 
+    def get_tree_merger(self) -> TreeMerger | None:
+        """Return a TreeMerger for the current document set, reused across calls.
+
+        The merger caches its merged tree until the document set changes;
+        a new one is created when ``document_set`` is replaced.
+        """
+        if not self.document_set:
+            return None
+        merger = self._tree_merger
+        if merger is None or merger.document_set is not self.document_set:
+            from ..services.document_set_merger import TreeMerger
+
+            merger = self._tree_merger = TreeMerger(self.document_set)
+        return merger
+
     def is_using_document_set(self) -> bool:
         """Check if using document set (multi-document mode)."""
         return self.document_set is not None
@@ -0,0 +1,61 @@
+"""Tests for the shared DeepSeek model."""
+
+import asyncio
+import copy
+import threading
+
+from bid_agents.agent_runner import _get_model
+
+
+def test_model_async_client_per_event_loop(monkeypatch):
+    monkeypatch.setenv("DEEPSEEK_API_KEY", "test-key")
+    model = _get_model("deepseek-chat", 0.3)
+
+    async def get_client():
+        client = model.get_async_client()
+        assert model.get_async_client() is client
+        return client
+
+    # A second asyncio.run must not reuse the first loop's connection pool
+    assert asyncio.run(get_client()) is not asyncio.run(get_client())
+
+
+def test_model_async_client_per_thread_loop(monkeypatch):
+    monkeypatch.setenv("DEEPSEEK_API_KEY", "test-key")
+    model = _get_model("deepseek-chat", 0.3)
+    barrier = threading.Barrier(2)
+    results = {}
+
+    async def get_client(name):
+        client = model.get_async_client()
+        # Let the other thread register its loop's client before checking
+        await asyncio.to_thread(barrier.wait)
+        results[name] = (client, model.get_async_client())
+
+    threads = [
+        threading.Thread(target=asyncio.run, args=(get_client(name),))
+        for name in ("a", "b")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    (first_a, again_a), (first_b, again_b) = results["a"], results["b"]
+    assert first_a is again_a
+    assert first_b is again_b
+    assert first_a is not first_b
+    assert model.async_client is None
+
+
+def test_model_deepcopy_leaves_clients(monkeypatch):
+    monkeypatch.setenv("DEEPSEEK_API_KEY", "test-key")
+    model = _get_model("deepseek-chat", 0.3)
+
+    async def check():
+        client = model.get_async_client()
+        copied = copy.deepcopy(model)
+        assert copied.get_async_client() is not client
+        assert model.get_async_client() is client
+
+    asyncio.run(check())
@@ -0,0 +1,47 @@
+"""Tests for the shared backend API client."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from bid_agents.api.client import BidSmartAPIClient, close_shared_clients
+
+
+class _ProjectHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"id": self.path.rsplit("/", 1)[-1]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_shared_client_across_event_loops():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ProjectHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    async def fetch(project_id):
+        client = BidSmartAPIClient.shared(url)
+        assert BidSmartAPIClient.shared(url) is client
+        return client, await client.get_project(project_id)
+
+    try:
+        # Back-to-back asyncio.run calls: the second must not reuse the
+        # first loop's connection pool
+        first, project = asyncio.run(fetch("p1"))
+        assert project == {"id": "p1"}
+        second, project = asyncio.run(fetch("p2"))
+        assert project == {"id": "p2"}
+        assert second is not first
+        asyncio.run(close_shared_clients())
+    finally:
+        server.shutdown()
+        server.server_close()
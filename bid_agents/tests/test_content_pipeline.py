@@ -0,0 +1,53 @@
+"""Tests for the content pipeline."""
+
+import asyncio
+import types
+
+from bid_agents import content_pipeline
+from bid_agents.content_pipeline import classify_section, is_parallel_safe
+from bid_agents.state.project_state import BidProjectState
+
+
+def test_classify_pricing():
+    assert classify_section("分项报价表", "各项费用明细") == "pricing"
+
+
+def test_classify_commercial():
+    assert classify_section("投标函", "法人授权委托书") == "commercial"
+
+
+def test_classify_technical():
+    assert classify_section("技术方案", "系统架构设计与实施计划") == "technical"
+
+
+def test_classify_counts_distinct_keywords():
+    # Repeating one keyword must not outweigh several distinct ones.
+    assert classify_section("报价报价报价", "技术方案架构设计") == "technical"
+
+
+def test_is_parallel_safe():
+    assert is_parallel_safe("技术方案", "系统架构设计")
+    assert not is_parallel_safe("商务偏离表", "")
+    assert not is_parallel_safe("方案总结", "汇总前述章节")
+
+
+def test_failed_section_recorded_in_agent_status(monkeypatch):
+    agent = types.SimpleNamespace(name="technical-writer")
+    monkeypatch.setattr(
+        content_pipeline, "_build_writer_agents",
+        lambda state, api_client: dict.fromkeys(("commercial", "technical", "pricing"), agent),
+    )
+
+    async def fail(agent, instruction, on_tool_call):
+        raise RuntimeError("model unavailable")
+
+    monkeypatch.setattr(content_pipeline, "run_agent_streaming", fail)
+
+    # No project_id, so the final sync is skipped
+    state = BidProjectState()
+    state.sections = {"s1": {"id": "s1", "title": "技术方案", "status": "pending", "order": 1}}
+    result = asyncio.run(content_pipeline.run_content_pipeline(
+        project_id="p1", api_url="http://127.0.0.1:9", state=state,
+    ))
+    assert [f["section_id"] for f in result["failed"]] == ["s1"]
+    assert state.agent_status == {"technical-writer:s1": "failed"}
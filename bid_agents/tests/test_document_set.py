@@ -0,0 +1,28 @@
+"""Tests for the DocumentSet model."""
+
+from bid_agents.models.document_set import DocumentSet, DocumentSetItem
+
+
+def _item(doc_id, order, role="auxiliary"):
+    return DocumentSetItem(
+        document_id=doc_id, name=doc_id, doc_type="reference", role=role, order=order
+    )
+
+
+def test_add_item_to_unsorted_items():
+    # Primary-first order, as left by set_primary_document or the backend
+    doc_set = DocumentSet(
+        id="ds-1", name="文档集",
+        items=[_item("p", 5, "primary"), _item("a", 0), _item("b", 1)],
+    )
+    doc_set.add_item(_item("x", 3))
+    assert [i.document_id for i in doc_set.items] == ["a", "b", "x", "p"]
+    assert doc_set.get_item_by_doc_id("x").order == 3
+
+
+def test_add_items_keeps_orders_unique():
+    doc_set = DocumentSet(id="ds-1", name="文档集", items=[_item("a", 0), _item("b", 1)])
+    doc_set.add_items([_item("c", 1), _item("d", 1)])
+    assert [(i.document_id, i.order) for i in doc_set.items] == [
+        ("a", 0), ("b", 1), ("c", 2), ("d", 3),
+    ]
@@ -0,0 +1,112 @@
+"""Tests for document set migration helpers."""
+
+import asyncio
+
+import pytest
+
+from bid_agents.services.document_set_compat import (
+    _historical_item,
+    add_historical_bids_to_set,
+    migrate_single_to_document_set,
+)
+from bid_agents.state.project_state import BidProjectState
+
+
+class _TreeClient:
+    """Stub API client serving get_document_tree from a dict."""
+
+    def __init__(self, trees=None, failing=()):
+        self.trees = trees or {}
+        self.failing = set(failing)
+        self.calls = []
+
+    async def get_document_tree(self, document_id):
+        self.calls.append(document_id)
+        if document_id in self.failing:
+            raise RuntimeError(f"fetch failed: {document_id}")
+        return self.trees[document_id]
+
+
+def _tree(doc_id):
+    return {"id": f"{doc_id}-root", "title": doc_id}
+
+
+def _primary(state):
+    return state.document_set.get_primary_item()
+
+
+def test_migrate_reuses_loaded_tree_without_fetching():
+    client = _TreeClient()
+    state = BidProjectState(project_id="p1", tender_document_id="d1", tender_tree=_tree("d1"))
+    asyncio.run(migrate_single_to_document_set(state, client))
+    assert client.calls == []
+    assert _primary(state).tree == _tree("d1")
+    assert _primary(state).metadata == {"pages": 0}
+
+
+def test_migrate_takes_pages_from_cached_response():
+    client = _TreeClient()
+    state = BidProjectState(project_id="p1", tender_document_id="d1", tender_tree=_tree("d1"))
+    state.document_tree_cache["d1"] = {"tree": _tree("d1"), "total_pages": 42}
+    asyncio.run(migrate_single_to_document_set(state, client))
+    assert client.calls == []
+    assert _primary(state).metadata == {"pages": 42}
+
+
+def test_migrate_fetches_tree_when_not_loaded():
+    client = _TreeClient({"d1": {"tree": _tree("d1"), "total_pages": 7}})
+    state = BidProjectState(project_id="p1", tender_document_id="d1")
+    asyncio.run(migrate_single_to_document_set(state, client))
+    assert client.calls == ["d1"]
+    assert _primary(state).tree == _tree("d1")
+    assert _primary(state).metadata == {"pages": 7}
+
+
+def _with_set(client, *doc_ids):
+    state = BidProjectState(project_id="p1", tender_document_id="d1", tender_tree=_tree("d1"))
+    asyncio.run(migrate_single_to_document_set(state, client))
+    for doc_id in doc_ids:
+        state.document_set.add_item(_historical_item(doc_id, "", len(state.document_set.items),
+                                                     {"tree": _tree(doc_id)}))
+    return state
+
+
+def test_add_historical_bids_dedupes_and_skips():
+    client = _TreeClient(
+        {doc_id: {"tree": _tree(doc_id), "total_pages": 3} for doc_id in ("h1", "h3")},
+        failing={"h2"},
+    )
+    state = _with_set(client, "h0")
+    added = asyncio.run(add_historical_bids_to_set(
+        state, client,
+        [("h0", "已存在"), ("h1", "甲"), ("h1", "重复"), ("h2", "失败"), ("h3", "")],
+    ))
+    assert added == ["h1", "h3"]
+    # Each new ID is fetched once; IDs already in the set are not fetched
+    assert sorted(client.calls) == ["h1", "h2", "h3"]
+    items = {item.document_id: item for item in state.document_set.items}
+    assert items["h1"].name == "甲"
+    assert items["h3"].name == "历史标书_h3"
+    assert items["h1"].metadata == {"pages": 3}
+    # Orders keep increasing past the skipped entries
+    assert items["h0"].order < items["h1"].order < items["h3"].order
+    assert len({item.order for item in state.document_set.items}) == len(items)
+
+
+def test_add_historical_bids_migrates_first():
+    client = _TreeClient({"h1": {"tree": _tree("h1")}})
+    state = BidProjectState(project_id="p1", tender_document_id="d1", tender_tree=_tree("d1"))
+    added = asyncio.run(add_historical_bids_to_set(state, client, [("h1", "甲")]))
+    assert added == ["h1"]
+    assert _primary(state).document_id == "d1"
+    assert [item.document_id for item in state.document_set.get_sorted_items()] == ["d1", "h1"]
+
+
+def test_add_historical_bids_reraises_cancellation():
+    class _CancelledClient(_TreeClient):
+        async def get_document_tree(self, document_id):
+            raise asyncio.CancelledError()
+
+    state = BidProjectState(project_id="p1", tender_document_id="d1", tender_tree=_tree("d1"))
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(add_historical_bids_to_set(state, _CancelledClient(), [("h1", "甲")]))
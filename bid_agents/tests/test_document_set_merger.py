@@ -0,0 +1,71 @@
+"""Tests for document set tree merging."""
+
+from bid_agents.models.document_set import DocumentSet
+from bid_agents.services.document_set_merger import NodeResolver, TreeMerger
+
+
+def _document_set(*items):
+    return DocumentSet.from_dict({"id": "ds-1", "name": "文档集", "items": list(items)})
+
+
+def _deep_tree(prefix, depth):
+    data = {"id": f"{prefix}0", "title": "L0"}
+    current = data
+    for i in range(1, depth):
+        child = {"id": f"{prefix}{i}", "title": f"L{i}"}
+        current["children"] = [child]
+        current = child
+    return data
+
+
+def test_merge_prefixes_auxiliary_ids():
+    doc_set = _document_set(
+        {"document_id": "main", "name": "招标文件", "role": "primary",
+         "tree": {"id": "root", "title": "招标文件", "children": [{"id": "c1", "title": "第一章"}]}},
+        {"document_id": "aux", "name": "附件", "role": "auxiliary",
+         "tree": {"id": "root", "title": "附件目录"}},
+    )
+    merger = TreeMerger(doc_set)
+    merged = merger.merge()
+    aux_branch = merged["children"][-1]
+    assert aux_branch["id"] == "auxiliary_docs"
+    assert aux_branch["children"][0]["id"] == "doc_aux_root"
+    assert aux_branch["children"][0]["title"] == "[附件] 附件目录"
+    assert merger.get_node_document_id("c1") == "main"
+    assert merger.get_node_document_id("doc_aux_root") == "aux"
+
+
+def test_flatten_to_text_matches_merged_tree():
+    doc_set = _document_set(
+        {"document_id": "main", "name": "招标文件", "role": "primary",
+         "tree": {"id": "root", "title": "招标文件", "summary": "概述",
+                  "children": [{"id": "c1", "title": "第一章"}]}},
+        {"document_id": "aux", "name": "附件", "role": "auxiliary",
+         "tree": {"id": "a", "title": "附件目录"}},
+    )
+    assert TreeMerger(doc_set).flatten_to_text().splitlines() == [
+        "招标文件",
+        "  摘要: 概述",
+        "  第一章",
+        "  辅助文档",
+        "    摘要: 共1个辅助文档",
+        "    [附件] 附件目录",
+    ]
+
+
+def test_deep_trees_beyond_recursion_limit():
+    doc_set = _document_set(
+        {"document_id": "main", "name": "招标文件", "role": "primary",
+         "tree": _deep_tree("n", 5000)},
+        {"document_id": "aux", "name": "附件", "role": "auxiliary",
+         "tree": _deep_tree("m", 5000)},
+    )
+    merger = TreeMerger(doc_set)
+    merger.merge()
+    assert merger.get_node_document_id("doc_aux_m4999") == "aux"
+    assert len(merger.flatten_to_text().splitlines()) == 5000 + 2 + 5000
+
+    resolver = NodeResolver(doc_set)
+    assert resolver.resolve_node("n4999")[0] == "main"
+    assert resolver.resolve_node("doc_aux_m4999")[1]["title"] == "L4999"
+    assert len(resolver.get_document_nodes("aux")) == 5000
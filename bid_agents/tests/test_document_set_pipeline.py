@@ -0,0 +1,19 @@
+"""Tests for the document set pipelines."""
+
+import asyncio
+
+from bid_agents.pipelines.document_set_pipeline import run_document_set_writing_pipeline
+from bid_agents.state.project_state import BidProjectState
+
+
+def test_writing_pipeline_leaves_defer_auto_save_unchanged():
+    state = BidProjectState(project_id="p1")
+    # The section is not in the outline, so nothing is written
+    result = asyncio.run(run_document_set_writing_pipeline(
+        project_id="p1",
+        api_url="http://127.0.0.1:9",
+        section_id="missing",
+        state=state,
+    ))
+    assert result["written"] == 0
+    assert state.defer_auto_save is False
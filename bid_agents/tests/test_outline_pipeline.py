@@ -0,0 +1,51 @@
+"""Tests for the outline pipeline."""
+
+import asyncio
+
+from bid_agents import outline_pipeline
+
+
+def test_batch_limits_concurrency_and_keeps_order(monkeypatch):
+    running = 0
+    peak = 0
+    failure = RuntimeError("backend unavailable")
+
+    async def fake_run(project_id, api_url, user_requirements, attachment_names,
+                       progress_callback):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            await progress_callback("outline", "started")
+            # Later projects finish first so order comes from the input
+            await asyncio.sleep(0.01 * (5 - int(project_id[1:])))
+            if project_id == "p2":
+                raise failure
+            return [{"id": project_id, "requirements": user_requirements,
+                     "attachments": attachment_names}]
+        finally:
+            running -= 1
+
+    monkeypatch.setattr(outline_pipeline, "run_outline_pipeline", fake_run)
+    messages = []
+
+    async def on_progress(phase, msg):
+        messages.append((phase, msg))
+
+    projects = [{"project_id": f"p{i}"} for i in range(5)]
+    projects[0]["user_requirements"] = "需要三级目录"
+    projects[0]["attachment_names"] = ["报价表"]
+    results = asyncio.run(outline_pipeline.run_outline_pipeline_batch(
+        projects, "http://backend", max_concurrency=2,
+        progress_callback=on_progress,
+    ))
+
+    assert peak == 2
+    assert results[2] is failure
+    assert [r[0]["id"] for i, r in enumerate(results) if i != 2] == [
+        "p0", "p1", "p3", "p4"]
+    assert results[0][0]["requirements"] == "需要三级目录"
+    assert results[0][0]["attachments"] == ["报价表"]
+    assert results[1][0]["requirements"] is None
+    assert sorted(messages) == [
+        ("outline", f"[p{i}] started") for i in range(5)]
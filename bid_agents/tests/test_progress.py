@@ -0,0 +1,121 @@
+"""Tests for queued progress reporting."""
+
+import asyncio
+
+import pytest
+
+from bid_agents import progress
+from bid_agents.progress import queued_progress, with_queued_progress
+
+
+def _recorder(delay=0.0):
+    events = []
+
+    async def callback(*args):
+        await asyncio.sleep(delay)
+        events.append(args)
+
+    return events, callback
+
+
+def test_events_delivered_in_order():
+    events, callback = _recorder()
+
+    async def main():
+        async with queued_progress(callback) as report:
+            for i in range(10):
+                await report("step", f"m{i}")
+
+    asyncio.run(main())
+    assert events == [("step", f"m{i}") for i in range(10)]
+
+
+def test_flushed_on_exit():
+    events, callback = _recorder(delay=0.01)
+
+    async def main():
+        async with queued_progress(callback) as report:
+            await report("a", "1")
+            await report("b", "2")
+            # Enqueueing does not wait for the slow callback
+            assert events == []
+        assert events == [("a", "1"), ("b", "2")]
+
+    asyncio.run(main())
+
+
+def test_flushed_when_block_raises():
+    events, callback = _recorder(delay=0.01)
+
+    async def main():
+        async with queued_progress(callback) as report:
+            await report("a", "1")
+            await report("b", "2")
+            raise ValueError("phase failed")
+
+    with pytest.raises(ValueError):
+        asyncio.run(main())
+    assert events == [("a", "1"), ("b", "2")]
+
+
+def test_flush_on_error_is_bounded(monkeypatch):
+    monkeypatch.setattr(progress, "_FLUSH_ON_ERROR_TIMEOUT", 0.01)
+
+    async def stuck(*args):
+        await asyncio.sleep(3600)
+
+    async def main():
+        async with queued_progress(stuck) as report:
+            await report("a", "1")
+            raise ValueError("phase failed")
+
+    with pytest.raises(ValueError):
+        asyncio.run(main())
+
+
+def test_callback_errors_are_logged_not_raised():
+    events, record = _recorder()
+
+    async def callback(phase, msg):
+        if phase == "bad":
+            raise RuntimeError("push failed")
+        await record(phase, msg)
+
+    async def main():
+        async with queued_progress(callback) as report:
+            await report("bad", "x")
+            await report("ok", "y")
+
+    asyncio.run(main())
+    assert events == [("ok", "y")]
+
+
+def test_nested_queued_callback_passes_through():
+    events, callback = _recorder()
+    seen = []
+
+    @with_queued_progress
+    async def inner(progress_callback=None):
+        seen.append(progress_callback)
+        await progress_callback("inner", "x")
+
+    @with_queued_progress
+    async def outer(progress_callback=None):
+        seen.append(progress_callback)
+        await inner(progress_callback=progress_callback)
+
+    asyncio.run(outer(progress_callback=callback))
+    assert seen[0] is seen[1]
+    assert seen[0].queued
+    assert events == [("inner", "x")]
+
+
+def test_queued_callback_yielded_unchanged():
+    async def main():
+        async with queued_progress(None) as none_cb:
+            assert none_cb is None
+        async with queued_progress(print) as queued:
+            async with queued_progress(queued) as nested:
+                assert nested is queued
+
+    asyncio.run(main())
@@ -0,0 +1,143 @@
+"""Tests for BidProjectState section indexes and snapshots."""
+
+import asyncio
+
+from bid_agents.models.document_set import DocumentSet
+from bid_agents.state.project_state import BidProjectState
+from bid_agents.tools.project_tools import save_section_content
+
+
+def _sections(*statuses):
+    return {
+        f"s{i}": {"id": f"s{i}", "title": f"第{i}章", "status": status, "order": i}
+        for i, status in enumerate(statuses, 1)
+    }
+
+
+def _ids(sections):
+    return [s["id"] for s in sections]
+
+
+def test_status_change_into_earlier_position_keeps_sections_order():
+    state = BidProjectState(sections=_sections("pending", "completed", "pending", "completed"))
+    assert _ids(state.get_sections_by_status("completed")) == ["s2", "s4"]
+    # s1 precedes both sections already in the completed bucket
+    state.set_section_status("s1", "completed")
+    assert _ids(state.get_sections_by_status("completed")) == ["s1", "s2", "s4"]
+    assert _ids(state.get_sections_by_status("pending")) == ["s3"]
+    state.set_section_status("s3", "completed")
+    assert _ids(state.get_sections_by_status("completed")) == ["s1", "s2", "s3", "s4"]
+    assert state.get_sections_by_status("pending") == []
+
+
+def test_direct_section_writes_after_mark_sections_changed():
+    state = BidProjectState(sections=_sections("pending", "pending"))
+    assert _ids(state.get_sections_by_status("pending")) == ["s1", "s2"]
+    state.sections["s1"]["status"] = "completed"
+    state.mark_sections_changed()
+    assert _ids(state.get_sections_by_status("pending")) == ["s2"]
+    assert _ids(state.get_sections_by_status("completed")) == ["s1"]
+    # Adding a section changes the count, which also invalidates the index
+    state.sections["s0"] = {"id": "s0", "title": "前言", "status": "pending", "order": 0}
+    assert _ids(state.get_sections_by_status("pending")) == ["s2", "s0"]
+    assert _ids(state.get_all_sections_sorted()) == ["s0", "s1", "s2"]
+
+
+def test_replacing_sections_dict_rebuilds_index():
+    state = BidProjectState(sections=_sections("pending", "pending"))
+    assert len(state.get_sections_by_status("pending")) == 2
+    # Same size, new dict
+    state.sections = _sections("completed", "in_progress")
+    assert state.get_sections_by_status("pending") == []
+    assert _ids(state.get_sections_by_status("completed")) == ["s1"]
+    assert _ids(state.get_sections_by_status("in_progress")) == ["s2"]
+
+
+def test_progress_summary_after_save_section_content():
+    state = BidProjectState(sections=_sections("pending", "pending", "pending", "pending"))
+    assert state.get_progress_summary()["pending"] == 4
+
+    async def save():
+        await save_section_content(state, None, "s3", "内容", status="completed")
+        await save_section_content(state, None, "s1", "草稿")  # in_progress
+        await save_section_content(state, None, "s4", "内容", status="completed")
+
+    asyncio.run(save())
+    assert state.get_progress_summary() == {
+        "total": 4, "completed": 2, "in_progress": 1, "pending": 1, "percentage": 50.0,
+    }
+    assert _ids(state.get_sections_by_status("completed")) == ["s3", "s4"]
+
+
+def _loaded_state():
+    state = BidProjectState(
+        project_id="p1",
+        tender_document_id="d1",
+        tender_tree={"id": "root", "title": "招标文件", "children": [{"id": "c1", "title": "第一章"}]},
+        project_title="项目",
+        outline=[{"id": "s1", "title": "第1章"}],
+        sections=_sections("pending", "completed"),
+        format_spec={"has_format_requirement": True},
+        document_set=DocumentSet.from_dict({
+            "id": "ds-1", "name": "文档集",
+            "items": [{"document_id": "d1", "name": "招标文件", "role": "primary",
+                       "tree": {"id": "root", "title": "招标文件"}}],
+        }),
+    )
+    state.document_tree_cache["d1"] = {"tree": state.tender_tree, "total_pages": 3}
+    state.action_cache["get_doc_tree:{}"] = (0.0, "cached")
+    state.agent_status["technical-writer:s1"] = "failed"
+    state.pending_auto_saves["s1"] = "草稿"
+    state.company_profile = {"name": "公司"}
+    state.get_all_sections_sorted()
+    state.get_tender_node()
+    return state
+
+
+def test_snapshot_round_trip_preserves_project_data():
+    state = _loaded_state()
+    restored = BidProjectState.from_snapshot(state.to_snapshot())
+    assert restored.project_id == "p1"
+    assert restored.tender_tree == state.tender_tree
+    assert restored.outline == state.outline
+    assert restored.sections == state.sections
+    assert restored.format_spec == state.format_spec
+    assert restored.document_set.to_dict() == state.document_set.to_dict()
+    assert _ids(restored.get_all_sections_sorted()) == ["s1", "s2"]
+    assert restored.find_tender_node("c1").title == "第一章"
+
+
+def test_restored_state_is_independent():
+    state = _loaded_state()
+    restored = BidProjectState.from_snapshot(state.to_snapshot())
+    restored.sections["s1"]["content"] = "新内容"
+    restored.set_section_status("s1", "completed")
+    restored.outline.append({"id": "s3"})
+    restored.tender_tree["children"].clear()
+    restored.document_set.items[0].name = "改名"
+    assert "content" not in state.sections["s1"]
+    assert state.sections["s1"]["status"] == "pending"
+    assert len(state.outline) == 1
+    assert state.tender_tree["children"]
+    assert state.document_set.items[0].name == "招标文件"
+    assert _ids(state.get_sections_by_status("pending")) == ["s1"]
+
+
+def test_snapshot_leaves_out_caches_and_company_data():
+    snapshot = _loaded_state().to_snapshot()
+    restored = BidProjectState.from_snapshot(snapshot)
+    assert restored.document_tree_cache == {}
+    assert restored.action_cache == {}
+    assert restored.tender_query_cache == {}
+    assert restored.agent_status == {}
+    assert restored.pending_auto_saves == {}
+    assert "company_profile" not in snapshot
+    # Company data is loaded lazily by the restored state itself
+    assert "company_profile" not in vars(restored)
+
+
+def test_from_snapshot_applies_session_options():
+    snapshot = _loaded_state().to_snapshot()
+    assert BidProjectState.from_snapshot(snapshot).defer_auto_save is False
+    restored = BidProjectState.from_snapshot(snapshot, defer_auto_save=True)
+    assert restored.defer_auto_save is True
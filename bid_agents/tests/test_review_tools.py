@@ -0,0 +1,25 @@
+"""Tests for review and compliance tools."""
+
+import asyncio
+
+from bid_agents.state.project_state import BidProjectState
+from bid_agents.tools.project_tools import get_all_sections
+from bid_agents.tools.review_tools import get_compliance_checklist, get_review_context
+
+
+def test_review_context_combines_sections_and_checklist():
+    state = BidProjectState(
+        project_id="p1",
+        tender_tree={"id": "r", "title": "资质要求", "summary": "须具备相关资质"},
+    )
+    state.sections = {
+        "s1": {"id": "s1", "title": "资质证明", "content": "资质要求 已提供",
+               "status": "completed", "order": 1},
+    }
+    sections = asyncio.run(get_all_sections(state, None))
+    checklist = asyncio.run(get_compliance_checklist(state))
+
+    context = asyncio.run(get_review_context(state, None))
+    assert context == f"## 章节列表\n\n{sections}\n\n## 合规检查清单\n\n{checklist}"
+    assert "[s1] 资质证明" in sections
+    assert "| ✓ | r |" in checklist
@@ -0,0 +1,52 @@
+"""Tests for tender query tools."""
+
+import asyncio
+
+from bid_agents.state.project_state import BidProjectState
+from bid_agents.tools.tender_tools import batch_query_tender_requirements
+
+
+class _ChatClient:
+    def __init__(self):
+        self.questions = []
+
+    async def chat_with_document(self, question, tree, document_id):
+        self.questions.append(question)
+        if question == "商务要求":
+            raise RuntimeError("backend unavailable")
+        return {"answer": f"{question}的答案", "sources": [{"title": "第三章"}]}
+
+
+def _state():
+    return BidProjectState(
+        project_id="p1", tender_document_id="d1", tender_tree={"id": "root", "title": "招标文件"},
+    )
+
+
+def test_batch_query_combines_answers_in_order():
+    client = _ChatClient()
+    result = asyncio.run(batch_query_tender_requirements(
+        _state(), client, '["评分标准", "商务要求", "资格要求"]'
+    ))
+    assert result.split("\n\n") == [
+        "## 评分标准\n评分标准的答案",
+        "来源章节: 第三章",
+        "## 商务要求\n查询招标要求失败: backend unavailable",
+        "## 资格要求\n资格要求的答案",
+        "来源章节: 第三章",
+    ]
+    assert sorted(client.questions) == ["商务要求", "评分标准", "资格要求"]
+
+
+def test_batch_query_rejects_bad_input():
+    client = _ChatClient()
+    assert asyncio.run(
+        batch_query_tender_requirements(_state(), client, "评分标准")
+    ).startswith("错误：queries_json 不是有效的JSON")
+    assert asyncio.run(
+        batch_query_tender_requirements(_state(), client, "[]")
+    ) == "错误：queries_json 必须是非空的JSON数组"
+    assert asyncio.run(
+        batch_query_tender_requirements(_state(), client, '{"q": "评分标准"}')
+    ) == "错误：queries_json 必须是非空的JSON数组"
+    assert client.questions == []
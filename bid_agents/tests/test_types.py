@@ -64,6 +64,21 @@ def test_node_find_node():
     assert node.find_node("nonexistent") is None
 
 
+def test_node_build_index_matches_find_node():
+    node = Node(
+        id="root",
+        title="Root",
+        children=[
+            Node(id="a", title="A", children=[Node(id="dup", title="first")]),
+            Node(id="dup", title="second"),
+        ],
+    )
+    index = node.build_index()
+    assert set(index) == {"root", "a", "dup"}
+    assert index["dup"] is node.find_node("dup")
+    assert index["dup"].title == "first"
+
+
 def test_node_to_dict_roundtrip():
     original = {
         "id": "root",
@@ -77,6 +92,20 @@ def test_node_to_dict_roundtrip():
     assert result["children"][0]["summary"] == "S"
 
 
+def test_node_deep_tree_beyond_recursion_limit():
+    data = {"id": "n0", "title": "L0"}
+    current = data
+    for i in range(1, 5000):
+        child = {"id": f"n{i}", "title": f"L{i}"}
+        current["children"] = [child]
+        current = child
+
+    node = Node.from_dict(data)
+    assert node.find_node("n4999").title == "L4999"
+    assert node.to_dict()["children"][0]["id"] == "n1"
+    assert node.flatten().splitlines()[-1] == "  " * 4999 + "L4999"
+
+
 def test_outline_section_from_dict():
     data = {
         "id": "sec-1",
@@ -116,3 +145,15 @@ def test_tender_section_to_dict():
     d = section.to_dict()
     assert d["word_count"] == len("Some content here")
     assert d["status"] == "in_progress"
+
+
+def test_tender_section_normalize_dict_matches_roundtrip():
+    raw = {"id": "s1", "title": "技术方案", "content": "内容", "order": 3}
+    assert TenderSection.normalize_dict(raw) == TenderSection.from_dict(raw).to_dict()
+
+
+def test_tender_section_normalize_dict_keeps_normalized_input():
+    normalized = TenderSection(id="s1", title="技术方案", content="内容").to_dict()
+    assert TenderSection.normalize_dict(normalized) is normalized
+    stale = dict(normalized, word_count=0)
+    assert TenderSection.normalize_dict(stale)["word_count"] == len("内容")
@@ -1,18 +1,24 @@
-"""Adapter layer that converts existing bid_agents tools to agno Function format.
+"""Adapter layer that converts existing bid_agents tools to agno Toolkits.
 
 This module wraps the core logic from bid_agents/tools/ into agno ``Function``
-objects compatible with agno's ``Agent``.  The original tool files are NOT modified.
+objects, grouped into one ``Toolkit`` per agent type, compatible with agno's
+``Agent``.  The original tool files are NOT modified.
 """
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
 import time
+from importlib import import_module
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Awaitable, Callable
 
 from agno.tools.function import Function
+from agno.tools.toolkit import Toolkit
+
+from .config import ACTION_CACHE_TTL
 
 if TYPE_CHECKING:
     from .api.client import BidSmartAPIClient
@@ -20,259 +26,215 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# Import tool functions directly from tools modules
-from .tools.tender_tools import query_tender_requirements as _query_tender_requirements_impl, get_tender_tree as _get_tender_tree_impl
-from .tools.project_tools import save_outline as _save_outline_impl, save_section_content as _save_section_content_impl, get_section_content as _get_section_content_impl, get_all_sections as _get_all_sections_impl
-from .tools.format_tools import save_format_spec as _save_format_spec_impl
-from .tools.analysis_tools import save_analysis_report as _save_analysis_report_impl, validate_scoring_criteria as _validate_scoring_criteria_impl, extract_key_data as _extract_key_data_impl
-from .tools.document_tools import search_documents as _search_documents_impl, get_document_metadata as _get_document_metadata_impl, list_documents_by_category as _list_documents_by_category_impl, get_document_tree as _get_document_tree_impl
-from .tools.company_tools import get_company_profile as _get_company_profile_impl, get_company_capabilities as _get_company_capabilities_impl, get_team_profiles as _get_team_profiles_impl, search_past_projects as _search_past_projects_impl
-from .tools.pricing_tools import get_pricing_templates as _get_pricing_templates_impl, calculate_totals as _calculate_totals_impl
-from .tools.formatting_tools import format_table as _format_table_impl, export_document as _export_document_impl
-from .tools.review_tools import submit_review_feedback as _submit_review_feedback_impl, get_compliance_checklist as _get_compliance_checklist_impl
-
-
-# =============================================================================
-# Tender tools — handlers
-# =============================================================================
-
-async def _run_tender_query(
-    state: BidProjectState, api_client: BidSmartAPIClient,
-    query: str = "", node_ids: str = "",
-) -> str:
-    """Call query_tender_requirements from tender_tools.py."""
-    return await _query_tender_requirements_impl(state, api_client, query, node_ids)
-
-
-async def _run_get_tree(
-    state: BidProjectState, api_client: BidSmartAPIClient,
-    document_id: str = "",
-) -> str:
-    """Call get_tender_tree from tender_tools.py."""
-    return await _get_tender_tree_impl(state, api_client, document_id)
-
-
-# =============================================================================
-# Format tools — handlers
-# =============================================================================
-
-async def _run_save_format_spec(state: BidProjectState, format_spec_json: str) -> str:
-    """Call save_format_spec from format_tools.py."""
-    return await _save_format_spec_impl(state, format_spec_json)
-
-
-# =============================================================================
-# Analysis tools — handlers
-# =============================================================================
-
-async def _run_save_analysis_report(state: BidProjectState, report_json: str) -> str:
-    """Call save_analysis_report from analysis_tools.py."""
-    return await _save_analysis_report_impl(state, report_json)
-
-
-async def _run_validate_scoring_criteria(state: BidProjectState, scoring_json: str) -> str:
-    """Call validate_scoring_criteria from analysis_tools.py."""
-    return await _validate_scoring_criteria_impl(state, scoring_json)
-
-
-async def _run_extract_key_data(state: BidProjectState, node_id: str, data_types: str) -> str:
-    """Call extract_key_data from analysis_tools.py."""
-    return await _extract_key_data_impl(state, node_id, data_types)
+# Tool implementations live in tools/; each module is imported on first use
+# (see _LazyImpls) so loading this module does not pull in all of them.
+_LAZY_IMPLS = {
+    "query_tender_requirements": ".tools.tender_tools",
+    "batch_query_tender_requirements": ".tools.tender_tools",
+    "get_tender_tree": ".tools.tender_tools",
+    "save_outline": ".tools.project_tools",
+    "save_section_content": ".tools.project_tools",
+    "get_section_content": ".tools.project_tools",
+    "get_all_sections": ".tools.project_tools",
+    "save_format_spec": ".tools.format_tools",
+    "save_analysis_report": ".tools.analysis_tools",
+    "validate_scoring_criteria": ".tools.analysis_tools",
+    "extract_key_data": ".tools.analysis_tools",
+    "search_documents": ".tools.document_tools",
+    "get_document_metadata": ".tools.document_tools",
+    "list_documents_by_category": ".tools.document_tools",
+    "get_document_tree": ".tools.document_tools",
+    "get_company_profile": ".tools.company_tools",
+    "get_company_capabilities": ".tools.company_tools",
+    "get_team_profiles": ".tools.company_tools",
+    "search_past_projects": ".tools.company_tools",
+    "get_pricing_templates": ".tools.pricing_tools",
+    "calculate_totals": ".tools.pricing_tools",
+    "format_table": ".tools.formatting_tools",
+    "export_document": ".tools.formatting_tools",
+    "submit_review_feedback": ".tools.review_tools",
+    "get_compliance_checklist": ".tools.review_tools",
+    "get_review_context": ".tools.review_tools",
+}
+
+
+class _LazyImpls:
+    """Namespace of tool implementations, resolved from ``_LAZY_IMPLS``.
+
+    The first access imports the tool module and caches the function on the
+    instance, so later calls are a plain attribute lookup.
+    """
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[str]]:
+        module_name = _LAZY_IMPLS.get(name)
+        if module_name is None:
+            raise AttributeError(name)
+        impl = getattr(import_module(module_name, __package__), name)
+        setattr(self, name, impl)
+        return impl
+
+
+_impl = _LazyImpls()
 
 
 # =============================================================================
-# Project tools — handlers
+# Read-only action cache
 # =============================================================================
 
-async def _run_save_outline(
-    state: BidProjectState, api_client: BidSmartAPIClient,
-    sections_json: str,
-) -> str:
-    """Call save_outline from project_tools.py."""
-    return await _save_outline_impl(state, api_client, sections_json)
+def _is_error_result(result: str) -> bool:
+    """Tool implementations report failures as text; never cache those."""
+    first_line = result.split("\n", 1)[0]
+    return first_line.startswith("错误") or "失败:" in first_line
 
 
-async def _run_save_section_content(
-    state: BidProjectState, api_client: BidSmartAPIClient,
-    section_id: str, content: str, status: str = "in_progress",
-) -> str:
-    """Call save_section_content from project_tools.py."""
-    return await _save_section_content_impl(state, api_client, section_id, content, status)
+def _action_cache(name: str) -> Callable[..., Awaitable[str]]:
+    """Return a caller for the read-only tool ``name`` that caches on ``state``.
 
+    Results are keyed on the tool name and its arguments and reused for
+    ``ACTION_CACHE_TTL`` seconds, so agents asking for the same backend data
+    within one run skip the HTTP round trip.  Only use this for tools whose
+    result depends solely on backend data that does not change during a run.
+    """
 
-async def _run_get_section_content(state: BidProjectState, api_client: BidSmartAPIClient, section_id: str) -> str:
-    """Call get_section_content from project_tools.py."""
-    return await _get_section_content_impl(state, api_client, section_id)
+    async def cached_call(state: BidProjectState, api_client: BidSmartAPIClient, *args) -> str:
+        key = f"{name}:{json.dumps(args, ensure_ascii=False)}"
+        now = time.monotonic()
+        cached = state.action_cache.get(key)
+        if cached and cached[0] > now:
+            logger.debug("[cache-hit] %s (%d chars)", name, len(cached[1]))
+            return cached[1]
 
+        result = await getattr(_impl, name)(state, api_client, *args)
+        if not _is_error_result(result):
+            state.action_cache[key] = (now + ACTION_CACHE_TTL, result)
+        return result
 
-async def _run_get_all_sections(state: BidProjectState, api_client: BidSmartAPIClient) -> str:
-    """Call get_all_sections from project_tools.py."""
-    return await _get_all_sections_impl(state, api_client)
-
-
-# =============================================================================
-# Company tools — handlers
-# =============================================================================
+    cached_call.__name__ = cached_call.__qualname__ = f"cached_{name}"
+    return cached_call
 
-async def _run_get_company_profile(state: BidProjectState) -> str:
-    """Call get_company_profile from company_tools.py."""
-    return await _get_company_profile_impl(state)
 
-
-async def _run_get_company_capabilities(state: BidProjectState, domain: str = "") -> str:
-    """Call get_company_capabilities from company_tools.py."""
-    return await _get_company_capabilities_impl(state, domain)
-
-
-async def _run_get_team_profiles(state: BidProjectState, roles: str = "") -> str:
-    """Call get_team_profiles from company_tools.py."""
-    return await _get_team_profiles_impl(state, roles)
-
-
-async def _run_search_past_projects(
-    state: BidProjectState, query: str = "", min_contract_value: float = 0.0,
-) -> str:
-    """Call search_past_projects from company_tools.py."""
-    return await _search_past_projects_impl(state, query, min_contract_value)
+_cached_search_documents = _action_cache("search_documents")
+_cached_get_document_metadata = _action_cache("get_document_metadata")
+_cached_list_documents_by_category = _action_cache("list_documents_by_category")
+_cached_get_document_tree = _action_cache("get_document_tree")
 
 
 # =============================================================================
-# Document tools — handlers
+# Toolkit with precomputed schemas
 # =============================================================================
 
-async def _run_search_documents(
-    state: BidProjectState, api_client: BidSmartAPIClient, query: str = "", category: str = "",
-) -> str:
-    """Call search_documents from document_tools.py."""
-    return await _search_documents_impl(state, api_client, query, category)
-
-
-async def _run_get_document_metadata(state: BidProjectState, api_client: BidSmartAPIClient, document_id: str) -> str:
-    """Call get_document_metadata from document_tools.py."""
-    return await _get_document_metadata_impl(state, api_client, document_id)
-
-
-async def _run_list_documents_by_category(state: BidProjectState, api_client: BidSmartAPIClient, category: str = "") -> str:
-    """Call list_documents_by_category from document_tools.py."""
-    return await _list_documents_by_category_impl(state, api_client, category)
-
-
-async def _run_get_document_tree_tool(
-    state: BidProjectState, api_client: BidSmartAPIClient, document_id: str,
-) -> str:
-    """Call get_document_tree from document_tools.py."""
-    return await _get_document_tree_impl(state, api_client, document_id)
-
-
-# =============================================================================
-# Pricing tools — handlers
-# =============================================================================
-
-async def _run_get_pricing_templates(state: BidProjectState, category: str = "") -> str:
-    """Call get_pricing_templates from pricing_tools.py."""
-    return await _get_pricing_templates_impl(state, category)
-
-
-def _num_to_chinese(num: float) -> str:
-    """Convert a number to Chinese uppercase currency representation."""
-    digits = "零壹贰叁肆伍陆柒捌玖"
-    units = ["", "拾", "佰", "仟"]
-    big_units = ["", "万", "亿"]
-
-    total_fen = round(num * 100)
-    yuan = total_fen // 100
-    jiao = (total_fen // 10) % 10
-    fen = total_fen % 10
-
-    if yuan == 0:
-        result = "零元"
-    else:
-        result = ""
-        yuan_str = str(yuan)
-        length = len(yuan_str)
-
-        for i, ch in enumerate(yuan_str):
-            d = int(ch)
-            pos = length - 1 - i
-            group_pos = pos % 4
-            big_pos = pos // 4
-
-            if d != 0:
-                result += digits[d] + units[group_pos]
-            else:
-                if result and not result.endswith("零"):
-                    result += "零"
-
-            if group_pos == 0 and big_pos > 0:
-                result = result.rstrip("零")
-                result += big_units[big_pos]
-
-        result = result.rstrip("零") + "元"
-
-    if jiao > 0:
-        result += digits[jiao] + "角"
-    if fen > 0:
-        result += digits[fen] + "分"
-    elif jiao == 0:
-        result += "整"
-
-    return result
-
-
-async def _run_calculate_totals(state: BidProjectState, items_json: str, tax_rate: float = 0.13) -> str:
-    """Call calculate_totals from pricing_tools.py."""
-    return await _calculate_totals_impl(state, items_json, tax_rate)
-
-
-# =============================================================================
-# Review tools — handlers
-# =============================================================================
-
-async def _run_submit_review_feedback(
-    state: BidProjectState, section_id: str, findings_json: str,
-) -> str:
-    """Call submit_review_feedback from review_tools.py."""
-    return await _submit_review_feedback_impl(state, section_id, findings_json)
-
-
-async def _run_get_compliance_checklist(state: BidProjectState) -> str:
-    """Call get_compliance_checklist from review_tools.py."""
-    return await _get_compliance_checklist_impl(state)
-
-
-# =============================================================================
-# Formatting tools — handlers
-# =============================================================================
-
-async def _run_format_table(state: BidProjectState, api_client: BidSmartAPIClient, headers: str, rows_json: str) -> str:
-    """Call format_table from formatting_tools.py."""
-    return await _format_table_impl(state, api_client, headers, rows_json)
-
-
-async def _run_export_document(
-    state: BidProjectState, api_client: BidSmartAPIClient,
-    format: str = "word", include_outline: bool = True,
-) -> str:
-    """Call export_document from formatting_tools.py."""
-    return await _export_document_impl(state, api_client, format, include_outline)
+HandlerFactory = Callable[
+    ["BidProjectState", "BidSmartAPIClient"], list[Callable[..., Awaitable[str]]]
+]
+
+
+class BidToolkit(Toolkit):
+    """agno Toolkit holding one agent type's tools bound to a state.
+
+    Parameter schemas are parsed from the handler signatures and docstrings
+    once, when the first toolkit of an agent type is built, and the
+    resulting ``Function`` objects are marked ``skip_entrypoint_processing``
+    so agno does not re-derive them for every ``Agent`` or run.
+    ``clone_with_state`` rebinds the handlers to another state/client pair
+    and reuses those schemas.
+    """
+
+    def __init__(self, name: str, factory: HandlerFactory, functions: list[Function]):
+        super().__init__(name=name, auto_register=False)
+        self._factory = factory
+        self.tools = functions
+        for function in functions:
+            self.async_functions[function.name] = function
+
+    @classmethod
+    def from_factory(
+        cls,
+        name: str,
+        factory: HandlerFactory,
+        state: BidProjectState,
+        api_client: BidSmartAPIClient,
+    ) -> BidToolkit:
+        """Build a toolkit, deriving each tool's schema from its handler."""
+        functions = []
+        for handler in factory(state, api_client):
+            key = _schema_key(handler)
+            schema = _FUNCTION_SCHEMAS.get(key)
+            if schema is None:
+                schema = Function.from_callable(handler)
+                schema.process_entrypoint()
+                schema.skip_entrypoint_processing = True
+                _FUNCTION_SCHEMAS[key] = schema
+            function = copy.copy(schema)
+            function.entrypoint = handler
+            functions.append(function)
+        return cls(name, factory, functions)
+
+    def clone_with_state(
+        self, state: BidProjectState, api_client: BidSmartAPIClient
+    ) -> BidToolkit:
+        """Return a copy of this toolkit whose handlers close over ``state``."""
+        return self._rebind(self._factory(state, api_client))
+
+    def _rebind(self, handlers: list) -> BidToolkit:
+        functions = []
+        for function, handler in zip(self.tools, handlers):
+            bound = copy.copy(function)
+            bound.entrypoint = handler
+            functions.append(bound)
+        return type(self)(self.name, self._factory, functions)
+
+
+# agent type -> first toolkit built for it (schema template)
+_TOOLKIT_TEMPLATES: dict[str, BidToolkit] = {}
+
+# Handlers with the same name, docstring and signature (e.g. the
+# query_tender_requirements tool several agents share) get one schema.
+_FUNCTION_SCHEMAS: dict[tuple, Function] = {}
+
+
+def _schema_key(handler: Callable) -> tuple:
+    """Everything Function.from_callable derives a tool schema from."""
+    return (
+        handler.__name__,
+        handler.__doc__,
+        handler.__defaults__,
+        tuple(handler.__annotations__.items()),
+    )
+
+
+def _build_toolkit(
+    name: str,
+    factory: HandlerFactory,
+    state: BidProjectState,
+    api_client: BidSmartAPIClient,
+) -> BidToolkit:
+    """Return a toolkit for ``name`` bound to ``state``, reusing cached schemas."""
+    template = _TOOLKIT_TEMPLATES.get(name)
+    if template is not None:
+        return template.clone_with_state(state, api_client)
+
+    toolkit = BidToolkit.from_factory(name, factory, state, api_client)
+    # Keep only the schemas; the template must not pin this run's state.
+    _TOOLKIT_TEMPLATES[name] = toolkit._rebind([None] * len(toolkit.tools))
+    return toolkit
 
 
 # =============================================================================
-# Tool builders for each agent
+# Tool handlers for each agent
 # =============================================================================
 
-def build_format_extractor_tools(
+def _format_extractor_handlers(
     state: BidProjectState, api_client: BidSmartAPIClient
-) -> list[Function]:
-    """Build agno Function list for the format-extractor agent."""
+) -> list[Callable[..., Awaitable[str]]]:
+    """Tool handlers for the format-extractor agent, closed over ``state``."""
 
     async def query_tender_requirements(query: str = "", node_ids: str = "") -> str:
         """根据关键词或章节ID查询招标文档中的具体要求和内容"""
-        return await _run_tender_query(state, api_client, query, node_ids)
+        return await _impl.query_tender_requirements(state, api_client, query, node_ids)
 
     async def get_tender_tree(document_id: str = "") -> str:
         """获取招标文档的完整树形结构，包含所有章节标题和摘要"""
-        return await _run_get_tree(state, api_client, document_id)
+        return await _impl.get_tender_tree(state, api_client, document_id)
 
     async def save_format_spec(format_spec_json: str) -> str:
         """保存从招标文件中提取的投标格式要求规范
@@ -280,19 +242,19 @@ def build_format_extractor_tools(
         Args:
             format_spec_json: 格式规范的JSON字符串，包含 has_format_requirement, source_section, required_structure, additional_rules
         """
-        return await _run_save_format_spec(state, format_spec_json)
+        return await _impl.save_format_spec(state, format_spec_json)
 
     return [
-        Function.from_callable(query_tender_requirements),
-        Function.from_callable(get_tender_tree),
-        Function.from_callable(save_format_spec),
+        query_tender_requirements,
+        get_tender_tree,
+        save_format_spec,
     ]
 
 
-def build_outline_planner_tools(
+def _outline_planner_handlers(
     state: BidProjectState, api_client: BidSmartAPIClient
-) -> list[Function]:
-    """Build agno Function list for the outline-planner agent."""
+) -> list[Callable[..., Awaitable[str]]]:
+    """Tool handlers for the outline-planner agent, closed over ``state``."""
 
     async def query_tender_requirements(query: str = "", node_ids: str = "") -> str:
         """根据关键词或章节ID查询招标文档中的具体要求和内容
@@ -301,7 +263,7 @@ def build_outline_planner_tools(
             query: 查询关键词，如'技术要求'、'评分标准'、'投标格式规范'
             node_ids: 章节ID列表(逗号分隔)，用于精确查询
         """
-        return await _run_tender_query(state, api_client, query, node_ids)
+        return await _impl.query_tender_requirements(state, api_client, query, node_ids)
 
     async def get_tender_tree(document_id: str = "") -> str:
         """获取招标文档的完整树形结构，包含所有章节标题和摘要
@@ -309,7 +271,7 @@ def build_outline_planner_tools(
         Args:
             document_id: 文档ID（可选，默认使用当前项目的招标文档）
         """
-        return await _run_get_tree(state, api_client, document_id)
+        return await _impl.get_tender_tree(state, api_client, document_id)
 
     async def save_outline(sections_json: str) -> str:
         """保存AI生成的投标文件大纲到项目中，将大纲章节转换为可编辑的投标章节
@@ -317,19 +279,19 @@ def build_outline_planner_tools(
         Args:
             sections_json: 大纲章节JSON数组，每个元素包含 id, title, description, requirementSummary, order
         """
-        return await _run_save_outline(state, api_client, sections_json)
+        return await _impl.save_outline(state, api_client, sections_json)
 
     return [
-        Function.from_callable(query_tender_requirements),
-        Function.from_callable(get_tender_tree),
-        Function.from_callable(save_outline),
+        query_tender_requirements,
+        get_tender_tree,
+        save_outline,
     ]
 
 
-def build_document_finder_tools(
+def _document_finder_handlers(
     state: BidProjectState, api_client: BidSmartAPIClient
-) -> list[Function]:
-    """Build agno Function list for the document-finder agent."""
+) -> list[Callable[..., Awaitable[str]]]:
+    """Tool handlers for the document-finder agent, closed over ``state``."""
 
     async def search_documents(query: str = "", category: str = "") -> str:
         """搜索公司文档库中的资质文件、执照、合同、业绩证明等扫描件
@@ -338,7 +300,7 @@ def build_document_finder_tools(
             query: 搜索关键词，如'营业执照'、'ISO认证'、'中标通知书'
             category: 文档分类，如'资质文件'、'业绩证明'、'合同'
         """
-        return await _run_search_documents(state, api_client, query, category)
+        return await _cached_search_documents(state, api_client, query, category)
 
     async def get_document_metadata(document_id: str) -> str:
         """获取指定文档的详细元数据信息（文件名、大小、解析状态等）
@@ -346,7 +308,7 @@ def build_document_finder_tools(
         Args:
             document_id: 文档ID
         """
-        return await _run_get_document_metadata(state, api_client, document_id)
+        return await _cached_get_document_metadata(state, api_client, document_id)
 
     async def list_documents_by_category(category: str = "") -> str:
         """按类别列出所有已解析文档（如：资质文件、业绩证明、合同等）
@@ -354,7 +316,7 @@ def build_document_finder_tools(
         Args:
             category: 文档分类
         """
-        return await _run_list_documents_by_category(state, api_client, category)
+        return await _cached_list_documents_by_category(state, api_client, category)
 
     async def get_document_tree(document_id: str) -> str:
         """获取指定文档的解析后树形结构
@@ -362,20 +324,20 @@ def build_document_finder_tools(
         Args:
             document_id: 文档ID
         """
-        return await _run_get_document_tree_tool(state, api_client, document_id)
+        return await _cached_get_document_tree(state, api_client, document_id)
 
     return [
-        Function.from_callable(search_documents),
-        Function.from_callable(get_document_metadata),
-        Function.from_callable(list_documents_by_category),
-        Function.from_callable(get_document_tree),
+        search_documents,
+        get_document_metadata,
+        list_documents_by_category,
+        get_document_tree,
     ]
 
 
-def build_commercial_writer_tools(
+def _commercial_writer_handlers(
     state: BidProjectState, api_client: BidSmartAPIClient
-) -> list[Function]:
-    """Build agno Function list for the commercial-bid-writer agent."""
+) -> list[Callable[..., Awaitable[str]]]:
+    """Tool handlers for the commercial-bid-writer agent, closed over ``state``."""
 
     async def query_tender_requirements(query: str = "", node_ids: str = "") -> str:
         """根据关键词或章节ID查询招标文档中的具体要求和内容
@@ -384,7 +346,7 @@ def build_commercial_writer_tools(
             query: 查询关键词，如'商务条款'、'付款条件'、'投标保证金'
             node_ids: 章节ID列表(逗号分隔)
         """
-        return await _run_tender_query(state, api_client, query, node_ids)
+        return await _impl.query_tender_requirements(state, api_client, query, node_ids)
 
     async def save_section_content(section_id: str, content: str, status: str = "completed") -> str:
         """保存或更新投标章节的内容
@@ -394,7 +356,7 @@ def build_commercial_writer_tools(
             content: 章节内容
             status: 章节状态(pending/in_progress/completed)
         """
-        return await _run_save_section_content(state, api_client, section_id, content, status)
+        return await _impl.save_section_content(state, api_client, section_id, content, status)
 
     async def get_section_content(section_id: str) -> str:
         """获取指定投标章节的当前内容
@@ -402,11 +364,11 @@ def build_commercial_writer_tools(
         Args:
             section_id: 章节ID
         """
-        return await _run_get_section_content(state, api_client, section_id)
+        return await _impl.get_section_content(state, api_client, section_id)
 
     async def get_company_profile() -> str:
         """获取公司基础信息（名称、注册号、法人、资质等级、银行账户等）"""
-        return await _run_get_company_profile(state)
+        return await _impl.get_company_profile(state)
 
     async def get_pricing_templates(category: str = "") -> str:
         """获取标准报价表模板（hardware=硬件, software=软件, services=服务）
@@ -414,7 +376,7 @@ def build_commercial_writer_tools(
         Args:
             category: 模板类别 (hardware/software/services)
         """
-        return await _run_get_pricing_templates(state, category)
+        return await _impl.get_pricing_templates(state, category)
 
     async def format_table(headers: str, rows_json: str) -> str:
         """将数据格式化为标准Markdown表格
@@ -423,22 +385,22 @@ def build_commercial_writer_tools(
             headers: 表头(逗号分隔)，如'序号,项目,数量,单价,合计'
             rows_json: 行数据JSON数组
         """
-        return await _run_format_table(state, api_client, headers, rows_json)
+        return await _impl.format_table(state, api_client, headers, rows_json)
 
     return [
-        Function.from_callable(query_tender_requirements),
-        Function.from_callable(save_section_content),
-        Function.from_callable(get_section_content),
-        Function.from_callable(get_company_profile),
-        Function.from_callable(get_pricing_templates),
-        Function.from_callable(format_table),
+        query_tender_requirements,
+        save_section_content,
+        get_section_content,
+        get_company_profile,
+        get_pricing_templates,
+        format_table,
     ]
 
 
-def build_technical_writer_tools(
+def _technical_writer_handlers(
     state: BidProjectState, api_client: BidSmartAPIClient
-) -> list[Function]:
-    """Build agno Function list for the technical-bid-writer agent."""
+) -> list[Callable[..., Awaitable[str]]]:
+    """Tool handlers for the technical-bid-writer agent, closed over ``state``."""
 
     async def query_tender_requirements(query: str = "", node_ids: str = "") -> str:
         """根据关键词或章节ID查询招标文档中的具体要求和内容
@@ -447,7 +409,7 @@ def build_technical_writer_tools(
             query: 查询关键词，如'技术要求'、'性能指标'、'系统架构'
             node_ids: 章节ID列表(逗号分隔)
         """
-        return await _run_tender_query(state, api_client, query, node_ids)
+        return await _impl.query_tender_requirements(state, api_client, query, node_ids)
 
     async def save_section_content(section_id: str, content: str, status: str = "completed") -> str:
         """保存或更新投标章节的内容
@@ -457,7 +419,7 @@ def build_technical_writer_tools(
             content: 章节内容
             status: 章节状态(pending/in_progress/completed)
         """
-        return await _run_save_section_content(state, api_client, section_id, content, status)
+        return await _impl.save_section_content(state, api_client, section_id, content, status)
 
     async def get_section_content(section_id: str) -> str:
         """获取指定投标章节的当前内容
@@ -465,7 +427,7 @@ def build_technical_writer_tools(
         Args:
             section_id: 章节ID
         """
-        return await _run_get_section_content(state, api_client, section_id)
+        return await _impl.get_section_content(state, api_client, section_id)
 
     async def get_company_capabilities(domain: str = "") -> str:
         """获取公司在指定领域的技术能力描述
@@ -473,7 +435,7 @@ def build_technical_writer_tools(
         Args:
             domain: 领域名称，如'IT'、'软件开发'、'集成服务'
         """
-        return await _run_get_company_capabilities(state, domain)
+        return await _impl.get_company_capabilities(state, domain)
 
     async def search_past_projects(query: str = "", min_contract_value: float = 0.0) -> str:
         """搜索公司过往项目业绩（可按关键词和最低合同金额筛选）
@@ -482,7 +444,7 @@ def build_technical_writer_tools(
             query: 搜索关键词
             min_contract_value: 最低合同金额(万元)
         """
-        return await _run_search_past_projects(state, query, min_contract_value)
+        return await _impl.search_past_projects(state, query, min_contract_value)
 
     async def get_team_profiles(roles: str = "") -> str:
         """获取项目团队成员信息（按角色筛选：项目经理、技术总监等）
@@ -490,22 +452,22 @@ def build_technical_writer_tools(
         Args:
             roles: 角色筛选(逗号分隔)，如'项目经理,技术总监'
         """
-        return await _run_get_team_profiles(state, roles)
+        return await _impl.get_team_profiles(state, roles)
 
     return [
-        Function.from_callable(query_tender_requirements),
-        Function.from_callable(save_section_content),
-        Function.from_callable(get_section_content),
-        Function.from_callable(get_company_capabilities),
-        Function.from_callable(search_past_projects),
-        Function.from_callable(get_team_profiles),
+        query_tender_requirements,
+        save_section_content,
+        get_section_content,
+        get_company_capabilities,
+        search_past_projects,
+        get_team_profiles,
     ]
 
 
-def build_pricing_calculator_tools(
+def _pricing_calculator_handlers(
     state: BidProjectState, api_client: BidSmartAPIClient
-) -> list[Function]:
-    """Build agno Function list for the pricing-calculator agent."""
+) -> list[Callable[..., Awaitable[str]]]:
+    """Tool handlers for the pricing-calculator agent, closed over ``state``."""
 
     async def query_tender_requirements(query: str = "", node_ids: str = "") -> str:
         """根据关键词或章节ID查询招标文档中的具体要求和内容
@@ -514,7 +476,7 @@ def build_pricing_calculator_tools(
             query: 查询关键词，如'报价要求'、'限价'、'付款方式'
             node_ids: 章节ID列表(逗号分隔)
         """
-        return await _run_tender_query(state, api_client, query, node_ids)
+        return await _impl.query_tender_requirements(state, api_client, query, node_ids)
 
     async def get_pricing_templates(category: str = "") -> str:
         """获取标准报价表模板（hardware=硬件, software=软件, services=服务）
@@ -522,7 +484,7 @@ def build_pricing_calculator_tools(
         Args:
             category: 模板类别 (hardware/software/services)
         """
-        return await _run_get_pricing_templates(state, category)
+        return await _impl.get_pricing_templates(state, category)
 
     async def calculate_totals(items_json: str, tax_rate: float = 0.13) -> str:
         """计算报价汇总：从明细项计算小计、税费和总价
@@ -531,7 +493,7 @@ def build_pricing_calculator_tools(
             items_json: 明细项JSON数组，每项包含 name, quantity, unit_price
             tax_rate: 税率(默认0.13即13%)
         """
-        return await _run_calculate_totals(state, items_json, tax_rate)
+        return await _impl.calculate_totals(state, items_json, tax_rate)
 
     async def format_table(headers: str, rows_json: str) -> str:
         """将数据格式化为标准Markdown表格
@@ -540,7 +502,7 @@ def build_pricing_calculator_tools(
             headers: 表头(逗号分隔)
             rows_json: 行数据JSON数组
         """
-        return await _run_format_table(state, api_client, headers, rows_json)
+        return await _impl.format_table(state, api_client, headers, rows_json)
 
     async def save_section_content(section_id: str, content: str, status: str = "completed") -> str:
         """保存或更新投标章节的内容
@@ -550,7 +512,7 @@ def build_pricing_calculator_tools(
             content: 章节内容
             status: 章节状态
         """
-        return await _run_save_section_content(state, api_client, section_id, content, status)
+        return await _impl.save_section_content(state, api_client, section_id, content, status)
 
     async def get_section_content(section_id: str) -> str:
         """获取指定投标章节的当前内容
@@ -558,22 +520,22 @@ def build_pricing_calculator_tools(
         Args:
             section_id: 章节ID
         """
-        return await _run_get_section_content(state, api_client, section_id)
+        return await _impl.get_section_content(state, api_client, section_id)
 
     return [
-        Function.from_callable(query_tender_requirements),
-        Function.from_callable(get_pricing_templates),
-        Function.from_callable(calculate_totals),
-        Function.from_callable(format_table),
-        Function.from_callable(save_section_content),
-        Function.from_callable(get_section_content),
+        query_tender_requirements,
+        get_pricing_templates,
+        calculate_totals,
+        format_table,
+        save_section_content,
+        get_section_content,
     ]
 
 
-def build_review_agent_tools(
+def _review_agent_handlers(
     state: BidProjectState, api_client: BidSmartAPIClient
-) -> list[Function]:
-    """Build agno Function list for the review-agent."""
+) -> list[Callable[..., Awaitable[str]]]:
+    """Tool handlers for the review-agent, closed over ``state``."""
 
     async def query_tender_requirements(query: str = "", node_ids: str = "") -> str:
         """根据关键词或章节ID查询招标文档中的具体要求和内容
@@ -582,7 +544,7 @@ def build_review_agent_tools(
             query: 查询关键词
             node_ids: 章节ID列表(逗号分隔)
         """
-        return await _run_tender_query(state, api_client, query, node_ids)
+        return await _impl.query_tender_requirements(state, api_client, query, node_ids)
 
     async def get_section_content(section_id: str) -> str:
         """获取指定投标章节的当前内容
@@ -590,11 +552,11 @@ def build_review_agent_tools(
         Args:
             section_id: 章节ID
         """
-        return await _run_get_section_content(state, api_client, section_id)
+        return await _impl.get_section_content(state, api_client, section_id)
 
     async def get_all_sections() -> str:
         """获取投标项目的所有章节列表及其内容和状态"""
-        return await _run_get_all_sections(state, api_client)
+        return await _impl.get_all_sections(state, api_client)
 
     async def submit_review_feedback(section_id: str, findings_json: str) -> str:
         """提交对投标章节的审核意见（包含问题严重程度、描述和修改建议）
@@ -603,20 +565,20 @@ def build_review_agent_tools(
             section_id: 被审核的章节ID
             findings_json: 审核意见JSON数组，每项包含 severity, description, suggestion, reference
         """
-        return await _run_submit_review_feedback(state, section_id, findings_json)
+        return await _impl.submit_review_feedback(state, section_id, findings_json)
 
     return [
-        Function.from_callable(query_tender_requirements),
-        Function.from_callable(get_section_content),
-        Function.from_callable(get_all_sections),
-        Function.from_callable(submit_review_feedback),
+        query_tender_requirements,
+        get_section_content,
+        get_all_sections,
+        submit_review_feedback,
     ]
 
 
-def build_compliance_checker_tools(
+def _compliance_checker_handlers(
     state: BidProjectState, api_client: BidSmartAPIClient
-) -> list[Function]:
-    """Build agno Function list for the compliance-checker agent."""
+) -> list[Callable[..., Awaitable[str]]]:
+    """Tool handlers for the compliance-checker agent, closed over ``state``."""
 
     async def query_tender_requirements(query: str = "", node_ids: str = "") -> str:
         """根据关键词或章节ID查询招标文档中的具体要求和内容
@@ -625,27 +587,32 @@ def build_compliance_checker_tools(
             query: 查询关键词
             node_ids: 章节ID列表(逗号分隔)
         """
-        return await _run_tender_query(state, api_client, query, node_ids)
+        return await _impl.query_tender_requirements(state, api_client, query, node_ids)
 
     async def get_all_sections() -> str:
         """获取投标项目的所有章节列表及其内容和状态"""
-        return await _run_get_all_sections(state, api_client)
+        return await _impl.get_all_sections(state, api_client)
 
     async def get_compliance_checklist() -> str:
         """生成合规检查清单，列出招标文件中的所有强制性要求及其响应状态"""
-        return await _run_get_compliance_checklist(state)
+        return await _impl.get_compliance_checklist(state)
+
+    async def get_review_context() -> str:
+        """一次获取所有章节列表和合规检查清单（等同于依次调用 get_all_sections 和 get_compliance_checklist）"""
+        return await _impl.get_review_context(state, api_client)
 
     return [
-        Function.from_callable(query_tender_requirements),
-        Function.from_callable(get_all_sections),
-        Function.from_callable(get_compliance_checklist),
+        query_tender_requirements,
+        get_all_sections,
+        get_compliance_checklist,
+        get_review_context,
     ]
 
 
-def build_mermaid_generator_tools(
+def _mermaid_generator_handlers(
     state: BidProjectState, api_client: BidSmartAPIClient
-) -> list[Function]:
-    """Build agno Function list for the mermaid-generator agent."""
+) -> list[Callable[..., Awaitable[str]]]:
+    """Tool handlers for the mermaid-generator agent, closed over ``state``."""
 
     async def get_section_content(section_id: str) -> str:
         """获取指定投标章节的当前内容
@@ -653,7 +620,7 @@ def build_mermaid_generator_tools(
         Args:
             section_id: 章节ID
         """
-        return await _run_get_section_content(state, api_client, section_id)
+        return await _impl.get_section_content(state, api_client, section_id)
 
     async def save_section_content(section_id: str, content: str, status: str = "completed") -> str:
         """保存或更新投标章节的内容（将生成的Mermaid图表插入到章节内容中）
@@ -663,22 +630,22 @@ def build_mermaid_generator_tools(
             content: 包含Mermaid图表的章节内容
             status: 章节状态
         """
-        return await _run_save_section_content(state, api_client, section_id, content, status)
+        return await _impl.save_section_content(state, api_client, section_id, content, status)
 
     return [
-        Function.from_callable(get_section_content),
-        Function.from_callable(save_section_content),
+        get_section_content,
+        save_section_content,
     ]
 
 
-def build_formatting_agent_tools(
+def _formatting_agent_handlers(
     state: BidProjectState, api_client: BidSmartAPIClient
-) -> list[Function]:
-    """Build agno Function list for the formatting-agent."""
+) -> list[Callable[..., Awaitable[str]]]:
+    """Tool handlers for the formatting-agent, closed over ``state``."""
 
     async def get_all_sections() -> str:
         """获取投标项目的所有章节列表及其内容和状态"""
-        return await _run_get_all_sections(state, api_client)
+        return await _impl.get_all_sections(state, api_client)
 
     async def save_section_content(section_id: str, content: str, status: str = "completed") -> str:
         """保存格式化后的章节内容
@@ -688,7 +655,7 @@ def build_formatting_agent_tools(
             content: 格式化后的内容
             status: 章节状态
         """
-        return await _run_save_section_content(state, api_client, section_id, content, status)
+        return await _impl.save_section_content(state, api_client, section_id, content, status)
 
     async def export_document(format: str = "word", include_outline: bool = True) -> str:
         """将投标项目导出为Word或PDF文档
@@ -697,19 +664,19 @@ def build_formatting_agent_tools(
             format: 导出格式 (word/pdf)
             include_outline: 是否包含目录
         """
-        return await _run_export_document(state, api_client, format, include_outline)
+        return await _impl.export_document(state, api_client, format, include_outline)
 
     return [
-        Function.from_callable(get_all_sections),
-        Function.from_callable(save_section_content),
-        Function.from_callable(export_document),
+        get_all_sections,
+        save_section_content,
+        export_document,
     ]
 
 
-def build_tender_analyzer_tools(
+def _tender_analyzer_handlers(
     state: BidProjectState, api_client: BidSmartAPIClient
-) -> list[Function]:
-    """Build agno Function list for the tender-analyzer agent."""
+) -> list[Callable[..., Awaitable[str]]]:
+    """Tool handlers for the tender-analyzer agent, closed over ``state``."""
 
     async def get_tender_tree(document_id: str = "") -> str:
         """获取招标文档的完整树形结构，包含所有章节标题和摘要
@@ -717,7 +684,7 @@ def build_tender_analyzer_tools(
         Args:
             document_id: 文档ID（可选，默认使用当前项目的招标文档）
         """
-        return await _run_get_tree(state, api_client, document_id)
+        return await _impl.get_tender_tree(state, api_client, document_id)
 
     async def query_tender_requirements(query: str = "", node_ids: str = "") -> str:
         """根据关键词或章节ID查询招标文档中的具体要求和内容
@@ -726,7 +693,15 @@ def build_tender_analyzer_tools(
             query: 查询关键词，如'评分标准'、'资格要求'、'技术需求'
             node_ids: 章节ID列表(逗号分隔)，用于精确查询
         """
-        return await _run_tender_query(state, api_client, query, node_ids)
+        return await _impl.query_tender_requirements(state, api_client, query, node_ids)
+
+    async def batch_query_tender_requirements(queries_json: str) -> str:
+        """一次调用并发查询多个招标要求，需要查询多个章节时优先使用
+
+        Args:
+            queries_json: 查询关键词的JSON数组，如'["评分标准", "资格要求", "技术需求"]'
+        """
+        return await _impl.batch_query_tender_requirements(state, api_client, queries_json)
 
     async def save_analysis_report(report_json: str) -> str:
         """保存招标文件分析报告，包含评分标准、资格要求、技术需求等结构化信息
@@ -734,7 +709,7 @@ def build_tender_analyzer_tools(
         Args:
             report_json: 分析报告的JSON字符串，包含项目概况、资格要求、评分标准、技术需求、商务要求等章节
         """
-        return await _run_save_analysis_report(state, report_json)
+        return await _impl.save_analysis_report(state, report_json)
 
     async def validate_scoring_criteria(scoring_json: str) -> str:
         """验证评分标准的分值计算是否正确
@@ -742,7 +717,7 @@ def build_tender_analyzer_tools(
         Args:
             scoring_json: 评分标准的JSON字符串，包含categories数组，每个category有name、score和items
         """
-        return await _run_validate_scoring_criteria(state, scoring_json)
+        return await _impl.validate_scoring_criteria(state, scoring_json)
 
     async def extract_key_data(node_id: str, data_types: str) -> str:
         """从指定章节提取关键数据点（金额、日期、数量等）
@@ -751,12 +726,95 @@ def build_tender_analyzer_tools(
             node_id: 章节ID
             data_types: 要提取的数据类型，如'金额,日期,数量,百分比'
         """
-        return await _run_extract_key_data(state, node_id, data_types)
+        return await _impl.extract_key_data(state, node_id, data_types)
 
     return [
-        Function.from_callable(get_tender_tree),
-        Function.from_callable(query_tender_requirements),
-        Function.from_callable(save_analysis_report),
-        Function.from_callable(validate_scoring_criteria),
-        Function.from_callable(extract_key_data),
+        get_tender_tree,
+        query_tender_requirements,
+        batch_query_tender_requirements,
+        save_analysis_report,
+        validate_scoring_criteria,
+        extract_key_data,
     ]
+
+
+# =============================================================================
+# Tool builders for each agent
+# =============================================================================
+
+
+def build_format_extractor_tools(
+    state: BidProjectState, api_client: BidSmartAPIClient
+) -> BidToolkit:
+    """Build the agno Toolkit for the format-extractor agent."""
+    return _build_toolkit("format-extractor", _format_extractor_handlers, state, api_client)
+
+
+def build_outline_planner_tools(
+    state: BidProjectState, api_client: BidSmartAPIClient
+) -> BidToolkit:
+    """Build the agno Toolkit for the outline-planner agent."""
+    return _build_toolkit("outline-planner", _outline_planner_handlers, state, api_client)
+
+
+def build_document_finder_tools(
+    state: BidProjectState, api_client: BidSmartAPIClient
+) -> BidToolkit:
+    """Build the agno Toolkit for the document-finder agent."""
+    return _build_toolkit("document-finder", _document_finder_handlers, state, api_client)
+
+
+def build_commercial_writer_tools(
+    state: BidProjectState, api_client: BidSmartAPIClient
+) -> BidToolkit:
+    """Build the agno Toolkit for the commercial-bid-writer agent."""
+    return _build_toolkit("commercial-bid-writer", _commercial_writer_handlers, state, api_client)
+
+
+def build_technical_writer_tools(
+    state: BidProjectState, api_client: BidSmartAPIClient
+) -> BidToolkit:
+    """Build the agno Toolkit for the technical-bid-writer agent."""
+    return _build_toolkit("technical-bid-writer", _technical_writer_handlers, state, api_client)
+
+
+def build_pricing_calculator_tools(
+    state: BidProjectState, api_client: BidSmartAPIClient
+) -> BidToolkit:
+    """Build the agno Toolkit for the pricing-calculator agent."""
+    return _build_toolkit("pricing-calculator", _pricing_calculator_handlers, state, api_client)
+
+
+def build_review_agent_tools(
+    state: BidProjectState, api_client: BidSmartAPIClient
+) -> BidToolkit:
+    """Build the agno Toolkit for the review-agent."""
+    return _build_toolkit("review-agent", _review_agent_handlers, state, api_client)
+
+
+def build_compliance_checker_tools(
+    state: BidProjectState, api_client: BidSmartAPIClient
+) -> BidToolkit:
+    """Build the agno Toolkit for the compliance-checker agent."""
+    return _build_toolkit("compliance-checker", _compliance_checker_handlers, state, api_client)
+
+
+def build_mermaid_generator_tools(
+    state: BidProjectState, api_client: BidSmartAPIClient
+) -> BidToolkit:
+    """Build the agno Toolkit for the mermaid-generator agent."""
+    return _build_toolkit("mermaid-generator", _mermaid_generator_handlers, state, api_client)
+
+
+def build_formatting_agent_tools(
+    state: BidProjectState, api_client: BidSmartAPIClient
+) -> BidToolkit:
+    """Build the agno Toolkit for the formatting-agent."""
+    return _build_toolkit("formatting-agent", _formatting_agent_handlers, state, api_client)
+
+
+def build_tender_analyzer_tools(
+    state: BidProjectState, api_client: BidSmartAPIClient
+) -> BidToolkit:
+    """Build the agno Toolkit for the tender-analyzer agent."""
+    return _build_toolkit("tender-analyzer", _tender_analyzer_handlers, state, api_client)
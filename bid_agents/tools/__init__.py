@@ -1,3 +1,5 @@
-from .server import create_bid_tools_server
+"""Agent tool implementations.
 
-__all__ = ["create_bid_tools_server"]
+Tool modules are imported individually (``tool_adapters`` loads them on
+first use); ``server`` aggregates every tool function and its name.
+"""
@@ -6,12 +6,25 @@ Agno-compatible tool functions.
 from __future__ import annotations
 
 import json
+import operator
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 if TYPE_CHECKING:
     from ..state.project_state import BidProjectState
 
+# LLM-produced reports can be large; parse them with orjson when installed
+# (its JSONDecodeError subclasses json.JSONDecodeError)
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Score of a scoring category or item (0 when absent)
+_score_of = operator.methodcaller("get", "score", 0)
+
 
 async def save_analysis_report(
     state: BidProjectState,
@@ -26,16 +39,15 @@ async def save_analysis_report(
         保存结果文本
     """
     try:
-        report = json.loads(report_json)
+        report = _loads(report_json)
     except (json.JSONDecodeError, KeyError) as e:
         return f"分析报告JSON解析失败: {e}"
 
     # Validate required sections
-    required_sections = ["项目概况", "资格要求", "评分标准", "技术需求", "商务要求"]
-    missing = [s for s in required_sections if s not in report]
-    
+    missing = _REQUIRED_SECTIONS.difference(report)
     if missing:
-        return f"分析报告缺少必需章节: {', '.join(missing)}"
+        missing_list = [s for s, _ in _SECTION_FORMATTERS if s in missing]
+        return f"分析报告缺少必需章节: {', '.join(missing_list)}"
 
     # Add metadata
     report["_metadata"] = {
@@ -47,7 +59,12 @@ async def save_analysis_report(
     state.analysis_report = report
 
     # Generate summary
-    summary = _generate_report_summary(report)
+    summary = "\n".join(
+        line
+        for section, formatter in _SECTION_FORMATTERS
+        if report[section]
+        for line in formatter(report[section])
+    )
     
     return (
         f"✅ 招标文件分析报告已保存\n\n"
@@ -69,7 +86,7 @@ async def validate_scoring_criteria(
         验证结果文本
     """
     try:
-        scoring = json.loads(scoring_json)
+        scoring = _loads(scoring_json)
     except json.JSONDecodeError as e:
         return f"评分标准JSON解析失败: {e}"
 
@@ -82,7 +99,7 @@ async def validate_scoring_criteria(
         
         # Calculate sub-items sum
         sub_items = category.get("items", [])
-        sub_total = sum(item.get("score", 0) for item in sub_items)
+        sub_total = sum(map(_score_of, sub_items))
         
         if sub_total != category_score:
             issues.append(
@@ -125,45 +142,45 @@ async def extract_key_data(
     )
 
 
-def _generate_report_summary(report: dict) -> str:
-    """Generate a human-readable summary of the analysis report."""
-    summary_parts = []
-    
-    # Project overview
-    overview = report.get("项目概况", {})
-    if overview:
-        project_name = overview.get("项目名称", "未知")
-        budget = overview.get("预算金额", "未知")
-        summary_parts.append(f"📋 项目: {project_name}")
-        summary_parts.append(f"💰 预算: {budget}")
-    
-    # Qualification requirements
-    qualifications = report.get("资格要求", {})
-    if qualifications:
-        general = len(qualifications.get("一般资格条件", []))
-        specific = len(qualifications.get("特定资格条件", []))
-        negative = len(qualifications.get("负面清单", []))
-        summary_parts.append(f"✅ 资格: {general}条一般 + {specific}条特定 + {negative}条负面")
-    
-    # Scoring criteria
-    scoring = report.get("评分标准", {})
-    if scoring:
-        categories = len(scoring.get("categories", []))
-        total_score = sum(c.get("score", 0) for c in scoring.get("categories", []))
-        summary_parts.append(f"📊 评分: {categories}个类别，总分{total_score}分")
-    
-    # Technical requirements
-    technical = report.get("技术需求", {})
-    if technical:
-        functional = len(technical.get("功能需求", []))
-        params = len(technical.get("技术参数", []))
-        summary_parts.append(f"🔧 技术: {functional}项功能 + {params}项参数")
-    
-    # Business requirements
-    business = report.get("商务要求", {})
-    if business:
-        delivery = business.get("交付期", "未知")
-        warranty = business.get("质保期", "未知")
-        summary_parts.append(f"📅 交付: {delivery} | 质保: {warranty}")
-    
-    return "\n".join(summary_parts)
+def _overview_summary(overview: dict) -> list[str]:
+    return [
+        f"📋 项目: {overview.get('项目名称', '未知')}",
+        f"💰 预算: {overview.get('预算金额', '未知')}",
+    ]
+
+
+def _qualification_summary(qualifications: dict) -> list[str]:
+    general = len(qualifications.get("一般资格条件", []))
+    specific = len(qualifications.get("特定资格条件", []))
+    negative = len(qualifications.get("负面清单", []))
+    return [f"✅ 资格: {general}条一般 + {specific}条特定 + {negative}条负面"]
+
+
+def _scoring_summary(scoring: dict) -> list[str]:
+    categories = scoring.get("categories", [])
+    total_score = sum(map(_score_of, categories))
+    return [f"📊 评分: {len(categories)}个类别，总分{total_score}分"]
+
+
+def _technical_summary(technical: dict) -> list[str]:
+    functional = len(technical.get("功能需求", []))
+    params = len(technical.get("技术参数", []))
+    return [f"🔧 技术: {functional}项功能 + {params}项参数"]
+
+
+def _business_summary(business: dict) -> list[str]:
+    delivery = business.get("交付期", "未知")
+    warranty = business.get("质保期", "未知")
+    return [f"📅 交付: {delivery} | 质保: {warranty}"]
+
+
+# Required report sections, in summary order, with their summary formatters
+_SECTION_FORMATTERS: tuple[tuple[str, Callable[[dict], list[str]]], ...] = (
+    ("项目概况", _overview_summary),
+    ("资格要求", _qualification_summary),
+    ("评分标准", _scoring_summary),
+    ("技术需求", _technical_summary),
+    ("商务要求", _business_summary),
+)
+
+_REQUIRED_SECTIONS = frozenset(section for section, _ in _SECTION_FORMATTERS)
@@ -8,10 +8,22 @@ from __future__ import annotations
 import json
 from typing import TYPE_CHECKING
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from ..state.project_state import BidProjectState
 
 
+def _dumps_pretty(data: dict) -> str:
+    """Pretty-print JSON for tool output, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
 async def get_company_profile(
     state: BidProjectState,
 ) -> str:
@@ -27,7 +39,7 @@ async def get_company_profile(
         )
     # Remove internal instructions field
     profile = {k: v for k, v in state.company_profile.items() if not k.startswith("_")}
-    return json.dumps(profile, ensure_ascii=False, indent=2)
+    return _dumps_pretty(profile)
 
 
 async def get_company_capabilities(
@@ -49,8 +61,9 @@ async def get_company_capabilities(
 
     if domain:
         # Search for matching domain
-        for key, value in state.capabilities.items():
-            if domain.lower() in key.lower():
+        needle = domain.lower()
+        for key_lower, key, value in state.get_capability_index():
+            if needle in key_lower:
                 return (
                     f"领域: {key}\n"
                     f"描述: {value.get('description', '')}\n"
@@ -59,7 +72,7 @@ async def get_company_capabilities(
         return f"未找到领域 \"{domain}\" 的能力信息。可用领域: {', '.join(state.capabilities.keys())}"
 
     # Return all capabilities
-    return json.dumps(state.capabilities, ensure_ascii=False, indent=2)
+    return _dumps_pretty(state.capabilities)
 
 
 async def get_team_profiles(
@@ -83,8 +96,8 @@ async def get_team_profiles(
     if roles_filter:
         role_list = [r.strip().lower() for r in roles_filter.split(",")]
         members = [
-            m for m in members
-            if any(role in m.get("role", "").lower() for role in role_list)
+            m for role_lower, m in state.get_team_role_index()
+            if any(role in role_lower for role in role_list)
         ]
 
     if not members:
@@ -123,21 +136,10 @@ async def search_past_projects(
 
     query_lower = query.lower()
 
-    matches = []
-    for p in state.past_projects:
-        name = p.get("project_name", "").lower()
-        desc = p.get("description", "").lower()
-        domain = p.get("domain", "").lower()
-        techs = " ".join(p.get("technologies", [])).lower()
-        value = p.get("contract_value", 0)
-
-        if value < min_contract_value:
-            continue
-
-        if not query_lower or any(
-            query_lower in text for text in [name, desc, domain, techs]
-        ):
-            matches.append(p)
+    matches = [
+        p for text, value, p in state.get_past_project_index()
+        if value >= min_contract_value and (not query_lower or query_lower in text)
+    ]
 
     if not matches:
         return "未找到匹配的项目业绩"
@@ -109,9 +109,7 @@ async def get_merged_tree(
     if not state.document_set:
         return "错误：当前没有活动的文档集"
     
-    from ..services.document_set_merger import TreeMerger
-    
-    merger = TreeMerger(state.document_set)
+    merger = state.get_tree_merger()
     
     if format == "flat":
         return merger.flatten_to_text()
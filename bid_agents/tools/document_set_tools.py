@@ -52,7 +52,7 @@ async def create_document_set(
     # Add primary document
     try:
         # Fetch primary document tree
-        tree_data = await api_client.get_document_tree(primary_doc_id)
+        tree_data = await state.get_document_tree_cached(api_client, primary_doc_id)
         primary_tree = tree_data.get("tree", tree_data)
         
         primary_item = DocumentSetItem(
@@ -78,7 +78,7 @@ async def create_document_set(
                 doc_type = aux.get("doc_type", "reference")
                 
                 try:
-                    tree_data = await api_client.get_document_tree(doc_id)
+                    tree_data = await state.get_document_tree_cached(api_client, doc_id)
                     aux_tree = tree_data.get("tree", tree_data)
                     
                     aux_item = DocumentSetItem(
@@ -153,7 +153,7 @@ async def add_to_document_set(
     
     # Fetch document tree
     try:
-        tree_data = await api_client.get_document_tree(document_id)
+        tree_data = await state.get_document_tree_cached(api_client, document_id)
         tree = tree_data.get("tree", tree_data)
     except Exception as e:
         return f"获取文档信息失败: {e}"
@@ -292,6 +292,7 @@ async def set_primary_document(
     
     # Re-sort
     state.document_set.items.sort(key=lambda x: (0 if x.role == "primary" else 1, x.order))
+    state.document_set.mark_changed()
     
     return f"✅ 已将 {item.name} 设置为主文档"
 
@@ -320,10 +321,13 @@ async def refresh_document_tree(
         return f"错误：文档 {document_id} 不在当前文档集中"
     
     try:
-        tree_data = await api_client.get_document_tree(document_id)
+        tree_data = await state.get_document_tree_cached(
+            api_client, document_id, refresh=True
+        )
         item.tree = tree_data.get("tree", tree_data)
         item.metadata["pages"] = tree_data.get("total_pages", 0)
         state.document_set.updated_at = int(time.time() * 1000)
+        state.document_set.mark_changed()
         return f"✅ 已刷新文档 {item.name} 的目录树"
     except Exception as e:
         return f"刷新失败: {e}"
@@ -171,7 +171,7 @@ async def get_document_tree(
         文档树结构文本
     """
     try:
-        tree_data = await api_client.get_document_tree(document_id)
+        tree_data = await state.get_document_tree_cached(api_client, document_id)
         from ..models.types import Node
 
         tree = tree_data.get("tree", tree_data)
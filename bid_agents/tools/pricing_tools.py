@@ -6,6 +6,7 @@ Agno-compatible tool functions.
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -88,12 +89,29 @@ async def calculate_totals(
     return "\n".join(lines)
 
 
+_DIGITS = "零壹贰叁肆伍陆柒捌玖"
+_GROUP_UNITS = ("仟", "佰", "拾", "")
+_BIG_UNITS = ("", "万", "亿")
+
+
+@lru_cache(maxsize=None)
+def _group_to_chinese(group: int) -> str:
+    """Render a four-digit group (zero-padded) without its big unit.
+
+    Runs of zeros collapse to one "零" and trailing zeros are dropped.
+    Cached per group value (at most 10000 entries).
+    """
+    parts: list[str] = []
+    for ch, unit in zip(f"{group:04d}", _GROUP_UNITS):
+        if ch != "0":
+            parts.append(_DIGITS[int(ch)] + unit)
+        elif not parts or parts[-1] != "零":
+            parts.append("零")
+    return "".join(parts).rstrip("零")
+
+
 def _num_to_chinese(num: float) -> str:
     """Convert a number to Chinese uppercase currency representation."""
-    digits = "零壹贰叁肆伍陆柒捌玖"
-    units = ["", "拾", "佰", "仟"]
-    big_units = ["", "万", "亿"]
-
     # Simplified implementation for bid documents
     # Use round() to avoid floating-point precision issues
     total_fen = round(num * 100)
@@ -102,35 +120,25 @@ def _num_to_chinese(num: float) -> str:
     fen = total_fen % 10
 
     if yuan == 0:
-        result = "零元"
+        parts = ["零元"]
     else:
-        result = ""
+        # Split into four-digit groups from the right; the leading group
+        # has no padding, so it never starts with "零"
         yuan_str = str(yuan)
-        length = len(yuan_str)
-
-        for i, ch in enumerate(yuan_str):
-            d = int(ch)
-            pos = length - 1 - i
-            group_pos = pos % 4
-            big_pos = pos // 4
-
-            if d != 0:
-                result += digits[d] + units[group_pos]
-            else:
-                if result and not result.endswith("零"):
-                    result += "零"
-
-            if group_pos == 0 and big_pos > 0:
-                result = result.rstrip("零")
-                result += big_units[big_pos]
-
-        result = result.rstrip("零") + "元"
+        head = len(yuan_str) % 4 or 4
+        groups = [yuan_str[:head]]
+        groups.extend(yuan_str[i:i + 4] for i in range(head, len(yuan_str), 4))
+        last = len(groups) - 1
+        parts = [_group_to_chinese(int(groups[0])).removeprefix("零") + _BIG_UNITS[last]]
+        for i, group in enumerate(groups[1:], 1):
+            parts.append(_group_to_chinese(int(group)) + _BIG_UNITS[last - i])
+        parts.append("元")
 
     if jiao > 0:
-        result += digits[jiao] + "角"
+        parts.append(_DIGITS[jiao] + "角")
     if fen > 0:
-        result += digits[fen] + "分"
+        parts.append(_DIGITS[fen] + "分")
     elif jiao == 0:
-        result += "整"
+        parts.append("整")
 
-    return result
+    return "".join(parts)
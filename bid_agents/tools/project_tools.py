@@ -50,6 +50,7 @@ async def save_outline(
         }
         tender_sections.append(tender_sec)
         state.sections[tender_sec["id"]] = tender_sec
+    state.mark_sections_changed()
 
     state.outline = sections
 
@@ -99,11 +100,13 @@ async def save_section_content(
 
     # Update local state
     state.sections[section_id]["content"] = content
-    state.sections[section_id]["status"] = status
+    state.set_section_status(section_id, status)
     state.sections[section_id]["word_count"] = len(content)
 
-    # Sync to backend
-    if state.project_id:
+    # Sync to backend (deferred to a single bulk save in bulk mode)
+    if state.defer_auto_save:
+        state.pending_auto_saves[section_id] = content
+    elif state.project_id:
         try:
             await api_client.auto_save_section(state.project_id, section_id, content)
         except Exception as e:
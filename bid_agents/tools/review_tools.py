@@ -8,7 +8,10 @@ from __future__ import annotations
 import json
 from typing import TYPE_CHECKING
 
+from .project_tools import get_all_sections
+
 if TYPE_CHECKING:
+    from ..api.client import BidSmartAPIClient
     from ..state.project_state import BidProjectState
 
 
@@ -73,7 +76,7 @@ async def get_compliance_checklist(
     # Build checklist from tender tree mandatory requirements
     from ..models.types import Node
 
-    tree = Node.from_dict(state.tender_tree)
+    tree = state.get_tender_node()
     checklist_items = []
 
     def extract_requirements(node: Node, depth: int = 0) -> None:
@@ -123,3 +126,19 @@ async def get_compliance_checklist(
         lines.append(f"| {status} | {item['requirement_id']} | {req_text} | {section} | {item['notes']} |")
 
     return "\n".join(lines)
+
+
+async def get_review_context(
+    state: BidProjectState,
+    api_client: BidSmartAPIClient,
+) -> str:
+    """一次获取所有章节列表和合规检查清单.
+    
+    Returns:
+        章节列表与合规检查清单文本
+    """
+    # Same text as get_all_sections + get_compliance_checklist, in one
+    # tool call instead of two model round trips
+    sections = await get_all_sections(state, api_client)
+    checklist = await get_compliance_checklist(state)
+    return f"## 章节列表\n\n{sections}\n\n## 合规检查清单\n\n{checklist}"
@@ -9,13 +9,13 @@ from __future__ import annotations
 # Import tool functions directly - these are now plain async functions
 # that can be used with agno's Function.from_callable()
 
-from .tender_tools import query_tender_requirements, get_tender_tree
+from .tender_tools import query_tender_requirements, batch_query_tender_requirements, get_tender_tree
 from .project_tools import save_outline, save_section_content, get_section_content, get_all_sections
 from .document_tools import search_documents, get_document_metadata, list_documents_by_category, get_document_tree as get_doc_tree
 from .company_tools import get_company_profile, get_company_capabilities, get_team_profiles, search_past_projects
 from .pricing_tools import get_pricing_templates, calculate_totals
 from .formatting_tools import format_table, export_document
-from .review_tools import submit_review_feedback, get_compliance_checklist
+from .review_tools import submit_review_feedback, get_compliance_checklist, get_review_context
 from .format_tools import save_format_spec
 from .analysis_tools import save_analysis_report, validate_scoring_criteria, extract_key_data
 from .document_set_tools import (
@@ -32,6 +32,7 @@ from .document_set_tools import (
 __all__ = [
     # Tender tools
     "query_tender_requirements",
+    "batch_query_tender_requirements",
     "get_tender_tree",
     # Project tools
     "save_outline",
@@ -57,6 +58,7 @@ __all__ = [
     # Review tools
     "submit_review_feedback",
     "get_compliance_checklist",
+    "get_review_context",
     # Format extraction tools
     "save_format_spec",
     # Analysis tools
@@ -77,6 +79,7 @@ __all__ = [
 ALL_TOOL_NAMES = [
     # Tender tools
     "query_tender_requirements",
+    "batch_query_tender_requirements",
     "get_tender_tree",
     # Project tools
     "save_outline",
@@ -102,6 +105,7 @@ ALL_TOOL_NAMES = [
     # Review tools
     "submit_review_feedback",
     "get_compliance_checklist",
+    "get_review_context",
     # Format extraction tools
     "save_format_spec",
     # Analysis tools
@@ -5,9 +5,16 @@ Agno-compatible tool functions.
 
 from __future__ import annotations
 
+import asyncio
 import json
+import time
 from typing import TYPE_CHECKING
 
+from ..config import TENDER_QUERY_CACHE_TTL
+
+# Upper bound on concurrent backend chat requests from one batch query
+_BATCH_QUERY_CONCURRENCY = 5
+
 if TYPE_CHECKING:
     from ..api.client import BidSmartAPIClient
     from ..state.project_state import BidProjectState
@@ -41,13 +48,10 @@ async def query_tender_requirements(
 
     # If specific node IDs requested, extract their content directly
     if node_ids:
-        from ..models.types import Node
-
-        tree_node = Node.from_dict(state.tender_tree)
         results = []
         for nid in node_ids.split(","):
             nid = nid.strip()
-            node = tree_node.find_node(nid)
+            node = state.find_tender_node(nid)
             if node:
                 results.append(f"[{node.title}]\n{node.summary or '无摘要'}")
         if results:
@@ -55,11 +59,7 @@ async def query_tender_requirements(
 
     # Use backend chat API for semantic search
     try:
-        response = await api_client.chat_with_document(
-            question=query,
-            tree=state.tender_tree,
-            document_id=state.tender_document_id,
-        )
+        response = await _chat_with_tender(state, api_client, query)
         answer = response.get("answer", "未找到相关内容")
         sources = response.get("sources", [])
         source_info = ""
@@ -71,6 +71,37 @@ async def query_tender_requirements(
         return f"查询招标要求失败: {e}"
 
 
+async def batch_query_tender_requirements(
+    state: BidProjectState,
+    api_client: BidSmartAPIClient,
+    queries_json: str,
+) -> str:
+    """一次查询招标文档中的多个要求，各查询并发执行.
+    
+    Args:
+        queries_json: 查询关键词的JSON数组，如'["评分标准", "资格要求", "技术需求"]'
+    
+    Returns:
+        按查询分段的结果文本
+    """
+    try:
+        queries = json.loads(queries_json)
+    except json.JSONDecodeError as e:
+        return f"错误：queries_json 不是有效的JSON: {e}"
+    if not isinstance(queries, list) or not queries:
+        return "错误：queries_json 必须是非空的JSON数组"
+
+    semaphore = asyncio.Semaphore(_BATCH_QUERY_CONCURRENCY)
+
+    async def _query(query: str) -> str:
+        async with semaphore:
+            return await query_tender_requirements(state, api_client, query=query)
+
+    queries = [str(q) for q in queries]
+    answers = await asyncio.gather(*(_query(q) for q in queries))
+    return "\n\n".join(f"## {q}\n{a}" for q, a in zip(queries, answers))
+
+
 async def get_tender_tree(
     state: BidProjectState,
     api_client: BidSmartAPIClient,
@@ -91,20 +122,50 @@ async def get_tender_tree(
 
     # Return cached tree if available
     if state.tender_tree and doc_id == state.tender_document_id:
-        from ..models.types import Node
-
-        tree_node = Node.from_dict(state.tender_tree)
-        return tree_node.flatten()
+        return state.get_tender_node().flatten()
 
     try:
-        tree_data = await api_client.get_document_tree(doc_id)
+        tree_data = await state.get_document_tree_cached(api_client, doc_id)
         tree = tree_data.get("tree", tree_data)
         state.tender_tree = tree
         state.tender_document_id = doc_id
 
-        from ..models.types import Node
-
-        tree_node = Node.from_dict(tree)
-        return tree_node.flatten()
+        return state.get_tender_node().flatten()
     except Exception as e:
         return f"获取文档树失败: {e}"
+
+
+async def _chat_with_tender(
+    state: BidProjectState,
+    api_client: BidSmartAPIClient,
+    query: str,
+) -> dict:
+    """Ask the backend chat API about the tender, sharing identical queries.
+
+    Writers running in parallel often ask the same question (e.g. '评分标准').
+    The first caller starts the request; callers within
+    ``TENDER_QUERY_CACHE_TTL`` seconds await the same future instead of
+    issuing another one.  Failed requests are not cached.
+    """
+    key = (state.tender_document_id or "", query)
+    now = time.monotonic()
+    cached = state.tender_query_cache.get(key)
+    if cached and cached[0] > now:
+        future = cached[1]
+    else:
+        future = asyncio.ensure_future(
+            api_client.chat_with_document(
+                question=query,
+                tree=state.tender_tree,
+                document_id=state.tender_document_id,
+            )
+        )
+        state.tender_query_cache[key] = (now + TENDER_QUERY_CACHE_TTL, future)
+
+    try:
+        # shield: one caller being cancelled must not cancel the shared request
+        return await asyncio.shield(future)
+    except Exception:
+        if state.tender_query_cache.get(key, (0, None))[1] is future:
+            del state.tender_query_cache[key]
+        raise